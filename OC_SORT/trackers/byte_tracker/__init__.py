@@ -1,2 +1,3 @@
 from .byte_tracker import BYTETracker, STrack
+from .soa_tracker import SoABYTETracker
 from .basetrack import BaseTrack, TrackState 
\ No newline at end of file
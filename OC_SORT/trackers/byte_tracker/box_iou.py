@@ -0,0 +1,100 @@
+"""
+Box IoU kernels for ByteTrack association.
+
+Drop-in replacement for `cython_bbox.bbox_overlaps`: same inclusive-pixel
+(+1) area convention, same (N, K) float64 output. A vectorized NumPy kernel
+is always available; a Numba-JIT kernel is used when numba is installed
+(faster for the small matrices of a single frame, no compile step at
+install time).
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+IOU_BACKENDS = ('numpy', 'numba')
+
+
+def bbox_overlaps_numpy(boxes, query_boxes):
+    """
+    Parameters
+    ----------
+    boxes: (N, 4) ndarray of float64 tlbr
+    query_boxes: (K, 4) ndarray of float64 tlbr
+
+    Returns
+    -------
+    overlaps: (N, K) ndarray of IoU between boxes and query_boxes
+    """
+    boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+    query_boxes = np.asarray(query_boxes, dtype=np.float64).reshape(-1, 4)
+    box_area = (boxes[:, 2] - boxes[:, 0] + 1) * (boxes[:, 3] - boxes[:, 1] + 1)
+    query_area = (query_boxes[:, 2] - query_boxes[:, 0] + 1) * (query_boxes[:, 3] - query_boxes[:, 1] + 1)
+
+    iw = np.minimum(boxes[:, None, 2], query_boxes[None, :, 2]) - \
+        np.maximum(boxes[:, None, 0], query_boxes[None, :, 0]) + 1
+    ih = np.minimum(boxes[:, None, 3], query_boxes[None, :, 3]) - \
+        np.maximum(boxes[:, None, 1], query_boxes[None, :, 1]) + 1
+    overlap = (iw > 0) & (ih > 0)
+    inter = np.where(overlap, iw * ih, 0.0)
+    union = box_area[:, None] + query_area[None, :] - inter
+    return np.divide(inter, union, out=np.zeros_like(inter), where=overlap)
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=False)
+    def _bbox_overlaps_numba(boxes, query_boxes):
+        n = boxes.shape[0]
+        k = query_boxes.shape[0]
+        overlaps = np.zeros((n, k), dtype=np.float64)
+        for j in range(k):
+            query_area = (query_boxes[j, 2] - query_boxes[j, 0] + 1) * \
+                         (query_boxes[j, 3] - query_boxes[j, 1] + 1)
+            for i in range(n):
+                iw = min(boxes[i, 2], query_boxes[j, 2]) - max(boxes[i, 0], query_boxes[j, 0]) + 1
+                if iw > 0:
+                    ih = min(boxes[i, 3], query_boxes[j, 3]) - max(boxes[i, 1], query_boxes[j, 1]) + 1
+                    if ih > 0:
+                        union = (boxes[i, 2] - boxes[i, 0] + 1) * (boxes[i, 3] - boxes[i, 1] + 1) + \
+                                query_area - iw * ih
+                        overlaps[i, j] = iw * ih / union
+        return overlaps
+
+    def bbox_overlaps_numba(boxes, query_boxes):
+        return _bbox_overlaps_numba(np.ascontiguousarray(boxes, dtype=np.float64).reshape(-1, 4),
+                                    np.ascontiguousarray(query_boxes, dtype=np.float64).reshape(-1, 4))
+else:
+    bbox_overlaps_numba = None
+
+
+_backend = 'numba' if NUMBA_AVAILABLE else 'numpy'
+
+
+def set_iou_backend(name):
+    """Select the IoU kernel: 'numpy', 'numba' or 'auto'. Returns the backend in use."""
+    global _backend
+    name = (name or 'auto').lower()
+    if name == 'auto' or (name == 'numba' and not NUMBA_AVAILABLE):
+        name = 'numba' if NUMBA_AVAILABLE else 'numpy'
+    if name not in IOU_BACKENDS:
+        raise ValueError('invalid IoU backend: {}'.format(name))
+    if name == 'numba':
+        # JIT compile (or load from cache) now instead of on the first tracked frame
+        bbox_overlaps_numba(np.zeros((1, 4)), np.zeros((1, 4)))
+    _backend = name
+    return _backend
+
+
+def get_iou_backend():
+    return _backend
+
+
+def bbox_overlaps(boxes, query_boxes):
+    """IoU matrix with the selected backend (see set_iou_backend)"""
+    if _backend == 'numba':
+        return bbox_overlaps_numba(boxes, query_boxes)
+    return bbox_overlaps_numpy(boxes, query_boxes)
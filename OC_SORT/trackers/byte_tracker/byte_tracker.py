@@ -6,7 +6,7 @@ import copy
 import torch
 import torch.nn.functional as F
 
-from .kalman_filter import KalmanFilter
+from .kalman_filter import KalmanFilter, mean_to_tlbr
 from . import matching
 from .basetrack import BaseTrack, TrackState
 
@@ -32,15 +32,39 @@ class STrack(BaseTrack):
     @staticmethod
     def multi_predict(stracks):
         if len(stracks) > 0:
-            multi_mean = np.asarray([st.mean.copy() for st in stracks])
+            # np.asarray already copies the rows - predicted in place
+            multi_mean = np.asarray([st.mean for st in stracks])
             multi_covariance = np.asarray([st.covariance for st in stracks])
-            for i, st in enumerate(stracks):
-                if st.state != TrackState.Tracked:
-                    multi_mean[i][7] = 0
-            multi_mean, multi_covariance = STrack.shared_kalman.multi_predict(multi_mean, multi_covariance)
-            for i, (mean, cov) in enumerate(zip(multi_mean, multi_covariance)):
-                stracks[i].mean = mean
-                stracks[i].covariance = cov
+            multi_mean[[st.state != TrackState.Tracked for st in stracks], 7] = 0
+            STrack.shared_kalman.multi_predict(multi_mean, multi_covariance, multi_mean, multi_covariance)
+            for st, mean, cov in zip(stracks, multi_mean, multi_covariance):
+                st.mean = mean
+                st.covariance = cov
+
+    @staticmethod
+    def multi_update(stracks, detections, frame_id):
+        """Batched update / re_activate of matched tracks with one Kalman correction call"""
+        if len(stracks) == 0:
+            return
+        multi_mean = np.asarray([st.mean for st in stracks])
+        multi_covariance = np.asarray([st.covariance for st in stracks])
+        measurements = np.asarray([STrack.tlwh_to_xyah(det.tlwh) for det in detections])
+        multi_mean, multi_covariance = STrack.shared_kalman.multi_update(multi_mean, multi_covariance, measurements)
+        for st, det, mean, cov in zip(stracks, detections, multi_mean, multi_covariance):
+            st.mean, st.covariance = mean, cov
+            # update: tracklet uzar, re_activate (kayıptan dönen): sıfırlanır
+            st.tracklet_len = st.tracklet_len + 1 if st.state == TrackState.Tracked else 0
+            st.state = TrackState.Tracked
+            st.is_activated = True
+            st.frame_id = frame_id
+            st.score = det.score
+
+    @staticmethod
+    def multi_tlbr(stracks):
+        """(N, 4) tlbr array of Kalman-tracked stracks, computed in one pass from the stacked means"""
+        if len(stracks) == 0:
+            return np.empty((0, 4), dtype=np.float64)
+        return mean_to_tlbr(np.asarray([st.mean for st in stracks]))
 
     def activate(self, kalman_filter, frame_id):
         """Start a new tracklet"""
@@ -206,19 +230,24 @@ class BYTETracker(object):
         strack_pool = joint_stracks(tracked_stracks, self.lost_stracks)
         # Predict the current location with KF
         STrack.multi_predict(strack_pool)
-        dists = matching.iou_distance(strack_pool, detections)
+        # Track boxes are computed once per frame and reused by both associations
+        pool_tlbr = STrack.multi_tlbr(strack_pool)
+        dists = matching.iou_distance(pool_tlbr, dets)
+        if getattr(self.args, 'motion_gating', False):
+            dists = matching.gate_cost_matrix(self.kalman_filter, dists, strack_pool, detections)
         if not self.args.mot20:
             dists = matching.fuse_score(dists, detections)
         matches, u_track, u_detection = matching.linear_assignment(dists, thresh=self.args.match_thresh)
 
+        # Matched tracks are corrected in one batch after all associations
+        matched_tracks, matched_dets = [], []
         for itracked, idet in matches:
             track = strack_pool[itracked]
-            det = detections[idet]
+            matched_tracks.append(track)
+            matched_dets.append(detections[idet])
             if track.state == TrackState.Tracked:
-                track.update(detections[idet], self.frame_id)
                 activated_starcks.append(track)
             else:
-                track.re_activate(det, self.frame_id, new_id=False)
                 refind_stracks.append(track)
 
         ''' Step 3: Second association, with low score detection boxes'''
@@ -229,17 +258,19 @@ class BYTETracker(object):
                           (tlbr, s) in zip(dets_second, scores_second)]
         else:
             detections_second = []
-        r_tracked_stracks = [strack_pool[i] for i in u_track if strack_pool[i].state == TrackState.Tracked]
-        dists = matching.iou_distance(r_tracked_stracks, detections_second)
+        r_tracked_idx = [i for i in u_track if strack_pool[i].state == TrackState.Tracked]
+        r_tracked_stracks = [strack_pool[i] for i in r_tracked_idx]
+        dists = matching.iou_distance(pool_tlbr[r_tracked_idx], dets_second)
+        if getattr(self.args, 'motion_gating', False):
+            dists = matching.gate_cost_matrix(self.kalman_filter, dists, r_tracked_stracks, detections_second)
         matches, u_track, u_detection_second = matching.linear_assignment(dists, thresh=0.5)
         for itracked, idet in matches:
             track = r_tracked_stracks[itracked]
-            det = detections_second[idet]
+            matched_tracks.append(track)
+            matched_dets.append(detections_second[idet])
             if track.state == TrackState.Tracked:
-                track.update(det, self.frame_id)
                 activated_starcks.append(track)
             else:
-                track.re_activate(det, self.frame_id, new_id=False)
                 refind_stracks.append(track)
 
         for it in u_track:
@@ -250,18 +281,21 @@ class BYTETracker(object):
 
         '''Deal with unconfirmed tracks, usually tracks with only one beginning frame'''
         detections = [detections[i] for i in u_detection]
-        dists = matching.iou_distance(unconfirmed, detections)
+        dists = matching.iou_distance(STrack.multi_tlbr(unconfirmed), dets[np.asarray(u_detection, dtype=int)])
         if not self.args.mot20:
             dists = matching.fuse_score(dists, detections)
         matches, u_unconfirmed, u_detection = matching.linear_assignment(dists, thresh=0.7)
         for itracked, idet in matches:
-            unconfirmed[itracked].update(detections[idet], self.frame_id)
+            matched_tracks.append(unconfirmed[itracked])
+            matched_dets.append(detections[idet])
             activated_starcks.append(unconfirmed[itracked])
         for it in u_unconfirmed:
             track = unconfirmed[it]
             track.mark_removed()
             removed_stracks.append(track)
 
+        STrack.multi_update(matched_tracks, matched_dets, self.frame_id)
+
         """ Step 4: Init new stracks"""
         for inew in u_detection:
             track = detections[inew]
@@ -317,7 +351,7 @@ def sub_stracks(tlista, tlistb):
 
 
 def remove_duplicate_stracks(stracksa, stracksb):
-    pdist = matching.iou_distance(stracksa, stracksb)
+    pdist = matching.iou_distance(STrack.multi_tlbr(stracksa), STrack.multi_tlbr(stracksb))
     pairs = np.where(pdist < 0.15)
     dupa, dupb = list(), list()
     for p, q in zip(*pairs):
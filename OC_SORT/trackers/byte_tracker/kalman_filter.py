@@ -152,7 +152,7 @@ class KalmanFilter(object):
             self._update_mat, covariance, self._update_mat.T))
         return mean, covariance + innovation_cov
 
-    def multi_predict(self, mean, covariance):
+    def multi_predict(self, mean, covariance, out_mean=None, out_covariance=None):
         """Run Kalman filter prediction step (Vectorized version).
         Parameters
         ----------
@@ -162,32 +162,27 @@ class KalmanFilter(object):
         covariance : ndarray
             The Nx8x8 dimensional covariance matrics of the object states at the
             previous time step.
+        out_mean, out_covariance : Optional[ndarray]
+            Preallocated Nx8 / Nx8x8 output buffers (may be the inputs themselves
+            for an in-place prediction).
         Returns
         -------
         (ndarray, ndarray)
             Returns the mean vector and covariance matrix of the predicted
             state. Unobserved velocities are initialized to 0 mean.
         """
-        std_pos = [
-            self._std_weight_position * mean[:, 3],
-            self._std_weight_position * mean[:, 3],
-            1e-2 * np.ones_like(mean[:, 3]),
-            self._std_weight_position * mean[:, 3]]
-        std_vel = [
-            self._std_weight_velocity * mean[:, 3],
-            self._std_weight_velocity * mean[:, 3],
-            1e-5 * np.ones_like(mean[:, 3]),
-            self._std_weight_velocity * mean[:, 3]]
-        sqr = np.square(np.r_[std_pos, std_vel]).T
-
-        motion_cov = []
-        for i in range(len(mean)):
-            motion_cov.append(np.diag(sqr[i]))
-        motion_cov = np.asarray(motion_cov)
-
-        mean = np.dot(mean, self._motion_mat.T)
-        left = np.dot(self._motion_mat, covariance).transpose((1, 0, 2))
-        covariance = np.dot(left, self._motion_mat.T) + motion_cov
+        height = mean[:, 3:4]
+        std = np.empty_like(mean)
+        std[:, [0, 1, 3]] = self._std_weight_position * height
+        std[:, 2] = 1e-2
+        std[:, [4, 5, 7]] = self._std_weight_velocity * height
+        std[:, 6] = 1e-5
+        motion_var = np.square(std)
+
+        mean = np.matmul(mean, self._motion_mat.T, out=out_mean)
+        covariance = np.matmul(np.matmul(self._motion_mat, covariance), self._motion_mat.T, out=out_covariance)
+        diag = np.arange(8)
+        covariance[:, diag, diag] += motion_var
 
         return mean, covariance
 
@@ -225,6 +220,59 @@ class KalmanFilter(object):
             kalman_gain, projected_cov, kalman_gain.T))
         return new_mean, new_covariance
 
+    def multi_project(self, mean, covariance):
+        """Project state distributions to measurement space (Vectorized version).
+
+        Parameters
+        ----------
+        mean : ndarray
+            The Nx8 dimensional mean matrix.
+        covariance : ndarray
+            The Nx8x8 dimensional covariance matrices.
+
+        Returns
+        -------
+        (ndarray, ndarray)
+            Returns the Nx4 projected means and Nx4x4 projected covariances.
+
+        """
+        var = np.square(self._std_weight_position * mean[:, 3])
+        projected_cov = covariance[:, :4, :4].copy()
+        projected_cov[:, 0, 0] += var
+        projected_cov[:, 1, 1] += var
+        projected_cov[:, 2, 2] += 1e-1 ** 2
+        projected_cov[:, 3, 3] += var
+        return mean[:, :4], projected_cov
+
+    def multi_update(self, mean, covariance, measurement):
+        """Run Kalman filter correction step (Vectorized version).
+
+        Parameters
+        ----------
+        mean : ndarray
+            The Nx8 dimensional predicted mean matrix.
+        covariance : ndarray
+            The Nx8x8 dimensional covariance matrices.
+        measurement : ndarray
+            The Nx4 dimensional measurement matrix (x, y, a, h).
+
+        Returns
+        -------
+        (ndarray, ndarray)
+            Returns the measurement-corrected state distributions.
+
+        """
+        projected_mean, projected_cov = self.multi_project(mean, covariance)
+
+        # K = P H^T S^-1, with the 4x4 inverse in closed form
+        kalman_gain = np.matmul(covariance[:, :, :4], inv4(projected_cov))
+        innovation = measurement - projected_mean
+
+        new_mean = mean + np.einsum('nij,nj->ni', kalman_gain, innovation)
+        new_covariance = covariance - np.matmul(
+            np.matmul(kalman_gain, projected_cov), kalman_gain.transpose(0, 2, 1))
+        return new_mean, new_covariance
+
     def gating_distance(self, mean, covariance, measurements,
                         only_position=False, metric='maha'):
         """Compute gating distance between state distribution and measurements.
@@ -267,4 +315,118 @@ class KalmanFilter(object):
             squared_maha = np.sum(z * z, axis=0)
             return squared_maha
         else:
-            raise ValueError('invalid distance metric')
\ No newline at end of file
+            raise ValueError('invalid distance metric')
+
+    def multi_gating_distance(self, mean, covariance, measurements,
+                              only_position=False, metric='maha'):
+        """Compute gating distances between N state distributions and M measurements.
+
+        Batched version of `gating_distance`: all tracks are projected at once and
+        the squared Mahalanobis distances come from closed-form inverses of the
+        projected covariances.
+        Parameters
+        ----------
+        mean : ndarray
+            The Nx8 dimensional mean matrix.
+        covariance : ndarray
+            The Nx8x8 dimensional covariance matrices.
+        measurements : ndarray
+            An Mx4 dimensional matrix of measurements (x, y, a, h).
+        only_position : Optional[bool]
+            If True, distance computation is done with respect to the bounding
+            box center position only.
+        Returns
+        -------
+        ndarray
+            Returns an NxM matrix, where element (i, j) is the squared distance
+            between state i and `measurements[j]`.
+        """
+        mean, covariance = self.multi_project(mean, covariance)
+        measurements = np.asarray(measurements, dtype=np.float64).reshape(-1, 4)
+        if only_position:
+            mean, covariance = mean[:, :2], covariance[:, :2, :2]
+            measurements = measurements[:, :2]
+
+        d = measurements[None, :, :] - mean[:, None, :]
+        if metric == 'gaussian':
+            return np.einsum('nmi,nmi->nm', d, d)
+        elif metric == 'maha':
+            inv = inv4(covariance) if covariance.shape[-1] == 4 else inv2(covariance)
+            return np.einsum('nmj,nmj->nm', np.matmul(d, inv), d)
+        else:
+            raise ValueError('invalid distance metric')
+
+
+def inv4(m):
+    """Closed-form inverse of a stack of 4x4 matrices (Nx4x4), via 2x2 sub-determinants."""
+    a = m.reshape(-1, 16).T
+    s0 = a[0] * a[5] - a[4] * a[1]
+    s1 = a[0] * a[6] - a[4] * a[2]
+    s2 = a[0] * a[7] - a[4] * a[3]
+    s3 = a[1] * a[6] - a[5] * a[2]
+    s4 = a[1] * a[7] - a[5] * a[3]
+    s5 = a[2] * a[7] - a[6] * a[3]
+    c5 = a[10] * a[15] - a[14] * a[11]
+    c4 = a[9] * a[15] - a[13] * a[11]
+    c3 = a[9] * a[14] - a[13] * a[10]
+    c2 = a[8] * a[15] - a[12] * a[11]
+    c1 = a[8] * a[14] - a[12] * a[10]
+    c0 = a[8] * a[13] - a[12] * a[9]
+    inv_det = 1.0 / (s0 * c5 - s1 * c4 + s2 * c3 + s3 * c2 - s4 * c1 + s5 * c0)
+
+    inv = np.empty_like(a)
+    inv[0] = (a[5] * c5 - a[6] * c4 + a[7] * c3) * inv_det
+    inv[1] = (-a[1] * c5 + a[2] * c4 - a[3] * c3) * inv_det
+    inv[2] = (a[13] * s5 - a[14] * s4 + a[15] * s3) * inv_det
+    inv[3] = (-a[9] * s5 + a[10] * s4 - a[11] * s3) * inv_det
+    inv[4] = (-a[4] * c5 + a[6] * c2 - a[7] * c1) * inv_det
+    inv[5] = (a[0] * c5 - a[2] * c2 + a[3] * c1) * inv_det
+    inv[6] = (-a[12] * s5 + a[14] * s2 - a[15] * s1) * inv_det
+    inv[7] = (a[8] * s5 - a[10] * s2 + a[11] * s1) * inv_det
+    inv[8] = (a[4] * c4 - a[5] * c2 + a[7] * c0) * inv_det
+    inv[9] = (-a[0] * c4 + a[1] * c2 - a[3] * c0) * inv_det
+    inv[10] = (a[12] * s4 - a[13] * s2 + a[15] * s0) * inv_det
+    inv[11] = (-a[8] * s4 + a[9] * s2 - a[11] * s0) * inv_det
+    inv[12] = (-a[4] * c3 + a[5] * c1 - a[6] * c0) * inv_det
+    inv[13] = (a[0] * c3 - a[1] * c1 + a[2] * c0) * inv_det
+    inv[14] = (-a[12] * s3 + a[13] * s1 - a[14] * s0) * inv_det
+    inv[15] = (a[8] * s3 - a[9] * s1 + a[10] * s0) * inv_det
+    return inv.T.reshape(m.shape)
+
+
+def inv2(m):
+    """Closed-form inverse of a stack of 2x2 matrices (Nx2x2)."""
+    a, b, c, d = m[:, 0, 0], m[:, 0, 1], m[:, 1, 0], m[:, 1, 1]
+    inv_det = 1.0 / (a * d - b * c)
+    inv = np.empty_like(m)
+    inv[:, 0, 0] = d * inv_det
+    inv[:, 0, 1] = -b * inv_det
+    inv[:, 1, 0] = -c * inv_det
+    inv[:, 1, 1] = a * inv_det
+    return inv
+
+
+def mean_to_tlbr(mean):
+    """(N, 8) Kalman means -> (N, 4) tlbr boxes"""
+    mean = np.asarray(mean).reshape(-1, 8)
+    w = mean[:, 2] * mean[:, 3]
+    h = mean[:, 3]
+    ret = np.empty((len(mean), 4), dtype=np.float64)
+    ret[:, 0] = mean[:, 0] - w / 2
+    ret[:, 1] = mean[:, 1] - h / 2
+    ret[:, 2] = ret[:, 0] + w
+    ret[:, 3] = ret[:, 1] + h
+    return ret
+
+
+def tlbr_to_xyah(tlbr):
+    """(N, 4) tlbr boxes -> (N, 4) (center x, center y, aspect ratio, height)"""
+    tlbr = np.asarray(tlbr, dtype=np.float64).reshape(-1, 4)
+    ret = np.empty_like(tlbr)
+    w = tlbr[:, 2] - tlbr[:, 0]
+    h = tlbr[:, 3] - tlbr[:, 1]
+    ret[:, 0] = tlbr[:, 0] + w / 2
+    ret[:, 1] = tlbr[:, 1] + h / 2
+    ret[:, 2] = w / h
+    ret[:, 3] = h
+    return ret
@@ -0,0 +1,329 @@
+import numpy as np
+
+from .kalman_filter import KalmanFilter, mean_to_tlbr, tlbr_to_xyah
+from . import kalman_filter
+from . import matching
+from .basetrack import BaseTrack, TrackState
+
+
+class TrackStore(object):
+    """
+    Struct-of-arrays storage for all live tracks.
+
+    Rows [0, size) are live (Tracked or Lost) tracks in insertion order; removed
+    tracks are compacted away at the end of every tracker update. Arrays grow
+    geometrically, so steady state does not allocate per frame.
+    """
+
+    def __init__(self, capacity=64):
+        self.size = 0
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        old = self.__dict__.get('mean')
+        n = self.size
+        fields = {
+            'mean': np.zeros((capacity, 8), dtype=np.float64),
+            'covariance': np.zeros((capacity, 8, 8), dtype=np.float64),
+            'tlbr': np.zeros((capacity, 4), dtype=np.float64),
+            'track_id': np.zeros(capacity, dtype=np.int64),
+            'state': np.zeros(capacity, dtype=np.int8),
+            'is_activated': np.zeros(capacity, dtype=bool),
+            'score': np.zeros(capacity, dtype=np.float64),
+            'frame_id': np.zeros(capacity, dtype=np.int64),
+            'start_frame': np.zeros(capacity, dtype=np.int64),
+            'tracklet_len': np.zeros(capacity, dtype=np.int64),
+        }
+        for name, array in fields.items():
+            if old is not None and n:
+                array[:n] = getattr(self, name)[:n]
+            setattr(self, name, array)
+        self.capacity = capacity
+
+    def append(self, mean, covariance, track_id, state, is_activated, score, frame_id):
+        """Append len(mean) tracks, returns their row indices"""
+        count = len(mean)
+        if self.size + count > self.capacity:
+            self._allocate(max(2 * self.capacity, self.size + count))
+        rows = np.arange(self.size, self.size + count)
+        self.mean[rows] = mean
+        self.covariance[rows] = covariance
+        self.track_id[rows] = track_id
+        self.state[rows] = state
+        self.is_activated[rows] = is_activated
+        self.score[rows] = score
+        self.frame_id[rows] = frame_id
+        self.start_frame[rows] = frame_id
+        self.tracklet_len[rows] = 0
+        self.size += count
+        return rows
+
+    def compact(self, keep):
+        """Keep only rows where keep (bool mask over [0, size)) is set, preserving order"""
+        if keep.all():
+            return
+        rows = np.flatnonzero(keep)
+        for name in ('mean', 'covariance', 'tlbr', 'track_id', 'state', 'is_activated',
+                     'score', 'frame_id', 'start_frame', 'tracklet_len'):
+            array = getattr(self, name)
+            array[:len(rows)] = array[rows]
+        self.size = len(rows)
+
+    def refresh_tlbr(self):
+        """Recompute cached (N, 4) tlbr boxes of all live rows from the Kalman means"""
+        n = self.size
+        self.tlbr[:n] = mean_to_tlbr(self.mean[:n])
+
+
+class TrackView(object):
+    """
+    Lightweight read-only view of one row of a TrackStore, with the STrack
+    attributes the callers use. Valid until the next tracker update.
+    """
+    __slots__ = ('_store', '_row')
+
+    def __init__(self, store, row):
+        self._store = store
+        self._row = row
+
+    @property
+    def track_id(self):
+        return int(self._store.track_id[self._row])
+
+    @property
+    def state(self):
+        return int(self._store.state[self._row])
+
+    @property
+    def is_activated(self):
+        return bool(self._store.is_activated[self._row])
+
+    @property
+    def score(self):
+        return float(self._store.score[self._row])
+
+    @property
+    def frame_id(self):
+        return int(self._store.frame_id[self._row])
+
+    @property
+    def start_frame(self):
+        return int(self._store.start_frame[self._row])
+
+    @property
+    def end_frame(self):
+        return self.frame_id
+
+    @property
+    def tracklet_len(self):
+        return int(self._store.tracklet_len[self._row])
+
+    @property
+    def mean(self):
+        return self._store.mean[self._row]
+
+    @property
+    def covariance(self):
+        return self._store.covariance[self._row]
+
+    @property
+    def tlbr(self):
+        return self._store.tlbr[self._row]
+
+    @property
+    def tlwh(self):
+        ret = self.tlbr.copy()
+        ret[2:] -= ret[:2]
+        return ret
+
+    def __repr__(self):
+        return 'OT_{}_({}-{})'.format(self.track_id, self.start_frame, self.end_frame)
+
+
+class SoABYTETracker(object):
+    """
+    BYTETracker with all track state in a TrackStore.
+
+    Same association logic and parameters as BYTETracker; prediction, IoU,
+    Kalman correction, track creation and the duplicate check run on whole
+    arrays instead of per-track objects. `update` returns TrackView objects.
+    """
+
+    def __init__(self, args, frame_rate=30):
+        self.store = TrackStore()
+        self.frame_id = 0
+        self.args = args
+        self.det_thresh = args.track_thresh + 0.1
+        self.buffer_size = int(frame_rate / 30.0 * args.track_buffer)
+        self.max_time_lost = self.buffer_size
+        self.kalman_filter = KalmanFilter()
+        self.removed_count = 0
+
+    @property
+    def tracked_stracks(self):
+        return self._views(self.store.state[:self.store.size] == TrackState.Tracked)
+
+    @property
+    def lost_stracks(self):
+        return self._views(self.store.state[:self.store.size] == TrackState.Lost)
+
+    def _views(self, mask):
+        return [TrackView(self.store, row) for row in np.flatnonzero(mask)]
+
+    def update(self, output_results, img_info, img_size):
+        self.frame_id += 1
+        store = self.store
+        kf = self.kalman_filter
+
+        if output_results.shape[1] == 5:
+            scores = output_results[:, 4]
+            bboxes = output_results[:, :4]
+        else:
+            output_results = output_results.cpu().numpy()
+            scores = output_results[:, 4] * output_results[:, 5]
+            bboxes = output_results[:, :4]  # x1y1x2y2
+        bboxes = np.asarray(bboxes, dtype=np.float64)
+        scores = np.asarray(scores, dtype=np.float64)
+
+        remain_inds = scores > self.args.track_thresh
+        inds_second = np.logical_and(scores > 0.1, scores < self.args.track_thresh)
+        dets, scores_keep = bboxes[remain_inds], scores[remain_inds]
+        dets_second, scores_second = bboxes[inds_second], scores[inds_second]
+
+        n = store.size
+        state = store.state[:n]
+        start_state = state.copy()
+        tracked = state == TrackState.Tracked
+        unconfirmed = np.flatnonzero(tracked & ~store.is_activated[:n])
+        strack_pool = np.concatenate([np.flatnonzero(tracked & store.is_activated[:n]),
+                                      np.flatnonzero(state == TrackState.Lost)])
+
+        # Rows corrected this frame, their tlbr measurements and detection scores
+        upd_rows, upd_boxes, upd_scores = [], [], []
+
+        ''' Step 2: First association, with high score detection boxes'''
+        if len(strack_pool) > 0:
+            multi_mean = store.mean[strack_pool]
+            multi_covariance = store.covariance[strack_pool]
+            multi_mean[start_state[strack_pool] != TrackState.Tracked, 7] = 0
+            kf.multi_predict(multi_mean, multi_covariance, multi_mean, multi_covariance)
+            store.mean[strack_pool] = multi_mean
+            store.covariance[strack_pool] = multi_covariance
+        pool_tlbr = mean_to_tlbr(store.mean[strack_pool])
+        dists = self._gate(1 - matching.ious(pool_tlbr, dets), strack_pool, dets)
+        if not self.args.mot20 and dists.size > 0:
+            dists = 1 - (1 - dists) * scores_keep[None, :]
+        matches, u_track, u_detection = matching.linear_assignment(dists, thresh=self.args.match_thresh)
+        matches = np.asarray(matches, dtype=np.int64).reshape(-1, 2)
+        upd_rows.append(strack_pool[matches[:, 0]])
+        upd_boxes.append(dets[matches[:, 1]])
+        upd_scores.append(scores_keep[matches[:, 1]])
+
+        ''' Step 3: Second association, with low score detection boxes'''
+        u_track = np.asarray(u_track, dtype=np.int64)
+        r_tracked_pos = u_track[start_state[strack_pool[u_track]] == TrackState.Tracked]
+        r_tracked = strack_pool[r_tracked_pos]
+        dists = self._gate(1 - matching.ious(pool_tlbr[r_tracked_pos], dets_second), r_tracked, dets_second)
+        matches, u_track, _ = matching.linear_assignment(dists, thresh=0.5)
+        matches = np.asarray(matches, dtype=np.int64).reshape(-1, 2)
+        upd_rows.append(r_tracked[matches[:, 0]])
+        upd_boxes.append(dets_second[matches[:, 1]])
+        upd_scores.append(scores_second[matches[:, 1]])
+        state[r_tracked[np.asarray(u_track, dtype=np.int64)]] = TrackState.Lost
+
+        '''Deal with unconfirmed tracks, usually tracks with only one beginning frame'''
+        u_detection = np.asarray(u_detection, dtype=np.int64)
+        dets, scores_keep = dets[u_detection], scores_keep[u_detection]
+        dists = 1 - matching.ious(mean_to_tlbr(store.mean[unconfirmed]), dets)
+        if not self.args.mot20 and dists.size > 0:
+            dists = 1 - (1 - dists) * scores_keep[None, :]
+        matches, u_unconfirmed, u_detection = matching.linear_assignment(dists, thresh=0.7)
+        matches = np.asarray(matches, dtype=np.int64).reshape(-1, 2)
+        upd_rows.append(unconfirmed[matches[:, 0]])
+        upd_boxes.append(dets[matches[:, 1]])
+        upd_scores.append(scores_keep[matches[:, 1]])
+        state[unconfirmed[np.asarray(u_unconfirmed, dtype=np.int64)]] = TrackState.Removed
+
+        # Kalman correction of every matched track in one batch
+        rows = np.concatenate(upd_rows)
+        if len(rows) > 0:
+            store.mean[rows], store.covariance[rows] = kf.multi_update(
+                store.mean[rows], store.covariance[rows], tlbr_to_xyah(np.concatenate(upd_boxes)))
+            refind = start_state[rows] == TrackState.Lost
+            store.tracklet_len[rows] = np.where(refind, 0, store.tracklet_len[rows] + 1)
+            state[rows] = TrackState.Tracked
+            store.is_activated[rows] = True
+            store.frame_id[rows] = self.frame_id
+            store.score[rows] = np.concatenate(upd_scores)
+
+        """ Step 5: Update state"""
+        # Tracks lost before this frame (re-found ones carry the current frame_id)
+        expired = (start_state == TrackState.Lost) & (state == TrackState.Lost) & \
+                  (self.frame_id - store.frame_id[:n] > self.max_time_lost)
+        state[expired] = TrackState.Removed
+
+        """ Step 4: Init new stracks"""
+        u_detection = np.asarray(u_detection, dtype=np.int64)
+        new = u_detection[scores_keep[u_detection] >= self.det_thresh]
+        if len(new) > 0:
+            mean, covariance = multi_initiate(kf, tlbr_to_xyah(dets[new]))
+            track_id = [BaseTrack.next_id() for _ in range(len(new))]
+            store.append(mean, covariance, track_id, TrackState.Tracked, self.frame_id == 1,
+                         scores_keep[new], self.frame_id)
+
+        removed = store.state[:store.size] == TrackState.Removed
+        self.removed_count += int(np.count_nonzero(removed))
+        store.compact(~removed)
+        store.refresh_tlbr()
+        self._remove_duplicates()
+
+        return self._views((store.state[:store.size] == TrackState.Tracked) & store.is_activated[:store.size])
+
+    def _gate(self, dists, rows, dets):
+        """Motion gating: rule out pairs beyond the chi-square 95% squared Mahalanobis distance"""
+        if not getattr(self.args, 'motion_gating', False) or dists.size == 0:
+            return dists
+        gating_distance = self.kalman_filter.multi_gating_distance(
+            self.store.mean[rows], self.store.covariance[rows], tlbr_to_xyah(dets))
+        dists[gating_distance > kalman_filter.chi2inv95[4]] = np.inf
+        return dists
+
+    def _remove_duplicates(self):
+        """remove_duplicate_stracks: drop the younger of overlapping tracked / lost pairs"""
+        store = self.store
+        n = store.size
+        tracked = np.flatnonzero(store.state[:n] == TrackState.Tracked)
+        lost = np.flatnonzero(store.state[:n] == TrackState.Lost)
+        if len(tracked) == 0 or len(lost) == 0:
+            return
+        pdist = 1 - matching.ious(store.tlbr[tracked], store.tlbr[lost])
+        p, q = np.where(pdist < 0.15)
+        if len(p) == 0:
+            return
+        age = store.frame_id[:n] - store.start_frame[:n]
+        keep = np.ones(n, dtype=bool)
+        older = age[tracked[p]] > age[lost[q]]
+        keep[lost[q[older]]] = False
+        keep[tracked[p[~older]]] = False
+        store.compact(keep)
+
+
+def multi_initiate(kf, measurements):
+    """Vectorized KalmanFilter.initiate for (N, 4) xyah measurements"""
+    n = len(measurements)
+    h = measurements[:, 3]
+    std = np.stack([
+        2 * kf._std_weight_position * h,
+        2 * kf._std_weight_position * h,
+        np.full(n, 1e-2),
+        2 * kf._std_weight_position * h,
+        10 * kf._std_weight_velocity * h,
+        10 * kf._std_weight_velocity * h,
+        np.full(n, 1e-5),
+        10 * kf._std_weight_velocity * h], axis=1)
+    mean = np.hstack([measurements, np.zeros_like(measurements)])
+    covariance = np.zeros((n, 8, 8), dtype=np.float64)
+    diag = np.arange(8)
+    covariance[:, diag, diag] = np.square(std)
+    return mean, covariance
+
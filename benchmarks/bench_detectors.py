@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Detector Backend Benchmark
+Aynı video klibinde torch / torch_direct / onnxruntime / openvino backend'lerinin frame başına süresini ölçer
+
+Kullanım:
+    python benchmarks/bench_detectors.py --video data/klip.mp4
+    python benchmarks/bench_detectors.py --video data/klip.mp4 --backends onnxruntime,openvino --frames 300
+
+Notlar:
+- Frame'ler önce belleğe okunur; ölçüm video decode süresini içermez
+- ONNX / OpenVINO modelleri ilk çalıştırmada export edilir (models/exports)
+- Her backend için tespit sayısı ve torch'a göre kutu uyumu (ortalama IoU) raporlanır
+"""
+
+import os
+import sys
+import time
+import argparse
+
+import cv2
+import numpy as np
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from src.core.detectors.detector_factory import create_detector, DETECTOR_BACKENDS
+from src.utils.config import config
+
+
+def load_frames(video_path, max_frames):
+    cap = cv2.VideoCapture(video_path)
+    frames = []
+    while len(frames) < max_frames:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        frames.append(frame)
+    cap.release()
+    return frames
+
+
+def box_iou(a, b):
+    """a: Nx4, b: Mx4 → NxM IoU"""
+    if len(a) == 0 or len(b) == 0:
+        return np.zeros((len(a), len(b)))
+    x1 = np.maximum(a[:, None, 0], b[None, :, 0])
+    y1 = np.maximum(a[:, None, 1], b[None, :, 1])
+    x2 = np.minimum(a[:, None, 2], b[None, :, 2])
+    y2 = np.minimum(a[:, None, 3], b[None, :, 3])
+    inter = np.clip(x2 - x1, 0, None) * np.clip(y2 - y1, 0, None)
+    area_a = (a[:, 2] - a[:, 0]) * (a[:, 3] - a[:, 1])
+    area_b = (b[:, 2] - b[:, 0]) * (b[:, 3] - b[:, 1])
+    return inter / np.maximum(area_a[:, None] + area_b[None, :] - inter, 1e-9)
+
+
+def agreement(reference, results):
+    """Referans kutuların her biri için en iyi eşleşmenin ortalama IoU'su"""
+    ious = []
+    for ref, res in zip(reference, results):
+        if len(ref) == 0:
+            continue
+        iou = box_iou(ref[:, :4], res[:, :4])
+        ious.extend(iou.max(axis=1) if iou.shape[1] else np.zeros(len(ref)))
+    return float(np.mean(ious)) if ious else float("nan")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Detector backend benchmark")
+    parser.add_argument("--video", required=True, help="Test klibi")
+    parser.add_argument("--model", default=None, help=".pt model (varsayılan: config)")
+    parser.add_argument("--backends", default=",".join(DETECTOR_BACKENDS))
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--conf", type=float, default=config.confidence_threshold)
+    parser.add_argument("--threads", type=int, default=config.detector_threads)
+    args = parser.parse_args()
+
+    model_path = args.model or config.get_balloon_custom_model_path()
+    frames = load_frames(args.video, args.frames)
+    if not frames:
+        print(f"Video okunamadı: {args.video}")
+        return 1
+
+    print("Detector Backend Benchmark")
+    print("=" * 72)
+    print(f"Model: {model_path}")
+    print(f"Klip: {args.video} ({len(frames)} frame, {frames[0].shape[1]}x{frames[0].shape[0]})\n")
+    print(f"{'Backend':<14}{'Ortalama (ms)':>14}{'p95 (ms)':>10}{'FPS':>8}{'Tespit':>9}{'IoU (torch)':>13}")
+
+    reference = None
+    for backend in args.backends.split(","):
+        backend = backend.strip()
+        try:
+            detector = create_detector(model_path, backend=backend, threads=args.threads, int8=False)
+        except Exception as e:
+            print(f"{backend:<14}hata: {e}")
+            continue
+        if detector.name != backend:
+            print(f"{backend:<14}kullanılamıyor (torch'a düştü)")
+            continue
+
+        detector.warmup(iterations=3, shape=frames[0].shape)
+        samples = []
+        results = []
+        for frame in frames:
+            start = time.perf_counter()
+            results.append(detector.detect(frame, args.conf))
+            samples.append((time.perf_counter() - start) * 1000.0)
+
+        if backend == "torch":
+            reference = results
+        match = agreement(reference, results) if reference is not None else float("nan")
+        mean_ms = float(np.mean(samples))
+        print(f"{backend:<14}{mean_ms:>14.2f}{np.percentile(samples, 95):>10.2f}{1000.0 / mean_ms:>8.1f}"
+              f"{sum(len(r) for r in results):>9}{match:>13.3f}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+MJPEG Decode Micro-Benchmark
+Tam çözünürlük JPEG decode ile azaltılmış decode (IMREAD_REDUCED_COLOR_2/4/8) karşılaştırması
+
+Kullanım:
+    python benchmarks/bench_mjpeg_decode.py
+    python benchmarks/bench_mjpeg_decode.py --iterations 200 --image data/ornek.jpg
+
+Görüntü verilmezse kamera görüntüsünü taklit eden sentetik bir sahne
+(yumuşak gradyan + sensör gürültüsü + balonlar) kullanılır; saf gürültü
+JPEG'in entropi decode maliyetini abartır.
+"""
+
+import os
+import sys
+import time
+import argparse
+
+import cv2
+import numpy as np
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from src.core.capture.mjpeg_decoder import REDUCED_DECODE_FLAGS, jpeg_dimensions
+
+RESOLUTIONS = [(640, 480), (1280, 720), (1920, 1080)]
+
+
+def synthetic_scene(width, height, seed=0):
+    """Kamera benzeri sentetik sahne"""
+    rng = np.random.default_rng(seed)
+    y, x = np.mgrid[0:height, 0:width]
+    scene = np.dstack([
+        120 + 60 * np.sin(x / 97.0),
+        140 + 50 * np.cos(y / 83.0),
+        110 + 40 * np.sin((x + y) / 151.0),
+    ]).astype(np.uint8)
+    for _ in range(6):
+        center = (int(rng.integers(0, width)), int(rng.integers(0, height)))
+        color = tuple(int(c) for c in rng.integers(0, 255, 3))
+        cv2.circle(scene, center, int(rng.integers(height // 20, height // 8)), color, -1)
+    noise = rng.integers(0, 12, scene.shape, dtype=np.uint8)
+    return cv2.add(scene, noise)
+
+
+def time_call(func, iterations):
+    """Ortalama süreyi milisaniye olarak döndür"""
+    func()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) * 1000.0 / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MJPEG decode micro-benchmark")
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--quality", type=int, default=85, help="Sentetik JPEG kalitesi")
+    parser.add_argument("--image", default=None, help="Sentetik sahne yerine kullanılacak görüntü")
+    args = parser.parse_args()
+
+    source = cv2.imread(args.image) if args.image else None
+    if args.image and source is None:
+        print(f"Görüntü okunamadı: {args.image}")
+        return 1
+
+    print("MJPEG Decode Micro-Benchmark")
+    print("=" * 60)
+    print(f"Tekrar: {args.iterations}\n")
+    print(f"{'Çözünürlük':<12}{'Ölçek':<8}{'Çıkış':<12}{'Ortalama (ms)':>15}")
+
+    for width, height in RESOLUTIONS:
+        image = cv2.resize(source, (width, height)) if source is not None else synthetic_scene(width, height)
+        ok, encoded = cv2.imencode(".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, args.quality])
+        if not ok:
+            print("JPEG encode başarısız")
+            return 1
+        encoded = encoded.reshape(1, -1)
+        assert jpeg_dimensions(encoded) == (width, height)
+
+        baseline = None
+        for scale, flag in REDUCED_DECODE_FLAGS.items():
+            decoded = cv2.imdecode(encoded, flag)
+            mean_ms = time_call(lambda: cv2.imdecode(encoded, flag), args.iterations)
+            baseline = baseline or mean_ms
+            out = f"{decoded.shape[1]}x{decoded.shape[0]}"
+            print(f"{width}x{height:<7}{'1/' + str(scale):<8}{out:<12}{mean_ms:>15.3f}   x{baseline / mean_ms:.1f}")
+
+        # Karşılaştırma: tam decode + resize (eski yol, detector girişi için)
+        half = (width // 2, height // 2)
+        mean_ms = time_call(lambda: cv2.resize(cv2.imdecode(encoded, cv2.IMREAD_COLOR), half,
+                                               interpolation=cv2.INTER_AREA), args.iterations)
+        print(f"{'':<12}{'full+rs':<8}{f'{half[0]}x{half[1]}':<12}{mean_ms:>15.3f}")
+        print()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
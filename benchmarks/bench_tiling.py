@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Tiled Detection Benchmark
+Tek geçiş tespit ile farklı tile boyutu / örtüşme ayarlarının maliyetini ve
+küçük nesne yakalama oranını aynı klipte karşılaştırır
+
+Kullanım:
+    python benchmarks/bench_tiling.py --video data/klip_1080p.mp4
+    python benchmarks/bench_tiling.py --video data/klip_1080p.mp4 --tiles 640:0.2,512:0.25 --no-coarse
+
+Notlar:
+- Frame'ler önce belleğe okunur; ölçüm video decode süresini içermez
+- "Küçük" tespit: alanı --small-area pikselkareden küçük kutular
+- Piksel oranı: frame başına model giriş pikseli / tek geçiş giriş pikseli
+"""
+
+import os
+import sys
+import time
+import argparse
+
+import numpy as np
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from benchmarks.bench_detectors import load_frames
+from src.core.detectors.detector_factory import create_detector
+from src.core.detectors.tiled_detector import TiledDetector
+from src.utils.config import config
+
+
+def run(detector, frames, conf, small_area):
+    samples, counts, small = [], [], []
+    for frame in frames:
+        start = time.perf_counter()
+        detections = detector.detect(frame, conf)
+        samples.append((time.perf_counter() - start) * 1000.0)
+        area = (detections[:, 2] - detections[:, 0]) * (detections[:, 3] - detections[:, 1])
+        counts.append(len(detections))
+        small.append(int(np.sum(area < small_area)))
+    return samples, float(np.mean(counts)), float(np.mean(small))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tiled detection benchmark")
+    parser.add_argument("--video", required=True, help="Test klibi (yüksek çözünürlük)")
+    parser.add_argument("--model", default=None, help=".pt model (varsayılan: config)")
+    parser.add_argument("--backend", default=config.detector_backend)
+    parser.add_argument("--tiles", default=f"{config.detector_tile_size}:{config.detector_tile_overlap}",
+                        help="Virgülle ayrılmış boyut:örtüşme listesi")
+    parser.add_argument("--no-coarse", action="store_true", help="Kaba tam frame görünümünü kapat")
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--conf", type=float, default=config.confidence_threshold)
+    parser.add_argument("--small-area", type=float, default=32 * 32)
+    args = parser.parse_args()
+
+    model_path = args.model or config.get_balloon_custom_model_path()
+    frames = load_frames(args.video, args.frames)
+    if not frames:
+        print(f"Video okunamadı: {args.video}")
+        return 1
+
+    detector = create_detector(model_path, backend=args.backend, int8=False)
+    detector.warmup(iterations=3, shape=frames[0].shape)
+
+    print("Tiled Detection Benchmark")
+    print("=" * 84)
+    print(f"Model: {model_path} ({detector.describe()})")
+    print(f"Klip: {args.video} ({len(frames)} frame, {frames[0].shape[1]}x{frames[0].shape[0]})\n")
+    print(f"{'Mod':<22}{'Görünüm':>9}{'Piksel':>9}{'Ort. (ms)':>11}{'p95 (ms)':>10}"
+          f"{'Maliyet':>9}{'Tespit/fr':>11}{'Küçük/fr':>10}")
+
+    samples, count, small = run(detector, frames, args.conf, args.small_area)
+    single_ms = float(np.mean(samples))
+    print(f"{'tek geçiş':<22}{1:>9}{1.0:>8.1f}x{single_ms:>11.2f}{np.percentile(samples, 95):>10.2f}"
+          f"{1.0:>8.1f}x{count:>11.2f}{small:>10.2f}")
+
+    if not detector.dynamic_input:
+        print(f"\n{detector.name} sabit giriş boyutlu - tile'lar model girişine büyütülür, maliyet oranı yanıltıcıdır")
+
+    for spec in args.tiles.split(","):
+        size, overlap = spec.split(":")
+        tiled = TiledDetector(detector, int(size), float(overlap), coarse=not args.no_coarse)
+        tiled.warmup(iterations=2, shape=frames[0].shape)
+        views = len(tiled.tiles(frames[0].shape)) + (0 if args.no_coarse else 1)
+        samples, count, small = run(tiled, frames, args.conf, args.small_area)
+        mean_ms = float(np.mean(samples))
+        label = f"tile {size}/%{float(overlap) * 100:.0f}"
+        print(f"{label:<22}{views:>9}{tiled.cost_ratio(frames[0].shape):>8.1f}x{mean_ms:>11.2f}"
+              f"{np.percentile(samples, 95):>10.2f}{mean_ms / single_ms:>8.1f}x{count:>11.2f}{small:>10.2f}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
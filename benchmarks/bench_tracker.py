@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Tracker Core Benchmark
+Yoğun balon alanlarında (sentetik sahne) object (STrack) ve soa (TrackStore)
+ByteTrack çekirdeklerinin frame başına update süresini ve çıktı uyumunu ölçer;
+Kalman tahmin / düzeltme adımlarının track başına ve toplu (multi_predict /
+multi_update) ve Mahalanobis kapısının satır satır / toplu (multi_gating_distance)
+sürelerini karşılaştırır; IoU çekirdeklerini (numpy / numba) cython_bbox ile
+eşdeğerlik ve süre açısından karşılaştırır
+
+Kullanım:
+    python benchmarks/bench_tracker.py
+    python benchmarks/bench_tracker.py --objects 20,40,60 --frames 500
+    python benchmarks/bench_tracker.py --suite predict,update --tracks 1,10,50,100,200
+    python benchmarks/bench_tracker.py --suite core,gating --motion-gating
+    python benchmarks/bench_tracker.py --suite iou --tracks 10,60,200
+
+Notlar:
+- Sahne: sabit hız + gürültülü ivme ile hareket eden N balon, %10 kaçırılan
+  tespit, düşük skorlu tespitler ve frame başına 2 yanlış pozitif
+- Uyum: iki çekirdeğin aynı frame'de aynı track ID / kutu / kayıp track
+  kümesini verdiği frame oranı
+- predict / update: KalmanFilter.predict / update döngüsü ile tek multi_predict /
+  multi_update çağrısı; maks. fark iki yolun sonuçları arasındaki en büyük mutlak farktır
+- gating: track başına KalmanFilter.gating_distance ile tek multi_gating_distance
+  çağrısı (track sayısı kadar tespit); --motion-gating core testinde kapıyı açar
+- iou: cython_bbox kuruluysa referans odur (yoksa numpy çekirdeği); kenar durumları
+  (aynı, bitişik +1 piksel, ayrık, bozuk kutular) eşdeğerlik kontrolüne dahildir;
+  fark bulunursa başarısız olan kontrol için benchmarks/check_iou.py
+- predict testinde kayıp track'ler dahil tüm havuz her frame tahmin edilir
+  (track_buffer büyüdükçe havuz büyür)
+"""
+
+import os
+import sys
+import time
+import argparse
+from types import SimpleNamespace
+
+import numpy as np
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, 'OC_SORT'))
+
+from OC_SORT.trackers.byte_tracker.byte_tracker import BYTETracker
+from OC_SORT.trackers.byte_tracker.soa_tracker import SoABYTETracker
+from OC_SORT.trackers.byte_tracker.basetrack import BaseTrack, TrackState
+from OC_SORT.trackers.byte_tracker.kalman_filter import KalmanFilter
+from OC_SORT.trackers.byte_tracker import box_iou
+from src.utils.config import config
+
+FRAME_W, FRAME_H = 1920, 1080
+
+
+def make_scene(objects, frames, seed):
+    """Sentetik tespit dizisi: frame başına Nx5 [x1, y1, x2, y2, score]"""
+    rng = np.random.default_rng(seed)
+    pos = rng.uniform(50, [FRAME_W - 50, FRAME_H - 50], (objects, 2))
+    vel = rng.normal(0, 4, (objects, 2))
+    size = rng.uniform(15, 80, (objects, 1))
+    sequence = []
+    for _ in range(frames):
+        pos += vel
+        vel += rng.normal(0, 0.5, vel.shape)
+        boxes = np.hstack([pos - size / 2, pos + size / 2]) + rng.normal(0, 1.5, (objects, 4))
+        scores = rng.uniform(0.05, 0.99, (objects, 1))
+        visible = rng.random(objects) > 0.1
+        clutter = rng.uniform(0, [FRAME_W, FRAME_H], (2, 2))
+        clutter = np.hstack([clutter, clutter + 30, rng.uniform(0.1, 0.9, (2, 1))])
+        sequence.append(np.vstack([np.hstack([boxes, scores])[visible], clutter]).astype(np.float32))
+    return sequence
+
+
+def run(tracker_class, sequence, motion_gating=False):
+    BaseTrack._count = 0
+    args = SimpleNamespace(track_thresh=config.track_thresh, track_buffer=config.track_buffer,
+                           match_thresh=config.match_thresh, mot20=False, motion_gating=motion_gating)
+    tracker = tracker_class(args, frame_rate=30)
+    samples, outputs = [], []
+    for detections in sequence:
+        start = time.perf_counter()
+        online = tracker.update(detections, (FRAME_H, FRAME_W), (FRAME_W, FRAME_H))
+        samples.append((time.perf_counter() - start) * 1000.0)
+        # object çekirdeği süresi dolan track'i bir frame daha (Removed durumunda) listede tutar
+        lost = sorted(t.track_id for t in tracker.lost_stracks if t.state != TrackState.Removed)
+        outputs.append((sorted((t.track_id, tuple(np.round(t.tlbr, 2))) for t in online), lost))
+    return samples, outputs
+
+
+def make_states(kf, count, rng):
+    """Tahmin adımından geçmiş rastgele track durumları ve gürültülü ölçümler"""
+    means, covariances = [], []
+    for _ in range(count):
+        mean, covariance = kf.initiate(rng.uniform([0, 0, 0.5, 15], [FRAME_W, FRAME_H, 1.5, 80]))
+        mean, covariance = kf.predict(mean, covariance)
+        means.append(mean)
+        covariances.append(covariance)
+    means, covariances = np.asarray(means), np.asarray(covariances)
+    measurements = means[:, :4] + rng.normal(0, 1.5, (count, 4))
+    return means, covariances, measurements
+
+
+def bench_step(step, track_counts, repeats, seed):
+    """Track başına Kalman adımı döngüsü ile toplu çağrıyı karşılaştır (step: predict / update)"""
+    kf = KalmanFilter()
+    rng = np.random.default_rng(seed)
+    print(f"{'Track':>6}{step + ' döngüsü (ms)':>22}{'multi_' + step + ' (ms)':>20}{'Hızlanma':>10}{'Maks. fark':>13}")
+    for count in track_counts:
+        means, covariances, measurements = make_states(kf, count, rng)
+        if step == "predict":
+            single = lambda: [kf.predict(m, c) for m, c in zip(means, covariances)]
+            batch = lambda: kf.multi_predict(means, covariances)
+        else:
+            single = lambda: [kf.update(m, c, z) for m, c, z in zip(means, covariances, measurements)]
+            batch = lambda: kf.multi_update(means, covariances, measurements)
+
+        start = time.perf_counter()
+        for _ in range(repeats):
+            reference = single()
+        loop_ms = (time.perf_counter() - start) * 1000.0 / repeats
+
+        start = time.perf_counter()
+        for _ in range(repeats):
+            batch_mean, batch_cov = batch()
+        batch_ms = (time.perf_counter() - start) * 1000.0 / repeats
+
+        error = max(np.abs(batch_mean - np.asarray([r[0] for r in reference])).max(),
+                    np.abs(batch_cov - np.asarray([r[1] for r in reference])).max())
+        print(f"{count:>6}{loop_ms:>22.3f}{batch_ms:>20.3f}{loop_ms / batch_ms:>9.1f}x{error:>13.1e}")
+
+
+def bench_gating(track_counts, repeats, seed):
+    """Satır satır gating_distance ile toplu multi_gating_distance (tracks x tespit matrisi)"""
+    kf = KalmanFilter()
+    rng = np.random.default_rng(seed)
+    print(f"{'Track':>6}{'Tespit':>8}{'satır döngüsü (ms)':>21}{'toplu (ms)':>12}{'Hızlanma':>10}{'Maks. fark':>13}")
+    for count in track_counts:
+        means, covariances, measurements = make_states(kf, count, rng)
+
+        start = time.perf_counter()
+        for _ in range(repeats):
+            reference = np.asarray([kf.gating_distance(m, c, measurements) for m, c in zip(means, covariances)])
+        loop_ms = (time.perf_counter() - start) * 1000.0 / repeats
+
+        start = time.perf_counter()
+        for _ in range(repeats):
+            batch = kf.multi_gating_distance(means, covariances, measurements)
+        batch_ms = (time.perf_counter() - start) * 1000.0 / repeats
+
+        error = np.abs(batch - reference).max() / max(np.abs(reference).max(), 1e-12)
+        print(f"{count:>6}{count:>8}{loop_ms:>21.3f}{batch_ms:>12.3f}{loop_ms / batch_ms:>9.1f}x{error:>13.1e}")
+
+
+def make_boxes(count, rng):
+    """Rastgele tlbr kutular + kenar durumları (aynı, +1 piksel bitişik, ayrık, bozuk)"""
+    xy = rng.uniform(0, [FRAME_W, FRAME_H], (count, 2))
+    boxes = np.hstack([xy, xy + rng.uniform(-2, 80, (count, 2))])
+    edge = np.array([[10, 10, 50, 50], [51, 10, 90, 50], [50, 10, 90, 50],
+                     [500, 500, 500, 500], [40, 40, 30, 30]], dtype=np.float64)
+    return np.vstack([boxes, edge])
+
+
+def bench_iou(track_counts, repeats, seed):
+    rng = np.random.default_rng(seed)
+    try:
+        from cython_bbox import bbox_overlaps as reference_kernel
+        reference_name = "cython_bbox"
+    except ImportError:
+        reference_kernel, reference_name = box_iou.bbox_overlaps_numpy, "numpy"
+    kernels = [(reference_name, reference_kernel)]
+    if reference_name != "numpy":
+        kernels.append(("numpy", box_iou.bbox_overlaps_numpy))
+    if box_iou.NUMBA_AVAILABLE:
+        box_iou.set_iou_backend("numba")  # JIT derlemesi ölçüme girmesin
+        kernels.append(("numba", box_iou.bbox_overlaps_numba))
+    else:
+        print("numba kurulu değil - sadece NumPy çekirdeği")
+
+    header = f"{'Kutu':>6}" + "".join(f"{name + ' (us)':>18}" for name, _ in kernels) + f"{'Maks. fark':>13}"
+    print(f"Referans: {reference_name}")
+    print(header)
+    for count in track_counts:
+        tracks, detections = make_boxes(count, rng), make_boxes(count, rng)
+        reference = reference_kernel(tracks, detections)
+        timings, error = [], 0.0
+        for _, kernel in kernels:
+            result = kernel(tracks, detections)
+            error = max(error, float(np.abs(result - reference).max()))
+            start = time.perf_counter()
+            for _ in range(repeats):
+                kernel(tracks, detections)
+            timings.append((time.perf_counter() - start) * 1e6 / repeats)
+        print(f"{len(tracks):>6}" + "".join(f"{t:>18.1f}" for t in timings) + f"{error:>13.1e}")
+        if error > 1e-12:
+            print("⚠️ IoU çekirdekleri referanstan farklı sonuç veriyor")
+
+
+def bench_cores(object_counts, frames, seed, motion_gating=False):
+    print(f"{'Balon':>6}{'object (ms)':>14}{'soa (ms)':>12}{'object p95':>13}{'soa p95':>10}"
+          f"{'Hızlanma':>10}{'Uyum':>7}")
+    for objects in object_counts:
+        sequence = make_scene(objects, frames, seed)
+        object_ms, object_out = run(BYTETracker, sequence, motion_gating)
+        soa_ms, soa_out = run(SoABYTETracker, sequence, motion_gating)
+        agreement = np.mean([a == b for a, b in zip(object_out, soa_out)])
+        print(f"{objects:>6}{np.mean(object_ms):>14.3f}{np.mean(soa_ms):>12.3f}"
+              f"{np.percentile(object_ms, 95):>13.3f}{np.percentile(soa_ms, 95):>10.3f}"
+              f"{np.mean(object_ms) / np.mean(soa_ms):>9.1f}x{agreement * 100:>6.0f}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tracker core benchmark")
+    parser.add_argument("--objects", default="1,5,20,40,60", help="Virgülle ayrılmış balon sayıları")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--tracks", default="1,5,10,20,50,100,200", help="predict / update testi için track sayıları")
+    parser.add_argument("--repeats", type=int, default=200, help="predict / update testi tekrar sayısı")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--suite", default="core,predict,update,gating,iou",
+                        help="Çalıştırılacak testler: core, predict, update, gating, iou")
+    parser.add_argument("--motion-gating", action="store_true", help="core testinde Mahalanobis kapısını aç")
+    args = parser.parse_args()
+    suites = args.suite.split(",")
+
+    print("Tracker Core Benchmark")
+    print("=" * 72)
+    if "core" in suites:
+        gating_text = " - hareket kapısı açık" if args.motion_gating else ""
+        print(f"\nUpdate süresi (frame başına){gating_text}")
+        bench_cores([int(v) for v in args.objects.split(",")], args.frames, args.seed, args.motion_gating)
+    track_counts = [int(v) for v in args.tracks.split(",")]
+    if "predict" in suites:
+        print("\nKalman tahmin adımı")
+        bench_step("predict", track_counts, args.repeats, args.seed)
+    if "update" in suites:
+        print("\nKalman düzeltme adımı")
+        bench_step("update", track_counts, args.repeats, args.seed)
+    if "gating" in suites:
+        print("\nMahalanobis kapısı (kare mesafe matrisi)")
+        bench_gating(track_counts, args.repeats, args.seed)
+    if "iou" in suites:
+        print("\nIoU çekirdekleri (track x tespit)")
+        bench_iou(track_counts, args.repeats, args.seed)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Undistortion Micro-Benchmark
+Her frame'de cv2.undistort ile önceden hesaplanmış remap tablolarını karşılaştırır
+
+Kullanım:
+    python benchmarks/bench_undistort.py
+    python benchmarks/bench_undistort.py --iterations 200 --calibration data/kalibrasyon.json
+
+Karşılaştırılan yollar:
+- cv2.undistort (eski yol - haritayı her frame'de yeniden hesaplar)
+- remap float32 (CV_32FC1 tablolar)
+- remap fixed (CV_16SC2 sabit noktalı tablolar)
+"""
+
+import os
+import sys
+import time
+import argparse
+
+import cv2
+import numpy as np
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from src.utils.camera_calibration_service import CameraCalibrationService, find_latest_calibration_file
+
+RESOLUTIONS = [(640, 480), (1920, 1080)]
+
+
+def time_call(func, iterations):
+    """Ortalama ve medyan süreyi milisaniye olarak döndür"""
+    func()  # Isınma (tablo hesaplama / cache)
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return float(np.mean(samples)), float(np.median(samples))
+
+
+def scaled_service(base_service, width, height, map_type):
+    """
+    Kalibrasyonu hedef çözünürlüğe ölçekle
+
+    Kalibrasyon 640x480'de yapıldığı için 1080p testinde kamera matrisi
+    çözünürlük oranıyla ölçeklenir (maliyet açısından temsili).
+    """
+    service = CameraCalibrationService()
+    scale_x = width / (2.0 * base_service.camera_matrix[0, 2])
+    scale_y = height / (2.0 * base_service.camera_matrix[1, 2])
+    camera_matrix = base_service.camera_matrix.copy()
+    camera_matrix[0, :] *= scale_x
+    camera_matrix[1, :] *= scale_y
+    service.camera_matrix = camera_matrix
+    service.dist_coeffs = base_service.dist_coeffs
+    service.calibration_error = base_service.calibration_error
+    service.configure_undistortion(map_type=map_type)
+    return service
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Undistortion micro-benchmark")
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--calibration", default=None, help="Kalibrasyon dosyası (.npz/.json)")
+    args = parser.parse_args()
+
+    calibration_file = args.calibration or find_latest_calibration_file(os.path.join(ROOT_DIR, "data"))
+    if not calibration_file:
+        print("Kalibrasyon dosyası bulunamadı")
+        return 1
+
+    base = CameraCalibrationService()
+    if not base.load_calibration(calibration_file):
+        print(f"Kalibrasyon yüklenemedi: {calibration_file}")
+        return 1
+
+    print("Undistortion Micro-Benchmark")
+    print("=" * 60)
+    print(f"Kalibrasyon: {calibration_file}")
+    print(f"Tekrar: {args.iterations}\n")
+    print(f"{'Çözünürlük':<12}{'Yöntem':<20}{'Ortalama (ms)':>15}{'Medyan (ms)':>13}")
+
+    rng = np.random.default_rng(0)
+    for width, height in RESOLUTIONS:
+        frame = rng.integers(0, 255, (height, width, 3), dtype=np.uint8)
+        fixed = scaled_service(base, width, height, "fixed")
+        float32 = scaled_service(base, width, height, "float32")
+        dst = np.empty_like(frame)
+
+        results = [
+            ("cv2.undistort", lambda: cv2.undistort(frame, fixed.camera_matrix, fixed.dist_coeffs)),
+            ("remap float32", lambda: float32.undistort_frame(frame)),
+            ("remap fixed", lambda: fixed.undistort_frame(frame)),
+            ("remap fixed + dst", lambda: fixed.undistort_frame(frame, dst=dst)),
+        ]
+
+        baseline = None
+        for name, func in results:
+            mean_ms, median_ms = time_call(func, args.iterations)
+            baseline = baseline or mean_ms
+            speedup = baseline / mean_ms if mean_ms > 0 else 0.0
+            print(f"{width}x{height:<7}{name:<20}{mean_ms:>15.3f}{median_ms:>13.3f}   x{speedup:.1f}")
+
+        # Doğruluk kontrolü: remap sonucu cv2.undistort ile neredeyse aynı olmalı
+        reference = cv2.undistort(frame, fixed.camera_matrix, fixed.dist_coeffs).astype(np.int16)
+        for name, service in (("float32", float32), ("fixed", fixed)):
+            diff = np.abs(service.undistort_frame(frame).astype(np.int16) - reference)
+            print(f"{'':<12}{name} vs cv2.undistort: ortalama fark {diff.mean():.3f}, maks {diff.max()}")
+        print()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+IoU Çekirdeği Eşdeğerlik Kontrolü
+NumPy ve Numba IoU çekirdeklerinin cython_bbox.bbox_overlaps ile bit düzeyinde
+aynı sonucu verdiğini doğrular; fark bulunursa AssertionError ile (sıfırdan
+farklı çıkış koduyla) başarısız olur
+
+Kullanım:
+    python benchmarks/check_iou.py
+    python benchmarks/check_iou.py --sizes 1,7,60,200 --seed 3
+
+Notlar:
+- cython_bbox kurulu değilse referans karşılaştırması atlanır; elle hesaplanmış
+  kenar durumları ve numpy / numba karşılaştırması yine çalışır
+- Kenar durumları: aynı kutu, +1 piksel kuralıyla tek piksel örtüşen ve bitişik
+  (ayrık) kutular, sıfır boyutlu (nokta) ve ters (x2 < x1) kutular, boş girişler
+- Numba kurulu değilse sadece NumPy çekirdeği kontrol edilir
+"""
+
+import os
+import sys
+import argparse
+
+import numpy as np
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from OC_SORT.trackers.byte_tracker import box_iou
+
+# [10, 10, 50, 50] ile: aynı, tek piksel sütun örtüşme (+1 kuralı), bitişik/ayrık, nokta, ters
+EDGE_BOXES = np.array([
+    [10, 10, 50, 50],
+    [50, 10, 90, 50],
+    [51, 10, 90, 50],
+    [500, 500, 500, 500],
+    [40, 40, 30, 30],
+], dtype=np.float64)
+# EDGE_BOXES x EDGE_BOXES için elle hesaplanmış IoU (alan = (x2 - x1 + 1) * (y2 - y1 + 1))
+EDGE_EXPECTED = np.array([
+    [1.0, 41.0 / 3321.0, 0.0, 0.0, 0.0],
+    [41.0 / 3321.0, 1.0, 40.0 / 41.0, 0.0, 0.0],
+    [0.0, 40.0 / 41.0, 1.0, 0.0, 0.0],
+    [0.0, 0.0, 0.0, 1.0, 0.0],
+    [0.0, 0.0, 0.0, 0.0, 0.0],
+])
+
+
+def get_kernels():
+    """Kontrol edilecek çekirdekler: [(ad, fonksiyon), ...]"""
+    kernels = [("numpy", box_iou.bbox_overlaps_numpy)]
+    if box_iou.NUMBA_AVAILABLE:
+        kernels.append(("numba", box_iou.bbox_overlaps_numba))
+    return kernels
+
+
+def make_boxes(count, rng):
+    """Rastgele tlbr kutular (ters / sıfır boyutlu dahil) + kenar durumları"""
+    xy = rng.uniform(0, [1920, 1080], (count, 2))
+    boxes = np.hstack([xy, xy + rng.uniform(-2, 80, (count, 2))])
+    # Tam sayı koordinatlar: +1 kuralında bitişik kutular sık denk gelsin
+    boxes[: count // 2] = np.round(boxes[: count // 2])
+    return np.vstack([boxes, EDGE_BOXES])
+
+
+def check_edge_cases(kernels):
+    for name, kernel in kernels:
+        result = kernel(EDGE_BOXES, EDGE_BOXES)
+        np.testing.assert_allclose(result, EDGE_EXPECTED, rtol=0, atol=1e-15,
+                                   err_msg=f"{name}: kenar durumları")
+        for shape_a, shape_b in (((0, 4), (3, 4)), ((3, 4), (0, 4)), ((0, 4), (0, 4))):
+            result = kernel(np.zeros(shape_a), np.zeros(shape_b))
+            assert result.shape == (shape_a[0], shape_b[0]), f"{name}: boş giriş boyutu {result.shape}"
+            assert result.dtype == np.float64, f"{name}: çıktı tipi {result.dtype}"
+        print(f"{name:<8} kenar durumları: tamam")
+
+
+def check_against_reference(kernels, sizes, seed):
+    try:
+        from cython_bbox import bbox_overlaps as reference_kernel
+    except ImportError:
+        print("cython_bbox kurulu değil - referans karşılaştırması atlandı")
+        reference_kernel = None
+
+    rng = np.random.default_rng(seed)
+    for size in sizes:
+        boxes, query_boxes = make_boxes(size, rng), make_boxes(size + 3, rng)
+        baseline = kernels[0][1](boxes, query_boxes)
+        for name, kernel in kernels[1:]:
+            np.testing.assert_array_equal(kernel(boxes, query_boxes), baseline,
+                                          err_msg=f"{name} / numpy: {len(boxes)}x{len(query_boxes)}")
+        if reference_kernel is not None:
+            reference = reference_kernel(boxes, query_boxes)
+            for name, kernel in kernels:
+                np.testing.assert_array_equal(kernel(boxes, query_boxes), reference,
+                                              err_msg=f"{name} / cython_bbox: {len(boxes)}x{len(query_boxes)}")
+        compared = [name for name, _ in kernels] + (["cython_bbox"] if reference_kernel is not None else [])
+        print(f"{len(boxes):>5}x{len(query_boxes):<5} {', '.join(compared)}: aynı")
+
+
+def check_backend_selection():
+    boxes = make_boxes(10, np.random.default_rng(0))
+    for name in box_iou.IOU_BACKENDS:
+        selected = box_iou.set_iou_backend(name)
+        expected = name if name == "numpy" or box_iou.NUMBA_AVAILABLE else "numpy"
+        assert selected == expected == box_iou.get_iou_backend(), f"{name} seçildi, {selected} kullanılıyor"
+        np.testing.assert_array_equal(box_iou.bbox_overlaps(boxes, boxes),
+                                      box_iou.bbox_overlaps_numpy(boxes, boxes))
+    try:
+        box_iou.set_iou_backend("cython")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Geçersiz IoU backend'i kabul edildi")
+    box_iou.set_iou_backend("auto")
+    print(f"Backend seçimi: tamam (auto → {box_iou.get_iou_backend()})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="IoU çekirdeklerinin cython_bbox ile eşdeğerlik kontrolü")
+    parser.add_argument("--sizes", default="1,7,60,200", help="Virgülle ayrılmış rastgele kutu sayıları")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    kernels = get_kernels()
+    print("IoU Çekirdeği Eşdeğerlik Kontrolü")
+    print("=" * 48)
+    check_edge_cases(kernels)
+    check_against_reference(kernels, [int(v) for v in args.sizes.split(",")], args.seed)
+    check_backend_selection()
+    print("\nTüm kontroller geçti")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
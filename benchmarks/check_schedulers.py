@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Tespit Planı Kontrolü (ROI / Keyframe)
+Sentetik sahnede ROI ve keyframe planlarının, sekans ortasında beliren yeni bir
+balonu onaylı track'e dönüştürdüğünü doğrular; başarısız olursa AssertionError
+ile (sıfırdan farklı çıkış koduyla) biter
+
+Kullanım:
+    python benchmarks/check_schedulers.py
+    python benchmarks/check_schedulers.py --frames 150 --appear 40
+
+Notlar:
+- Sahne: dokulu (veya düz) sabit arka plan üzerinde düz renkli daire balonlar;
+  ilk balon baştan beri var, ikincisi --appear frame'inde belirir. Düz sahnede
+  balonlar büyütülür; kutu içindeki noktaların LK penceresi kenara ulaşmaz ve
+  optik akış ölçülemez - keyframe planı Kalman tahminine düşmelidir
+- Detector gerçek kutuları döndürür (ROI kırpımlarında kırpım koordinatlarında,
+  kırpım kenarının kestiği kutular kesik halde); model gerekmez
+- Track stage'in zamanlayıcıya yayınladığı track bilgisi pipeline ile aynı
+  şekilde hazırlanır (onaylı + onaysız track'ler)
+- Her plan object ve soa tracker çekirdekleriyle çalıştırılır; keyframe planı
+  akış açık / kapalı denenir ve keyframe oranı da kontrol edilir
+- Tam tespit oranı: ROI planında tam frame, keyframe planında keyframe sayısı / frame
+"""
+
+import os
+import sys
+import argparse
+from types import SimpleNamespace
+
+import cv2
+import numpy as np
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from OC_SORT.trackers.byte_tracker import BYTETracker, SoABYTETracker
+from OC_SORT.trackers.byte_tracker.basetrack import TrackState
+from src.core.detectors.base_detector import Detector, empty_detections
+from src.core.detectors.roi_scheduler import TrackGuidedScheduler
+from src.core.detectors.keyframe_scheduler import KeyframeScheduler
+
+FRAME_W, FRAME_H = 1280, 720
+# Yeni balon belirdikten sonra onaylı track olması için tanınan süre (frame)
+CONFIRM_FRAMES = 5
+# Keyframe planında izin verilen en yüksek keyframe oranı
+MAX_KEYFRAME_RATIO = 0.6
+
+
+class Scene:
+    """Sabit hızla hareket eden daire balonlar + dokulu (veya düz) sabit arka plan"""
+
+    def __init__(self, appear_frame, textured=True, seed=0):
+        if textured:
+            rng = np.random.default_rng(seed)
+            noise = rng.integers(0, 255, (FRAME_H // 8, FRAME_W // 8, 3), dtype=np.uint8)
+            self.background = cv2.resize(noise, (FRAME_W, FRAME_H), interpolation=cv2.INTER_LINEAR)
+        else:
+            self.background = np.full((FRAME_H, FRAME_W, 3), 128, dtype=np.uint8)
+        radius_scale = 1 if textured else 5
+        # (başlangıç frame'i, x, y, vx, vy, yarıçap, renk)
+        self.balloons = [(0, 300.0, 300.0, 3.0, 1.0, 28 * radius_scale, (40, 40, 220)),
+                         (appear_frame, 900.0, 420.0, -2.0, -0.5, 24 * radius_scale, (220, 60, 40))]
+
+    def boxes(self, frame_index):
+        """Görünen balonların gerçek kutuları: [(balon no, x1, y1, x2, y2), ...]"""
+        result = []
+        for n, (start, x, y, vx, vy, r, _) in enumerate(self.balloons):
+            if frame_index >= start:
+                cx, cy = x + vx * (frame_index - start), y + vy * (frame_index - start)
+                result.append((n, cx - r, cy - r, cx + r, cy + r))
+        return result
+
+    def render(self, frame_index):
+        frame = self.background.copy()
+        for n, x1, y1, x2, y2 in self.boxes(frame_index):
+            center = (int(round((x1 + x2) / 2)), int(round((y1 + y2) / 2)))
+            cv2.circle(frame, center, int((x2 - x1) / 2), self.balloons[n][6], -1, cv2.LINE_AA)
+        return frame
+
+
+class GroundTruthDetector(Detector):
+    """Sahnenin gerçek kutularını döndüren detector (kırpımlar frame'e göre konumlanır)"""
+
+    name = "ground_truth"
+    dynamic_input = True
+
+    def __init__(self, scene):
+        super().__init__(640, 0.7)
+        self.scene = scene
+        self.frame = None
+        self.frame_index = 0
+
+    def detect(self, frame, conf):
+        return self._detect_view(frame)
+
+    def detect_batch(self, frames, conf, input_size=None):
+        return [self._detect_view(view) for view in frames]
+
+    def _detect_view(self, view):
+        # Kırpımın frame içindeki konumu (view, self.frame'in dilimi)
+        offset = view.__array_interface__["data"][0] - self.frame.__array_interface__["data"][0]
+        y0, x0 = offset // self.frame.strides[0], (offset % self.frame.strides[0]) // self.frame.strides[1]
+        h, w = view.shape[:2]
+        boxes = []
+        for _, x1, y1, x2, y2 in self.scene.boxes(self.frame_index):
+            bx1, by1 = max(x1 - x0, 0.0), max(y1 - y0, 0.0)
+            bx2, by2 = min(x2 - x0, float(w)), min(y2 - y0, float(h))
+            if bx2 - bx1 > 4 and by2 - by1 > 4:
+                boxes.append([bx1, by1, bx2, by2, 0.9])
+        return np.array(boxes, dtype=np.float32) if boxes else empty_detections()
+
+
+def publish_tracks(scheduler, tracker, frame_index):
+    """Track stage ile aynı: onaylı ve onaysız track'lerin Kalman state'leri"""
+    tracked = [t for t in tracker.tracked_stracks if t.mean is not None]
+    confirmed = [t for t in tracked if t.is_activated]
+    tentative = [t for t in tracked if not t.is_activated]
+    lost_count = len([t for t in tracker.lost_stracks if t.state != TrackState.Removed])
+    scheduler.update_tracks([t.mean for t in confirmed], frame_index, lost_count,
+                            scores=[t.score for t in confirmed],
+                            tentative_means=[t.mean for t in tentative])
+
+
+def box_iou(a, b):
+    iw = min(a[2], b[2]) - max(a[0], b[0])
+    ih = min(a[3], b[3]) - max(a[1], b[1])
+    if iw <= 0 or ih <= 0:
+        return 0.0
+    inter = iw * ih
+    return inter / ((a[2] - a[0]) * (a[3] - a[1]) + (b[2] - b[0]) * (b[3] - b[1]) - inter)
+
+
+def run(scheduler_name, tracker_class, frames, appear, use_flow=False, textured=True):
+    """
+    Returns:
+        (ilk onay frame'i veya None, tam tespit oranı, akışın ölçülemediği kutu sayısı)
+    """
+    scene = Scene(appear, textured)
+    detector = GroundTruthDetector(scene)
+    if scheduler_name == "roi":
+        scheduler = TrackGuidedScheduler(detector, full_frame_interval=10, margin=1.0, roi_size=256)
+    else:
+        scheduler = KeyframeScheduler(detector, min_interval=2, max_interval=8, use_flow=use_flow)
+    args = SimpleNamespace(track_thresh=0.5, track_buffer=30, match_thresh=0.8, mot20=False, motion_gating=False)
+    tracker = tracker_class(args, frame_rate=30)
+
+    confirmed_at = None
+    for frame_index in range(frames):
+        frame = scene.render(frame_index)
+        detector.frame, detector.frame_index = frame, frame_index
+        detections = scheduler.detect(frame, 0.5, frame_index)
+        tracker.update(np.asarray(detections, dtype=np.float64).reshape(-1, 5), (FRAME_H, FRAME_W),
+                       (FRAME_W, FRAME_H))
+        publish_tracks(scheduler, tracker, frame_index)
+
+        if frame_index >= appear and confirmed_at is None:
+            target = [b for b in scene.boxes(frame_index) if b[0] == 1][0][1:]
+            if any(t.is_activated and box_iou(t.tlbr, target) > 0.5 for t in tracker.tracked_stracks):
+                confirmed_at = frame_index
+    stats = scheduler.stats
+    full_passes = stats["full_frames"] if scheduler_name == "roi" else stats["keyframes"]
+    return confirmed_at, full_passes / frames, stats.get("flow_failures", 0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ROI / keyframe planlarında yeni hedef onay kontrolü")
+    parser.add_argument("--frames", type=int, default=100)
+    parser.add_argument("--appear", type=int, default=20, help="İkinci balonun belirdiği frame")
+    args = parser.parse_args()
+
+    print("Tespit Planı Kontrolü")
+    print("=" * 78)
+    print(f"{'Plan':<24}{'Çekirdek':<10}{'Onay (frame)':>14}{'Tam tespit':>14}{'Akış yok':>12}")
+    cases = [("roi", False, True), ("keyframe", False, True), ("keyframe", True, True), ("keyframe", True, False)]
+    for scheduler_name, use_flow, textured in cases:
+        label = scheduler_name + (" + akış" if use_flow else "") + ("" if textured else " (düz)")
+        for core, tracker_class in (("object", BYTETracker), ("soa", SoABYTETracker)):
+            confirmed_at, detect_ratio, flow_failures = run(
+                scheduler_name, tracker_class, args.frames, args.appear, use_flow, textured)
+            delay = None if confirmed_at is None else confirmed_at - args.appear
+            print(f"{label:<24}{core:<10}{str(delay):>14}{detect_ratio:>14.2f}{flow_failures:>12}")
+            assert delay is not None and delay <= CONFIRM_FRAMES, \
+                f"{label} / {core}: yeni balon {CONFIRM_FRAMES} frame içinde onaylanmadı ({delay})"
+            if not textured:
+                assert flow_failures > 0, f"{label} / {core}: düz sahnede akış hiç başarısız olmadı"
+            if scheduler_name == "keyframe":
+                assert detect_ratio <= MAX_KEYFRAME_RATIO, \
+                    f"{label} / {core}: keyframe oranı {detect_ratio:.2f} > {MAX_KEYFRAME_RATIO}"
+
+    print("\nTüm kontroller geçti")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
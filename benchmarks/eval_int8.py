@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+INT8 vs Float Karşılaştırma
+Float ve INT8 ONNX modellerini etiketli doğrulama setinde çalıştırıp
+mAP ve frame başına süre farkını raporlar
+
+Kullanım:
+    python benchmarks/eval_int8.py
+    python benchmarks/eval_int8.py --data balloon-dataset/data.yaml --calib data/recordings
+    python benchmarks/eval_int8.py --data balloon-dataset/images/val --rebuild
+    python benchmarks/eval_int8.py --build-only --calib data/recordings
+
+Notlar:
+- --data: eğitim args.yaml'ı (içindeki data: anahtarı kullanılır), data.yaml veya resim klasörü
+- Etiketler YOLO formatında, resimlerin yanındaki labels/ klasöründen okunur
+  (.../images/val/x.jpg → .../labels/val/x.txt)
+- Detector çıktısı sınıfsız olduğu için mAP sınıftan bağımsız hesaplanır
+- INT8 model yoksa (veya --rebuild) --calib klasöründeki kayıtlardan üretilir
+- --build-only: sadece INT8 modeli üretir (doğrulama seti gerekmez). Uygulama açılışta
+  quantization yapmaz, DETECTOR_INT8 sadece bu şekilde üretilmiş modeli kullanır
+- Süreler sadece inference + son işlemi içerir (resim okuma hariç)
+"""
+
+import os
+import sys
+import time
+import argparse
+
+import cv2
+import numpy as np
+import yaml
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from src.core.detectors.detector_factory import export_model, build_int8_model
+from src.core.detectors.onnx_detector import OnnxRuntimeDetector
+from src.core.detectors.quantization import IMAGE_EXTENSIONS, get_int8_path, is_int8_fresh
+from src.utils.config import config
+
+DEFAULT_ARGS_YAML = os.path.join(ROOT_DIR, "runs", "detect", "yolov8_balloon", "args.yaml")
+IOU_THRESHOLDS = np.linspace(0.5, 0.95, 10)
+
+
+def resolve_image_dir(data, split):
+    """args.yaml / data.yaml / klasör → doğrulama resim klasörü"""
+    if os.path.isdir(data):
+        return data
+    with open(data, "r", encoding="utf-8") as f:
+        spec = yaml.safe_load(f)
+    if "data" in spec and "task" in spec:
+        # Eğitim args.yaml'ı - veri seti tanımına yönlendir
+        return resolve_image_dir(spec["data"], split)
+
+    base = spec.get("path") or os.path.dirname(os.path.abspath(data))
+    if not os.path.isabs(base):
+        base = os.path.join(os.path.dirname(os.path.abspath(data)), base)
+    entry = spec.get(split) or spec.get("val")
+    entry = entry[0] if isinstance(entry, list) else entry
+    return entry if os.path.isabs(entry) else os.path.join(base, entry)
+
+
+def label_path_for(image_path):
+    """YOLO düzeni: /images/ → /labels/, uzantı → .txt"""
+    head, sep, tail = image_path.replace("\\", "/").rpartition("/images/")
+    label = (head + "/labels/" + tail) if sep else image_path
+    return os.path.splitext(label)[0] + ".txt"
+
+
+def load_dataset(image_dir):
+    """
+    Returns:
+        list: (resim yolu, Mx4 xyxy piksel GT kutuları)
+    """
+    samples = []
+    for root, _, files in os.walk(image_dir):
+        for name in sorted(files):
+            if os.path.splitext(name)[1].lower() not in IMAGE_EXTENSIONS:
+                continue
+            image_path = os.path.join(root, name)
+            image = cv2.imread(image_path)
+            if image is None:
+                continue
+            h, w = image.shape[:2]
+            boxes = np.zeros((0, 4))
+            label_path = label_path_for(image_path)
+            if os.path.exists(label_path):
+                rows = np.loadtxt(label_path, ndmin=2)
+                if rows.size:
+                    cx, cy, bw, bh = rows[:, 1] * w, rows[:, 2] * h, rows[:, 3] * w, rows[:, 4] * h
+                    boxes = np.stack([cx - bw / 2, cy - bh / 2, cx + bw / 2, cy + bh / 2], axis=1)
+            samples.append((image_path, boxes))
+    return samples
+
+
+def box_iou(a, b):
+    """a: Nx4, b: Mx4 → NxM IoU"""
+    x1 = np.maximum(a[:, None, 0], b[None, :, 0])
+    y1 = np.maximum(a[:, None, 1], b[None, :, 1])
+    x2 = np.minimum(a[:, None, 2], b[None, :, 2])
+    y2 = np.minimum(a[:, None, 3], b[None, :, 3])
+    inter = np.clip(x2 - x1, 0, None) * np.clip(y2 - y1, 0, None)
+    area_a = (a[:, 2] - a[:, 0]) * (a[:, 3] - a[:, 1])
+    area_b = (b[:, 2] - b[:, 0]) * (b[:, 3] - b[:, 1])
+    return inter / np.maximum(area_a[:, None] + area_b[None, :] - inter, 1e-9)
+
+
+def match_detections(detections, gt_boxes):
+    """
+    Skora göre sıralı açgözlü eşleştirme, her IoU eşiği için
+
+    Returns:
+        (scores, tp): N skor ve Nx10 doğru-pozitif matrisi
+    """
+    order = np.argsort(-detections[:, 4])
+    detections = detections[order]
+    tp = np.zeros((len(detections), len(IOU_THRESHOLDS)), dtype=bool)
+    if len(detections) and len(gt_boxes):
+        iou = box_iou(detections[:, :4].astype(np.float64), gt_boxes)
+        for t, threshold in enumerate(IOU_THRESHOLDS):
+            matched = np.zeros(len(gt_boxes), dtype=bool)
+            for i in range(len(detections)):
+                candidates = np.where(~matched & (iou[i] >= threshold), iou[i], -1.0)
+                best = int(candidates.argmax())
+                if candidates[best] >= 0:
+                    matched[best] = True
+                    tp[i, t] = True
+    return detections[:, 4], tp
+
+
+def average_precision(scores, tp, n_gt):
+    """101 noktalı interpolasyonlu AP (IoU eşiği başına)"""
+    if n_gt == 0 or len(scores) == 0:
+        return np.zeros(tp.shape[1])
+    order = np.argsort(-scores)
+    tp = tp[order]
+    ctp = np.cumsum(tp, axis=0)
+    cfp = np.cumsum(~tp, axis=0)
+    x = np.linspace(0, 1, 101)
+    ap = np.zeros(tp.shape[1])
+    for t in range(tp.shape[1]):
+        recall = np.concatenate([[0.0], ctp[:, t] / n_gt, [1.0]])
+        precision = np.concatenate([[1.0], ctp[:, t] / (ctp[:, t] + cfp[:, t]), [0.0]])
+        precision = np.flip(np.maximum.accumulate(np.flip(precision)))
+        y = np.interp(x, recall, precision)
+        ap[t] = np.sum((y[1:] + y[:-1]) * np.diff(x) / 2)
+    return ap
+
+
+def evaluate(detector, samples, conf):
+    """Returns: (mAP50, mAP50-95, ortalama ms)"""
+    all_scores, all_tp, timings = [], [], []
+    n_gt = 0
+    for image_path, gt_boxes in samples:
+        image = cv2.imread(image_path)
+        start = time.perf_counter()
+        detections = detector.detect(image, conf)
+        timings.append((time.perf_counter() - start) * 1000.0)
+        scores, tp = match_detections(detections, gt_boxes)
+        all_scores.append(scores)
+        all_tp.append(tp)
+        n_gt += len(gt_boxes)
+    ap = average_precision(np.concatenate(all_scores), np.concatenate(all_tp), n_gt)
+    return ap[0], ap.mean(), float(np.mean(timings))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="INT8 vs float doğruluk / hız karşılaştırması")
+    parser.add_argument("--data", default=DEFAULT_ARGS_YAML, help="args.yaml, data.yaml veya resim klasörü")
+    parser.add_argument("--split", default="val")
+    parser.add_argument("--model", default=None, help=".pt model (varsayılan: config)")
+    parser.add_argument("--calib", default=config.int8_calibration_dir, help="Kalibrasyon kayıtları klasörü")
+    parser.add_argument("--calib-frames", type=int, default=config.int8_calibration_frames)
+    parser.add_argument("--rebuild", action="store_true", help="INT8 modeli yeniden üret")
+    parser.add_argument("--build-only", action="store_true", help="Sadece INT8 modeli üret, karşılaştırma yapma")
+    parser.add_argument("--conf", type=float, default=0.001, help="mAP için düşük eşik")
+    parser.add_argument("--threads", type=int, default=config.detector_threads)
+    args = parser.parse_args()
+
+    model_path = args.model or config.get_balloon_custom_model_path()
+    if args.build_only:
+        onnx_path = export_model(model_path, "onnx")
+        if args.rebuild or not is_int8_fresh(onnx_path):
+            try:
+                build_int8_model(model_path, calibration_dir=args.calib, max_frames=args.calib_frames)
+            except ValueError:
+                print(f"Kalibrasyon kaydı bulunamadı: {args.calib}")
+                return 1
+        print(f"INT8 model: {get_int8_path(onnx_path)}")
+        return 0
+
+    image_dir = resolve_image_dir(args.data, args.split)
+    if not os.path.isdir(image_dir):
+        print(f"Doğrulama klasörü bulunamadı: {image_dir} (--data ile belirtin)")
+        return 1
+    samples = load_dataset(image_dir)
+    if not samples:
+        print(f"Doğrulama klasöründe resim yok: {image_dir}")
+        return 1
+
+    onnx_path = export_model(model_path, "onnx")
+    int8_path = get_int8_path(onnx_path)
+    if args.rebuild or not is_int8_fresh(onnx_path):
+        try:
+            build_int8_model(model_path, calibration_dir=args.calib, max_frames=args.calib_frames)
+        except ValueError:
+            print(f"Kalibrasyon kaydı bulunamadı: {args.calib}")
+            return 1
+
+    print("INT8 vs Float Karşılaştırma")
+    print("=" * 64)
+    print(f"Model: {model_path}")
+    print(f"Doğrulama: {image_dir} ({len(samples)} resim, {sum(len(b) for _, b in samples)} kutu)\n")
+    print(f"{'Model':<10}{'mAP50':>10}{'mAP50-95':>12}{'ms/frame':>12}")
+
+    results = {}
+    for label, path in (("float", onnx_path), ("int8", int8_path)):
+        detector = OnnxRuntimeDetector(path, config.detector_iou_threshold, threads=args.threads)
+        detector.warmup(iterations=3, shape=cv2.imread(samples[0][0]).shape)
+        results[label] = evaluate(detector, samples, args.conf)
+        map50, map5095, ms = results[label]
+        print(f"{label:<10}{map50:>10.4f}{map5095:>12.4f}{ms:>12.2f}")
+
+    (f50, f5095, fms), (q50, q5095, qms) = results["float"], results["int8"]
+    print(f"{'fark':<10}{q50 - f50:>+10.4f}{q5095 - f5095:>+12.4f}{qms - fms:>+12.2f}")
+    print(f"\nINT8 hızlanma: {fms / qms:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
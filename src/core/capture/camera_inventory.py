@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Camera Inventory
+----------------
+Background camera enumeration with a persisted device inventory.
+Devices are probed in parallel (one thread per index), the last known-good
+list is saved to disk so the GUI can show it instantly at startup, and the
+first validated device can be kept open and handed straight to the tracking
+pipeline.
+"""
+
+import os
+import json
+import time
+import threading
+from datetime import datetime
+
+from src.core.capture.camera_source import CameraSource
+from src.utils.config import config
+from src.utils.logger import logger
+
+
+class CameraInventory:
+    """
+    Cached list of working cameras.
+
+    Entries are dicts: index, backend, fourcc, width, height, fps, modes,
+    last_seen. Implements the Singleton pattern like Config.
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(CameraInventory, cls).__new__(cls)
+            cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self):
+        self.path = config.camera_inventory_file
+        self.devices = []
+        self._lock = threading.Lock()
+        self._open_sources = {}     # index -> açık CameraSource (pipeline'a devredilecek)
+        self._scans_running = 0     # Devam eden tarama sayısı (take_open bitmesini bekler)
+        self._scan_idle = threading.Condition(self._lock)
+        self.load()
+
+    # ------------------------------------------------------------------
+    # Kalıcı envanter
+    # ------------------------------------------------------------------
+
+    def load(self):
+        """Diskteki son geçerli envanteri yükle"""
+        if not os.path.exists(self.path):
+            return []
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            with self._lock:
+                self.devices = [d for d in data.get("devices", []) if isinstance(d.get("index"), int)]
+            logger.debug(f"📷 Kamera envanteri yüklendi: {[d['index'] for d in self.devices]}")
+        except Exception as e:
+            logger.warning(f"⚠️ Kamera envanteri okunamadı: {e}")
+        return self.get_indices()
+
+    def save(self):
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with self._lock:
+                data = {"updated": datetime.now().isoformat(timespec="seconds"), "devices": self.devices}
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.warning(f"⚠️ Kamera envanteri kaydedilemedi: {e}")
+
+    def get_indices(self):
+        with self._lock:
+            return [d["index"] for d in self.devices]
+
+    def get_device(self, index):
+        with self._lock:
+            for device in self.devices:
+                if device["index"] == index:
+                    return dict(device)
+        return None
+
+    # ------------------------------------------------------------------
+    # Tarama
+    # ------------------------------------------------------------------
+
+    def scan(self, max_devices=3, in_use=(), keep_first_open=None, timeout=None):
+        """
+        Kameraları paralel tara ve envanteri güncelle (bloklar - arka plan thread'inden çağrılır)
+
+        Args:
+            max_devices: Denenecek index sayısı
+            in_use: Şu an pipeline tarafından kullanılan index'ler (açılmaz, envanterde kalır).
+                    Önceki taramadan açık tutulan kameralar da her zaman bu şekilde atlanır.
+            keep_first_open: İlk çalışan kamera açık bırakılsın mı (None = config)
+            timeout: Cihaz başına maksimum süre (None = config)
+
+        Returns:
+            list: Çalışan kamera index'leri
+        """
+        keep_first_open = config.camera_keep_probed_open if keep_first_open is None else keep_first_open
+        timeout = timeout or config.camera_open_check_timeout_seconds
+        with self._lock:
+            self._scans_running += 1
+        try:
+            return self._scan(max_devices, in_use, keep_first_open, timeout)
+        finally:
+            with self._scan_idle:
+                self._scans_running -= 1
+                self._scan_idle.notify_all()
+
+    def _scan(self, max_devices, in_use, keep_first_open, timeout):
+        start = time.monotonic()
+        with self._lock:
+            stale = {i: c for i, c in self._open_sources.items() if c.cap is None or not c.cap.isOpened()}
+            for index in stale:
+                del self._open_sources[index]
+            # Açık tutulan cihazı tekrar açmak V4L2'de EBUSY ile başarısız olur ve cihaz envanterden düşerdi
+            held_open = set(self._open_sources)
+        for camera in stale.values():
+            camera.release()
+        skipped = set(in_use) | held_open
+
+        results = {}
+        scan_state = {"done": False, "lock": threading.Lock()}
+        threads = []
+        for index in range(max_devices):
+            if index in skipped:
+                continue
+            thread = threading.Thread(target=self._probe_into, args=(index, results, scan_state),
+                                      name=f"CameraProbe-{index}")
+            thread.daemon = True  # Takılan sürücü uygulama kapanışını engellemesin
+            thread.start()
+            threads.append(thread)
+
+        deadline = time.monotonic() + timeout
+        for thread in threads:
+            thread.join(max(0.0, deadline - time.monotonic()))
+            if thread.is_alive():
+                logger.warning(f"⚠️ {thread.name} zaman aşımı ({timeout:.0f} s)")
+        with scan_state["lock"]:
+            scan_state["done"] = True
+            results = dict(results)
+
+        with self._lock:
+            previous = {d["index"]: d for d in self.devices}
+        found = []
+        for index in range(max_devices):
+            if index in skipped and index in previous:
+                found.append(previous[index])
+            elif index in results:
+                found.append(results[index][0])
+
+        # Açık bırakılan kaynaklar: sadece ilk çalışan kamera tutulur
+        kept = bool(held_open)
+        for index in sorted(results):
+            camera = results[index][1]
+            if keep_first_open and not kept and camera is not None:
+                with self._lock:
+                    self._open_sources[index] = camera
+                kept = True
+            elif camera is not None:
+                camera.release()
+
+        with self._lock:
+            self.devices = found
+        self.save()
+
+        indices = [d["index"] for d in found]
+        logger.info(f"📷 Kamera taraması tamamlandı: {indices} ({(time.monotonic() - start) * 1000:.0f} ms)")
+        return indices
+
+    def _probe_into(self, index, results, scan_state):
+        entry, camera = self.probe_device(index)
+        if entry is None:
+            return
+        with scan_state["lock"]:
+            if not scan_state["done"]:
+                results[index] = (entry, camera)
+                return
+        # Tarama zaman aşımıyla bitti - geç açılan kamerayı tutma
+        if camera is not None:
+            camera.release()
+
+    def probe_device(self, index):
+        """
+        Tek bir kamerayı aç, bir frame oku ve ayarlarını kaydet
+
+        Returns:
+            (entry, CameraSource) veya (None, None)
+        """
+        camera = CameraSource(index)
+        try:
+            if not camera.open(log_failures=False):
+                return None, None
+            ret, _ = camera.cap.read()
+            if not ret:
+                camera.release()
+                return None, None
+            modes = camera.modes
+            if not modes and config.camera_inventory_probe_modes:
+                modes = camera.probe_modes()
+            n = camera.negotiated
+            entry = {
+                "index": index,
+                "backend": n["backend"],
+                "fourcc": n["fourcc"],
+                "width": n["width"],
+                "height": n["height"],
+                "fps": n["fps"],
+                "modes": modes,
+                "last_seen": datetime.now().isoformat(timespec="seconds"),
+            }
+            logger.info(f"✅ Kamera {index} bulundu - {n['backend']} {n['fourcc']} "
+                        f"{n['width']}x{n['height']}@{n['fps']:.0f}")
+            return entry, camera
+        except Exception as e:
+            logger.debug(f"Kamera {index} kontrol hatası: {e}")
+            camera.release()
+            return None, None
+
+    # ------------------------------------------------------------------
+    # Açık kaynak devri
+    # ------------------------------------------------------------------
+
+    def take_open(self, index, timeout=None):
+        """
+        Tarama sırasında açık bırakılmış kamerayı devral.
+        Devam eden tarama varsa önce bitmesi beklenir - probe thread'inin tuttuğu cihaz
+        pipeline tarafından ikinci kez açılmasın.
+
+        Args:
+            timeout: Taramayı bekleme süresi (None = config)
+
+        Returns:
+            CameraSource veya None (açık kaynak yok / kapanmış)
+        """
+        timeout = timeout or config.camera_open_check_timeout_seconds
+        with self._scan_idle:
+            if self._scans_running and not self._scan_idle.wait_for(lambda: self._scans_running == 0, timeout):
+                logger.warning(f"⚠️ Kamera taraması {timeout:.0f} s içinde bitmedi - kamera {index} yeniden açılacak")
+            camera = self._open_sources.pop(index, None)
+        if camera is None:
+            return None
+        if camera.cap is None or not camera.cap.isOpened():
+            camera.release()
+            return None
+        logger.info(f"⚡ Kamera {index} taramadan açık devralındı")
+        return camera
+
+    def release_all(self):
+        """Devralınmamış açık kaynakları kapat"""
+        with self._lock:
+            sources, self._open_sources = self._open_sources, {}
+        for camera in sources.values():
+            camera.release()
+
+
+camera_inventory = CameraInventory()
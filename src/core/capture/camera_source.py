@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Camera Source
+-------------
+Cross-platform capture backend layer.
+Picks the capture backend per OS (V4L2 on Linux, DirectShow/MSMF on Windows,
+AVFoundation on macOS), applies the camera settings from config, reads them
+back and reports the format/fps the driver actually negotiated.
+"""
+
+import sys
+import time
+
+import cv2
+
+from src.utils.config import config
+from src.utils.logger import logger
+
+
+BACKENDS = {
+    "any": cv2.CAP_ANY,
+    "v4l2": cv2.CAP_V4L2,
+    "dshow": cv2.CAP_DSHOW,
+    "msmf": cv2.CAP_MSMF,
+    "avfoundation": cv2.CAP_AVFOUNDATION,
+    "ffmpeg": cv2.CAP_FFMPEG,
+}
+
+# probe_modes() için denenecek yaygın modlar
+PROBE_RESOLUTIONS = [(640, 480), (1280, 720), (1920, 1080)]
+PROBE_FOURCCS = ["MJPG", "YUYV"]
+
+
+def default_backends(source=0):
+    """
+    Backend preference list for a source on this platform.
+
+    Args:
+        source: Kamera index'i (int) veya dosya/URL (str)
+
+    Returns:
+        list: Denenecek (ad, cv2 backend sabiti) çiftleri
+    """
+    if isinstance(source, str):
+        return [("any", cv2.CAP_ANY)]
+
+    name = config.camera_backend
+    if name != "auto":
+        if name not in BACKENDS:
+            logger.warning(f"⚠️ Bilinmeyen kamera backend'i: {name}, otomatik seçilecek")
+        else:
+            return [(name, BACKENDS[name]), ("any", cv2.CAP_ANY)]
+
+    if sys.platform.startswith("linux"):
+        names = ["v4l2"]
+    elif sys.platform == "win32":
+        names = ["dshow", "msmf"] if config.use_directshow_backend else ["msmf", "dshow"]
+    elif sys.platform == "darwin":
+        names = ["avfoundation"]
+    else:
+        names = []
+    return [(n, BACKENDS[n]) for n in names] + [("any", cv2.CAP_ANY)]
+
+
+def fourcc_to_str(value):
+    """CAP_PROP_FOURCC değerini 'MJPG' gibi 4 karakterlik koda çevir"""
+    code = int(value)
+    if code <= 0:
+        return ""
+    return "".join(chr((code >> (8 * i)) & 0xFF) for i in range(4)).strip("\x00 ")
+
+
+class CameraSource:
+    """
+    Opened capture device with the camera config applied and verified.
+
+    Settings are applied in the order V4L2 needs (fourcc → resolution → fps →
+    buffer size), every setting is read back and mismatches are logged as
+    warnings, so a camera that silently fell back to e.g. YUYV at a low frame
+    rate is visible in the logs. `negotiated` holds what the driver accepted.
+    """
+
+    def __init__(self, source, width=None, height=None, fps=None, fourcc=None, buffer_size=None):
+        """
+        Args:
+            source: Kamera index'i veya video dosyası/URL
+            width, height, fps, fourcc, buffer_size: None ise config değerleri kullanılır
+        """
+        self.source = source
+        self.width = width or config.camera_width
+        self.height = height or config.camera_height
+        self.fps = fps or config.camera_fps
+        self.fourcc = (fourcc or config.camera_fourcc or "").upper()
+        self.buffer_size = buffer_size if buffer_size is not None else config.camera_buffer_size
+
+        self.cap = None
+        self.backend_name = None
+        self.negotiated = {}
+        self.modes = []             # probe_modes() sonucu
+
+    @property
+    def is_device(self):
+        return isinstance(self.source, int)
+
+    def open(self, log_failures=True):
+        """
+        Open the source with the first working backend and apply settings.
+
+        Args:
+            log_failures: Açılamayan backend'ler için uyarı logla (tarama sırasında kapalı)
+
+        Returns:
+            bool: Kaynak açıldı mı
+        """
+        for name, backend in default_backends(self.source):
+            start = time.monotonic()
+            cap = cv2.VideoCapture(self.source, backend)
+            if cap.isOpened():
+                self.cap = cap
+                self.backend_name = name if name != "any" else (self._backend_name(cap) or "any")
+                logger.debug(f"Kamera {self.source} {self.backend_name} ile açıldı "
+                             f"({(time.monotonic() - start) * 1000:.0f} ms)")
+                break
+            cap.release()
+            if log_failures:
+                logger.warning(f"⚠️ {name.upper()} backend'i ile açılamadı, alternatif denenecek: {self.source}")
+
+        if self.cap is None:
+            if log_failures:
+                logger.error(f"❌ Kamera açılamadı: {self.source}")
+            return False
+
+        if self.is_device:
+            self.apply_settings()
+        self.negotiated = self.read_settings()
+        self._report()
+        if self.mismatches() and config.camera_probe_on_mismatch:
+            self.probe_modes()
+        return True
+
+    def apply_settings(self):
+        """Config'teki kamera ayarlarını uygula (sıra önemli: fourcc → çözünürlük → fps)"""
+        cap = self.cap
+        if self.fourcc:
+            cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*self.fourcc[:4].ljust(4)))
+        if self.width and self.height:
+            cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
+            cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
+        if config.force_fps_setting and self.fps:
+            cap.set(cv2.CAP_PROP_FPS, self.fps)
+        if self.buffer_size:
+            cap.set(cv2.CAP_PROP_BUFFERSIZE, self.buffer_size)
+        if not config.disable_auto_settings_on_startup:
+            self._apply_auto_settings()
+
+    def _apply_auto_settings(self):
+        """
+        Otomatik pozlama / beyaz dengesi ayarlarını config'e göre uygula
+
+        Hızlı başlatma için (DISABLE_AUTO_SETTINGS_ON_STARTUP) atlanır ve sürücü
+        varsayılanları kullanılır. V4L2'de otomatik pozlama karanlık ortamda
+        frame hızını düşürebilir.
+        """
+        auto_exposure, auto_white_balance = config.auto_exposure, config.auto_white_balance
+
+        # V4L2: 1 = manuel, 3 = aperture priority; DSHOW/MSMF: 0.25 = manuel, 0.75 = otomatik
+        if self.backend_name == "v4l2":
+            exposure_value = 3 if auto_exposure else 1
+        else:
+            exposure_value = 0.75 if auto_exposure else 0.25
+        if not self.cap.set(cv2.CAP_PROP_AUTO_EXPOSURE, exposure_value):
+            logger.debug("Kamera otomatik pozlama ayarını desteklemiyor")
+        if not self.cap.set(cv2.CAP_PROP_AUTO_WB, 1 if auto_white_balance else 0):
+            logger.debug("Kamera otomatik beyaz dengesi ayarını desteklemiyor")
+
+    def read_settings(self):
+        """Sürücünün gerçekte kabul ettiği format/çözünürlük/fps"""
+        cap = self.cap
+        return {
+            "backend": self.backend_name,
+            "fourcc": fourcc_to_str(cap.get(cv2.CAP_PROP_FOURCC)),
+            "width": int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            "height": int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            "fps": float(cap.get(cv2.CAP_PROP_FPS) or 0.0),
+            "buffer_size": int(cap.get(cv2.CAP_PROP_BUFFERSIZE) or 0),
+        }
+
+    def mismatches(self):
+        """
+        İstenen ile sürücünün kabul ettiği ayarlar arasındaki farklar
+
+        Returns:
+            list: (ayar, istenen, gerçekleşen) üçlüleri
+        """
+        if not self.is_device or not self.negotiated:
+            return []
+        n = self.negotiated
+        result = []
+        if self.fourcc and n["fourcc"] and n["fourcc"].upper() != self.fourcc:
+            result.append(("fourcc", self.fourcc, n["fourcc"]))
+        if self.width and self.height and (n["width"], n["height"]) != (self.width, self.height):
+            result.append(("resolution", f"{self.width}x{self.height}", f"{n['width']}x{n['height']}"))
+        if config.force_fps_setting and self.fps and n["fps"] and abs(n["fps"] - self.fps) > 0.5:
+            result.append(("fps", self.fps, n["fps"]))
+        return result
+
+    def _report(self):
+        n = self.negotiated
+        logger.info(f"📷 Kamera {self.source} [{n['backend']}] - {n['fourcc'] or '?'} "
+                    f"{n['width']}x{n['height']} @ {n['fps']:.1f} FPS")
+        for name, requested, actual in self.mismatches():
+            logger.warning(f"⚠️ Kamera ayarı uygulanamadı - {name}: istenen {requested}, gerçekleşen {actual}")
+
+    def probe_modes(self, resolutions=None, fourccs=None):
+        """
+        Cihazın desteklediği modları dene (set + geri okuma)
+
+        Her mod kısa süreliğine uygulanır; sonunda config ayarları yeniden
+        uygulanır. Açılış süresini uzattığı için sadece teşhis amaçlı çağrılır.
+
+        Returns:
+            list: Kabul edilen {fourcc, width, height, fps} modları
+        """
+        if self.cap is None or not self.is_device:
+            return []
+
+        modes = []
+        for fourcc in fourccs or PROBE_FOURCCS:
+            for width, height in resolutions or PROBE_RESOLUTIONS:
+                self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*fourcc))
+                self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+                self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+                self.cap.set(cv2.CAP_PROP_FPS, self.fps)
+                actual = self.read_settings()
+                if actual["fourcc"].upper() == fourcc and (actual["width"], actual["height"]) == (width, height):
+                    mode = {"fourcc": fourcc, "width": width, "height": height, "fps": actual["fps"]}
+                    if mode not in modes:
+                        modes.append(mode)
+
+        self.apply_settings()
+        self.negotiated = self.read_settings()
+        self.modes = modes
+        logger.info(f"📷 Kamera {self.source} desteklenen modlar: "
+                    + (", ".join(f"{m['fourcc']} {m['width']}x{m['height']}@{m['fps']:.0f}" for m in modes) or "yok"))
+        return modes
+
+    def release(self):
+        if self.cap is not None:
+            self.cap.release()
+            self.cap = None
+
+    @staticmethod
+    def _backend_name(cap):
+        try:
+            return cap.getBackendName().lower()
+        except Exception:
+            return None
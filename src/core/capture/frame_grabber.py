@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Latest Frame Grabber
+--------------------
+Dedicated capture thread that keeps only the newest camera frame.
+The tracking loop pulls from this slot instead of blocking on cap.read(),
+so inference time never turns into camera buffer queueing delay.
+Frames are decimated with grab()/retrieve(): skipped frames are only
+grabbed, so their (MJPEG) decode cost is never paid. In raw MJPEG mode
+frames are handed out undecoded (MjpegFrame) and decoded by the consumer.
+"""
+
+import time
+import threading
+
+from src.core.capture.mjpeg_decoder import MjpegFrame
+from src.utils.logger import logger
+
+
+class FramePacket:
+    """A captured frame with its monotonic capture time and sequence number."""
+
+    __slots__ = ("frame", "timestamp", "seq")
+
+    def __init__(self, frame, timestamp, seq):
+        self.frame = frame
+        self.timestamp = timestamp  # time.monotonic() at capture
+        self.seq = seq              # 1'den başlayan yakalama sırası
+
+    def age_ms(self):
+        """Milliseconds elapsed since the frame was captured."""
+        return (time.monotonic() - self.timestamp) * 1000.0
+
+
+class LatestFrameGrabber:
+    """
+    Latest-frame-wins capture thread.
+
+    The thread grabs frames as fast as the device delivers them and overwrites
+    a single slot. Frames that are overwritten before any consumer picked them
+    up are counted as dropped.
+
+    Decimation: only frames due at the target processing rate are decoded with
+    retrieve(); the others are just grabbed and counted as skipped. With
+    target_fps="auto" the rate follows how fast the consumer actually takes
+    frames, so frames that would be overwritten anyway are never decoded.
+    """
+
+    # Auto modda tüketici hızının üzerine bırakılan pay
+    AUTO_RATE_HEADROOM = 1.2
+
+    def __init__(self, cap, pace_fps=None, buffer_pool=None, target_fps=None, raw_mjpeg=False,
+                 name="FrameGrabber"):
+        """
+        Args:
+            cap: Opened cv2.VideoCapture
+            pace_fps: Video dosyaları için gerçek zamanlı okuma hızı (None = cihaz hızı)
+            buffer_pool: Opsiyonel FrameBufferPool - frame'ler retrieve(image=...) ile
+                         havuzdan alınan buffer'lara decode edilir
+            target_fps: Decode hedef hızı (None/0 = her frame, "auto" = tüketici hızı)
+            raw_mjpeg: Kamera ham JPEG döndürüyor - frame'ler MjpegFrame olarak verilir
+            name: Thread adı
+        """
+        self.cap = cap
+        self.pace_fps = pace_fps
+        self.raw_mjpeg = raw_mjpeg
+        # Ham JPEG boyutu frame'e göre değişir, havuz kullanılmaz
+        self.buffer_pool = buffer_pool if not raw_mjpeg else None
+        self.name = name
+        self._frame_shape = None
+
+        self.target_fps = None
+        self.set_target_fps(target_fps)
+        self._next_decode_time = 0.0
+        self._consumer_fps = 0.0
+        self._last_consume_time = None
+
+        self._condition = threading.Condition()
+        self._latest = None
+        self._latest_consumed = True
+        self._running = False
+        self._paused = False
+        self._thread = None
+        self.eof = False
+
+        # İstatistikler
+        self.frames_grabbed = 0     # Kameradan alınan tüm frame'ler
+        self.frames_captured = 0    # Decode edilen frame'ler
+        self.frames_skipped = 0     # Decode edilmeden atlanan frame'ler
+        self.frames_dropped = 0     # Decode edilip tüketilmeden üzerine yazılan frame'ler
+        self.frames_consumed = 0
+
+    def start(self):
+        """Start the capture thread."""
+        if self._running:
+            return
+        self._running = True
+        self.eof = False
+        self._thread = threading.Thread(target=self._capture_loop, name=self.name)
+        self._thread.daemon = True
+        self._thread.start()
+        logger.debug(f"📸 {self.name} başlatıldı")
+
+    def stop(self, timeout=1.0):
+        """Stop the capture thread and wake up any waiting consumer."""
+        self._running = False
+        with self._condition:
+            self._condition.notify_all()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=timeout)
+        self._thread = None
+
+        # Tüketilmemiş son frame'in buffer'ını havuza geri ver
+        with self._condition:
+            stale = self._latest if not self._latest_consumed else None
+            self._latest_consumed = True
+        if stale is not None:
+            self._release_frame(stale.frame)
+
+    def is_running(self):
+        return self._running and not self.eof
+
+    def pause(self):
+        """
+        Keep the device streaming but stop decoding and publishing frames.
+
+        The camera stays open and its buffer keeps being drained with grab(),
+        so resume() delivers a fresh frame on the next camera tick.
+        """
+        self._paused = True
+        with self._condition:
+            stale = self._latest if not self._latest_consumed else None
+            self._latest_consumed = True
+        if stale is not None:
+            self._release_frame(stale.frame)
+
+    def resume(self):
+        self._next_decode_time = 0.0
+        self._paused = False
+
+    def is_paused(self):
+        return self._paused
+
+    def set_target_fps(self, target_fps):
+        """
+        Change the decode rate at runtime.
+
+        Args:
+            target_fps: Hedef işleme hızı (None/0 = decimation yok, "auto" = tüketici hızı)
+        """
+        if isinstance(target_fps, str):
+            target_fps = "auto" if target_fps.lower() == "auto" else float(target_fps)
+        if target_fps != "auto" and (not target_fps or target_fps <= 0):
+            target_fps = None
+        self.target_fps = target_fps
+
+    def _decode_rate(self):
+        if self.target_fps == "auto":
+            if self._consumer_fps <= 0:
+                return None
+            return self._consumer_fps * self.AUTO_RATE_HEADROOM
+        return self.target_fps
+
+    def _should_decode(self, now):
+        """Grab edilen frame hedef hıza göre decode edilmeli mi?"""
+        rate = self._decode_rate()
+        if not rate:
+            return True
+        if now + 1e-3 < self._next_decode_time:
+            return False
+        period = 1.0 / rate
+        # Geride kalındıysa zamanlamayı şimdiye çek (burst decode yapma)
+        self._next_decode_time = max(self._next_decode_time + period, now)
+        return True
+
+    def _capture_loop(self):
+        period = 1.0 / self.pace_fps if self.pace_fps else 0.0
+        next_read_time = time.monotonic()
+
+        while self._running:
+            if period:
+                # Video dosyası: kamerayı taklit etmek için gerçek zamanlı oku
+                sleep_time = next_read_time - time.monotonic()
+                if sleep_time > 0:
+                    time.sleep(sleep_time)
+                next_read_time = max(next_read_time + period, time.monotonic() - period)
+
+            if not self.cap.grab():
+                logger.info(f"📸 {self.name}: kaynak sonlandı veya okunamadı")
+                break
+            self.frames_grabbed += 1
+
+            if self._paused or not self._should_decode(time.monotonic()):
+                # Decimation: decode maliyeti ödenmeden atla
+                self.frames_skipped += 1
+                continue
+
+            buffer = self._acquire_buffer()
+            if buffer is not None:
+                ret, frame = self.cap.retrieve(image=buffer)
+            else:
+                ret, frame = self.cap.retrieve()
+            if not ret or frame is None:
+                self._release_frame(buffer)
+                logger.debug(f"📸 {self.name}: frame decode edilemedi")
+                continue
+
+            if self.raw_mjpeg:
+                frame = MjpegFrame(frame)
+            elif buffer is not None and frame is not buffer:
+                # Çözünürlük değişti - OpenCV yeni dizi ayırdı, buffer'ı geri ver
+                self._release_frame(buffer)
+            self._frame_shape = frame.shape
+
+            timestamp = time.monotonic()
+            stale = None
+            with self._condition:
+                self.frames_captured += 1
+                if not self._latest_consumed:
+                    self.frames_dropped += 1
+                    stale = self._latest
+                self._latest = FramePacket(frame, timestamp, self.frames_grabbed)
+                self._latest_consumed = False
+                self._condition.notify_all()
+
+            if stale is not None:
+                self._release_frame(stale.frame)
+
+        with self._condition:
+            self.eof = True
+            self._condition.notify_all()
+
+    def _acquire_buffer(self):
+        if self.buffer_pool is None or self._frame_shape is None:
+            return None
+        return self.buffer_pool.acquire(self._frame_shape)
+
+    def _release_frame(self, frame):
+        if self.buffer_pool is not None and frame is not None:
+            self.buffer_pool.release(frame)
+
+    def read(self, timeout=1.0):
+        """
+        Wait for a frame newer than the last one returned and take it.
+
+        Args:
+            timeout: Maksimum bekleme süresi (saniye)
+
+        Returns:
+            FramePacket veya None (timeout / kaynak sonu)
+        """
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while self._latest_consumed:
+                if self.eof or not self._running:
+                    return None
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                self._condition.wait(remaining)
+
+            self._latest_consumed = True
+            self.frames_consumed += 1
+            self._update_consumer_rate()
+            return self._latest
+
+    def _update_consumer_rate(self):
+        now = time.monotonic()
+        if self._last_consume_time is not None:
+            interval = now - self._last_consume_time
+            if interval > 0:
+                fps = 1.0 / interval
+                self._consumer_fps = fps if self._consumer_fps == 0 else self._consumer_fps * 0.9 + fps * 0.1
+        self._last_consume_time = now
+
+    def get_stats(self):
+        """Capture counters for diagnostics."""
+        with self._condition:
+            grabbed = self.frames_grabbed
+            captured = self.frames_captured
+            skipped = self.frames_skipped
+            dropped = self.frames_dropped
+            consumed = self.frames_consumed
+        return {
+            "grabbed": grabbed,
+            "captured": captured,
+            "skipped": skipped,
+            "consumed": consumed,
+            "dropped": dropped,
+            "drop_ratio": dropped / captured if captured else 0.0,
+            "decode_rate": self._decode_rate() or 0.0,
+        }
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+MJPEG Decoder
+-------------
+Raw MJPEG capture and lazy, reduced-resolution JPEG decoding.
+With CAP_PROP_CONVERT_RGB disabled the camera backend hands out the raw
+JPEG buffer, so each consumer can decode at the scale it actually needs
+(IMREAD_REDUCED_COLOR_2/4/8) and frames dropped on the way are never
+decoded at all.
+"""
+
+import threading
+
+import cv2
+import numpy as np
+
+from src.utils.logger import logger
+
+
+# Ölçek -> imdecode bayrağı
+REDUCED_DECODE_FLAGS = {
+    1: cv2.IMREAD_COLOR,
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    8: cv2.IMREAD_REDUCED_COLOR_8,
+}
+
+# JPEG SOF (start of frame) marker'ları - boyut bilgisi bunlarda
+_SOF_MARKERS = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+
+
+def is_jpeg_buffer(data):
+    """True if the array looks like a raw JPEG bitstream (SOI marker)."""
+    if data is None or data.dtype != np.uint8:
+        return False
+    # Ham MJPEG tek satır (1xN) veya tek kanal vektör olarak gelir
+    if data.ndim == 3 and data.shape[2] != 1:
+        return False
+    flat = data.reshape(-1)
+    return flat.size >= 4 and flat[0] == 0xFF and flat[1] == 0xD8
+
+
+def jpeg_dimensions(data):
+    """
+    Read (width, height) from the JPEG header without decoding.
+
+    Returns:
+        (width, height) veya None (geçersiz/eksik header)
+    """
+    buf = data.reshape(-1)
+    size = buf.size
+    i = 2
+    while i + 9 < size:
+        if buf[i] != 0xFF:
+            i += 1
+            continue
+        marker = int(buf[i + 1])
+        if marker == 0xFF:
+            i += 1
+            continue
+        if marker in (0xD8, 0x01) or 0xD0 <= marker <= 0xD7:
+            i += 2
+            continue
+        length = (int(buf[i + 2]) << 8) | int(buf[i + 3])
+        if marker in _SOF_MARKERS:
+            height = (int(buf[i + 5]) << 8) | int(buf[i + 6])
+            width = (int(buf[i + 7]) << 8) | int(buf[i + 8])
+            return width, height
+        i += 2 + length
+    return None
+
+
+def choose_reduction(full_size, min_size):
+    """
+    Largest supported reduction whose output still covers min_size.
+
+    Args:
+        full_size: (width, height) tam çözünürlük
+        min_size: Uzun kenar için sayı veya (width, height) alt sınırı
+
+    Returns:
+        int: 1, 2, 4 veya 8
+    """
+    full_w, full_h = full_size
+    for scale in (8, 4, 2):
+        w, h = full_w // scale, full_h // scale
+        if isinstance(min_size, (tuple, list)):
+            if w >= min_size[0] and h >= min_size[1]:
+                return scale
+        elif max(w, h) >= min_size:
+            return scale
+    return 1
+
+
+class MjpegFrame:
+    """
+    Raw JPEG bitstream of one captured frame with per-scale decode cache.
+
+    decode() is thread safe; each scale is decoded at most once, so the
+    detector (reduced) and the display (larger) can share one frame.
+    """
+
+    __slots__ = ("data", "size", "_decoded", "_lock")
+
+    def __init__(self, data):
+        self.data = data
+        self.size = jpeg_dimensions(data)   # (width, height) tam çözünürlük
+        self._decoded = {}
+        self._lock = threading.Lock()
+
+    @property
+    def shape(self):
+        """Full-resolution frame shape (height, width, 3), like an ndarray."""
+        if self.size is None:
+            return None
+        return (self.size[1], self.size[0], 3)
+
+    def decode(self, scale=1):
+        """
+        Decode at 1/scale resolution (scale: 1, 2, 4, 8).
+
+        Returns:
+            BGR görüntü veya None (bozuk frame)
+        """
+        with self._lock:
+            image = self._decoded.get(scale)
+            if image is None:
+                image = cv2.imdecode(self.data, REDUCED_DECODE_FLAGS[scale])
+                if image is not None:
+                    self._decoded[scale] = image
+            return image
+
+
+def enable_raw_mjpeg(cap):
+    """
+    Switch an opened MJPG camera to raw bitstream output.
+
+    The first frame is used as a probe; if the backend still returns decoded
+    images the setting is reverted.
+
+    Returns:
+        bool: Ham MJPEG aktif mi
+    """
+    if not cap.set(cv2.CAP_PROP_CONVERT_RGB, 0):
+        logger.info("ℹ️ Kamera backend'i ham MJPEG çıkışını desteklemiyor")
+        return False
+    # V4L2 ham buffer'ı sadece format -1 iken döndürür
+    cap.set(cv2.CAP_PROP_FORMAT, -1)
+
+    ret, frame = cap.read()
+    if ret and is_jpeg_buffer(frame) and jpeg_dimensions(frame) is not None:
+        width, height = jpeg_dimensions(frame)
+        logger.info(f"📦 Ham MJPEG yakalama aktif - {width}x{height}, decode pipeline'da yapılacak")
+        return True
+
+    cap.set(cv2.CAP_PROP_CONVERT_RGB, 1)
+    logger.info("ℹ️ Ham MJPEG alınamadı - normal decode kullanılacak")
+    return False
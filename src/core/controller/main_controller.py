@@ -1,6 +1,9 @@
+import time
 import threading
 
-from src.core.trackers.bytetrack_tracker import run_bytetrack_tracking, stop_bytetrack_tracking, run_bytetrack_with_model
+from src.core.trackers.bytetrack_tracker import (
+    run_bytetrack_tracking, stop_bytetrack_tracking, run_bytetrack_with_model, ByteTrackPipeline
+)
 from src.services.motor_pan_tilt_service import MotorPanTiltService
 from src.utils.config import config
 from src.utils.logger import logger
@@ -13,6 +16,10 @@ class MainController:
         self.current_algorithm = "bytetrack"  # Artık sadece temizlenmiş ByteTrack+
         self.gui = gui_reference
         
+        # Sıcak pipeline - tracking durdurulunca kamera/model/kalibrasyon açık kalır
+        self.pipeline = None
+        self.pipeline_stop_event = threading.Event()
+        
         # Motor kontrol sistemi
         self.motor_controller = MotorPanTiltService()
         self.motor_enabled = False
@@ -24,7 +31,8 @@ class MainController:
 
     def start_video(self, source, model_path, algorithm="bytetrack", confidence_threshold=0.5):
         logger.info(f"▶️ Video tracking başlatılıyor - Kaynak: {source}, Model: {model_path}, Confidence: {confidence_threshold}")
-        self.stop_video()
+        # Bu yol kamerayı kendisi açar - sıcak pipeline duraklatılmakla kalmamalı, kapatılmalı
+        self.stop_video(keep_warm=False)
         
         # Artık sadece temizlenmiş ByteTracker kullanıyoruz
         self.current_algorithm = "bytetrack"
@@ -38,28 +46,90 @@ class MainController:
     def start_video_with_model(self, source, loaded_model, algorithm="bytetrack", confidence_threshold=0.5):
         """Preloaded model ile hızlı başlatma"""
         logger.info(f"⚡ Hızlı tracking başlatılıyor - Kaynak: {source}, Confidence: {confidence_threshold}")
+        # Motor controller'ı motor enabled ise geç
+        motor_ctrl = self.motor_controller if self.motor_enabled else None
+        
+        if config.keep_pipeline_warm:
+            if self._resume_warm_pipeline(source, loaded_model, confidence_threshold, motor_ctrl):
+                return
+            self.stop_video(keep_warm=False)
+            self._start_warm_pipeline(source, loaded_model, confidence_threshold, motor_ctrl)
+            return
+        
         self.stop_video()
         
         self.current_algorithm = "bytetrack"
         def run():
-            # Motor controller'ı motor enabled ise geç
-            motor_ctrl = self.motor_controller if self.motor_enabled else None
             run_bytetrack_with_model(source, loaded_model, self.video_display, confidence_threshold, motor_ctrl)
 
         self.running_thread = threading.Thread(target=run)
         self.running_thread.daemon = True
         self.running_thread.start()
 
-    def stop_video(self):
+    def _start_warm_pipeline(self, source, loaded_model, confidence_threshold, motor_ctrl):
+        """Uzun ömürlü pipeline'ı kendi thread'inde aç ve çalıştır"""
+        self.current_algorithm = "bytetrack"
+        self.pipeline_stop_event = threading.Event()
+        pipeline = ByteTrackPipeline(source, loaded_model, self.video_display, confidence_threshold, motor_ctrl)
+        self.pipeline = pipeline
+        stop_event = self.pipeline_stop_event
+
+        def run():
+            if pipeline.open():
+                pipeline.run(stop_event)
+
+        self.running_thread = threading.Thread(target=run, name="ByteTrackPipeline")
+        self.running_thread.daemon = True
+        self.running_thread.start()
+
+    def _resume_warm_pipeline(self, source, loaded_model, confidence_threshold, motor_ctrl):
+        """
+        Duraklatılmış pipeline'ı devam ettir
+        
+        Returns:
+            bool: Pipeline yeniden kullanıldı mı (False: yeni pipeline kurulmalı)
+        """
+        pipeline = self.pipeline
+        if pipeline is None or pipeline.model is not loaded_model:
+            return False
+        if not (self.running_thread and self.running_thread.is_alive()):
+            return False  # Kaynak bitti veya kamera açılamadı
+        
+        start = time.perf_counter()
+        pipeline.set_motor_controller(motor_ctrl)
+        if not pipeline.reconfigure(confidence_threshold=confidence_threshold, source=source):
+            return False
+        pipeline.resume()
+        self.current_algorithm = "bytetrack"
+        logger.info(f"⚡ Sıcak pipeline devam ettirildi ({(time.perf_counter() - start) * 1000:.1f} ms)")
+        return True
+
+    def stop_video(self, keep_warm=True):
+        """
+        Tracking'i durdur
+        
+        Args:
+            keep_warm: Sıcak pipeline varsa sadece duraklat (kamera ve model açık kalır).
+                       Uygulama kapanışı ve acil durdurmada False verilir.
+        """
+        if keep_warm and config.keep_pipeline_warm and self.pipeline is not None \
+                and self.running_thread and self.running_thread.is_alive():
+            logger.info("⏸️ Video tracking duraklatılıyor")
+            self.pipeline.pause()
+            self.current_algorithm = None
+            return
+        
         logger.info("⏹️ Video tracking durduruluyor")
         
         # Temizlenmiş ByteTracker'ı durdur
         stop_bytetrack_tracking()
+        self.pipeline_stop_event.set()
 
         if self.running_thread and self.running_thread.is_alive():
             self.running_thread.join(timeout=2.0)
 
         self.running_thread = None
+        self.pipeline = None
         self.current_algorithm = None
     
     # Motor Control Methods
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Detector Interface
+------------------
+Common interface for the object detection backends.
+Every backend returns detections in the same format: an Nx5 float32 numpy
+array of [x1, y1, x2, y2, score] in input-frame pixel coordinates.
+"""
+
+import time
+
+import numpy as np
+
+
+def empty_detections():
+    """0x5 detection dizisi"""
+    return np.empty((0, 5), dtype=np.float32)
+
+
+class Detector:
+    """
+    Base class for detection backends.
+
+    Subclasses implement detect(); detect_batch() and warmup() have generic
+    fallbacks that backends may override with faster versions.
+    """
+
+    name = "base"
+    # Giriş boyutu çağrı başına değiştirilebilir mi (export edilmiş statik modellerde hayır)
+    dynamic_input = False
+
+    def __init__(self, input_size=640, iou_threshold=0.45, classes=None):
+        """
+        Args:
+            input_size: Model giriş boyutu (kare, piksel)
+            iou_threshold: NMS IoU eşiği
+            classes: Sadece bu sınıf id'lerini döndür (None = hepsi)
+        """
+        self.input_size = int(input_size)
+        self.iou_threshold = iou_threshold
+        self.classes = classes
+        self.model_path = None
+
+    def detect(self, frame, conf):
+        """
+        Run detection on one BGR frame.
+
+        Args:
+            frame: BGR görüntü (HxWx3 uint8)
+            conf: Minimum confidence
+
+        Returns:
+            np.ndarray: Nx5 [x1, y1, x2, y2, score] (float32)
+        """
+        raise NotImplementedError
+
+    def detect_batch(self, frames, conf, input_size=None):
+        """
+        Run detection on several frames; returns one Nx5 array per frame.
+
+        input_size overrides the model input size for this call (e.g. small
+        ROI crops); backends without dynamic_input ignore it.
+        """
+        return [self.detect(frame, conf) for frame in frames]
+
+    def warmup(self, iterations=2, shape=None):
+        """
+        Run a few dummy inferences so the first real frame is not slow.
+
+        Returns:
+            list: Her iterasyonun süresi (ms) - ilk değer soğuk başlangıç maliyetidir
+        """
+        shape = shape or (self.input_size, self.input_size, 3)
+        dummy = np.zeros(shape, dtype=np.uint8)
+        timings = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            self.detect(dummy, 0.99)
+            timings.append((time.perf_counter() - start) * 1000.0)
+        return timings
+
+    def set_input_size(self, size):
+        """
+        Change the model input size at runtime (only with dynamic_input).
+
+        Returns:
+            bool: Uygulandı mı
+        """
+        if not self.dynamic_input:
+            return False
+        self.input_size = int(size)
+        return True
+
+    def describe(self):
+        return f"{self.name} ({self.input_size}px)"
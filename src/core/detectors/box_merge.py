@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Multi-View Box Merging
+----------------------
+Helpers for detectors that look at one frame through several views (crops,
+tiles, a downscaled full frame): dropping boxes cut by an inner crop edge,
+shifting crop boxes back to frame coordinates and cross-view NMS.
+"""
+
+import cv2
+import numpy as np
+
+from src.core.detectors.base_detector import empty_detections
+
+# Kırpım kenarına bu kadar pikselden yakın kutular kesik sayılır (frame kenarı hariç)
+EDGE_TOLERANCE_PX = 2
+
+
+def drop_cut_boxes(detections, rect, frame_shape):
+    """
+    Kırpımın iç kenarlarına değen (kesik) kutuları at
+
+    Args:
+        detections: Nx5 kırpım koordinatlarında tespitler
+        rect: Kırpımın frame'deki (x1, y1, x2, y2) konumu
+        frame_shape: Frame shape - frame kenarına denk gelen kırpım kenarları kesik sayılmaz
+    """
+    if len(detections) == 0:
+        return detections
+    x1, y1, x2, y2 = rect
+    h, w = frame_shape[:2]
+    crop_w, crop_h = x2 - x1, y2 - y1
+    cut = np.zeros(len(detections), dtype=bool)
+    if x1 > 0:
+        cut |= detections[:, 0] <= EDGE_TOLERANCE_PX
+    if y1 > 0:
+        cut |= detections[:, 1] <= EDGE_TOLERANCE_PX
+    if x2 < w:
+        cut |= detections[:, 2] >= crop_w - EDGE_TOLERANCE_PX
+    if y2 < h:
+        cut |= detections[:, 3] >= crop_h - EDGE_TOLERANCE_PX
+    return detections[~cut]
+
+
+def to_frame_coords(detections, rect):
+    """Kırpım koordinatlarındaki kutuları frame koordinatlarına taşı"""
+    if len(detections) == 0:
+        return detections
+    return detections + np.array([rect[0], rect[1], rect[0], rect[1], 0], dtype=np.float32)
+
+
+def merge_views(groups, iou_threshold):
+    """
+    Görünümler arası NMS
+
+    Args:
+        groups: Öncelik sırasına göre Nx5 tespit grupları - aynı nesnede önceki
+                grubun kutusu tutulur, grup içinde skor belirleyicidir
+        iou_threshold: NMS IoU eşiği
+
+    Returns:
+        np.ndarray: Nx5 birleştirilmiş tespitler
+    """
+    groups = [g for g in groups if len(g)]
+    if not groups:
+        return empty_detections()
+    detections = np.concatenate(groups)
+    if len(detections) == 1:
+        return detections
+    xywh = detections[:, :4].astype(np.float64)
+    xywh[:, 2:] -= xywh[:, :2]
+    # Sıralama skoru: grup önceliği + skor (skor 0-1 aralığında)
+    rank = detections[:, 4].astype(np.float64)
+    offset = 0
+    for priority, group in enumerate(groups):
+        rank[offset:offset + len(group)] += len(groups) - 1 - priority
+        offset += len(group)
+    indices = cv2.dnn.NMSBoxes(xywh.tolist(), rank.tolist(), 0.0, iou_threshold)
+    indices = np.asarray(indices, dtype=np.int64).reshape(-1)
+    return detections[indices] if indices.size else empty_detections()
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Detector Factory
+----------------
+Creates the configured detector backend and manages exported model
+artifacts. ONNX / OpenVINO exports are produced once with ultralytics and
+cached in `<model_dir>/exports`; they are rebuilt only when the source
+.pt file is newer than the export. The direct torch backend caches the
+fused weights there too (a state_dict loaded with weights_only=True), keyed
+by the model file hash and torch version.
+On CPU-only machines an INT8 ONNX model (static quantization calibrated on
+recorded footage) is preferred when it has already been built offline with
+build_int8_model (benchmarks/eval_int8.py --build-only).
+"""
+
+import os
+import shutil
+import hashlib
+
+from src.core.detectors.base_detector import Detector
+from src.core.detectors.torch_detector import TorchDetector, DirectTorchDetector
+from src.utils.config import config
+from src.utils.logger import logger
+
+DETECTOR_BACKENDS = ("torch", "torch_direct", "onnxruntime", "openvino")
+
+
+def get_export_dir():
+    """Export edilmiş modellerin önbellek dizini"""
+    export_dir = os.path.join(config.get_model_dir(), "exports")
+    os.makedirs(export_dir, exist_ok=True)
+    return export_dir
+
+
+def get_export_path(model_path, export_format, input_size):
+    """
+    Export edilmiş model yolunu döndür
+
+    Returns:
+        onnx: <exports>/<ad>_<boyut>.onnx, openvino: <exports>/<ad>_<boyut>_openvino/<ad>.xml
+    """
+    stem = os.path.splitext(os.path.basename(model_path))[0]
+    export_dir = get_export_dir()
+    if export_format == "onnx":
+        return os.path.join(export_dir, f"{stem}_{input_size}.onnx")
+    if export_format == "openvino":
+        return os.path.join(export_dir, f"{stem}_{input_size}_openvino", f"{stem}.xml")
+    raise ValueError(f"Desteklenmeyen export formatı: {export_format}")
+
+
+def _is_fresh(export_path, model_path):
+    return os.path.exists(export_path) and os.path.getmtime(export_path) >= os.path.getmtime(model_path)
+
+
+def export_model(model_path, export_format, input_size=None):
+    """
+    .pt modeli ONNX / OpenVINO formatına export et (önbellekte güncelse tekrar etmez)
+
+    Returns:
+        str: Export edilmiş model yolu
+    """
+    input_size = input_size or config.detector_input_size
+    export_path = get_export_path(model_path, export_format, input_size)
+    if _is_fresh(export_path, model_path):
+        logger.debug(f"Export önbellekte: {export_path}")
+        return export_path
+
+    from ultralytics import YOLO
+
+    logger.info(f"📦 Model export ediliyor ({export_format}, {input_size}px): {os.path.basename(model_path)}")
+    # ultralytics export'u .pt dosyasının yanına yazar - sonucu önbellek dizinine taşı
+    produced = YOLO(model_path).export(format=export_format, imgsz=input_size, dynamic=False, half=False)
+    if export_format == "onnx":
+        shutil.move(produced, export_path)
+    else:
+        target_dir = os.path.dirname(export_path)
+        if os.path.exists(target_dir):
+            shutil.rmtree(target_dir)
+        shutil.move(produced, target_dir)
+        stem = os.path.splitext(os.path.basename(model_path))[0]
+        if not os.path.exists(export_path):
+            # ultralytics dosya adını model adından türetir
+            xml_files = [f for f in os.listdir(target_dir) if f.endswith(".xml")]
+            if xml_files:
+                os.replace(os.path.join(target_dir, xml_files[0]), export_path)
+                bin_src = os.path.join(target_dir, xml_files[0][:-4] + ".bin")
+                if os.path.exists(bin_src):
+                    os.replace(bin_src, os.path.join(target_dir, f"{stem}.bin"))
+    logger.info(f"✅ Export tamamlandı: {export_path}")
+    return export_path
+
+
+def file_hash(path, chunk_size=1 << 20):
+    """Dosyanın SHA-256 özeti"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def get_fused_model_path(model_path):
+    """Fuse edilmiş ağırlık önbelleği yolu: <exports>/<ad>_<hash>_torch<sürüm>_fused.pt"""
+    import torch
+
+    stem = os.path.splitext(os.path.basename(model_path))[0]
+    torch_version = torch.__version__.split("+")[0]
+    return os.path.join(get_export_dir(), f"{stem}_{file_hash(model_path)[:16]}_torch{torch_version}_fused.pt")
+
+
+def load_fused_model(model_path):
+    """
+    Conv+BN katmanları birleştirilmiş PyTorch ağını yükle
+
+    İlk çalıştırmada model fuse edilip mimari tanımı (yaml) + state_dict önbelleğe
+    yazılır; sonraki açılışlarda ağ yaml'dan kurulup fuse edilir ve ağırlıklar
+    weights_only=True ile yüklenir (önbellekten rastgele nesne unpickle edilmez).
+    Model dosyası veya torch sürümü değişirse anahtar değişir ve önbellek
+    yeniden üretilir.
+
+    Returns:
+        torch.nn.Module
+    """
+    import torch
+
+    cache_path = get_fused_model_path(model_path)
+    if os.path.exists(cache_path):
+        try:
+            net = _build_fused_model(torch.load(cache_path, map_location="cpu", weights_only=True))
+            logger.info(f"⚡ Fuse edilmiş model önbellekten yüklendi: {os.path.basename(cache_path)}")
+            return net
+        except Exception as e:
+            logger.warning(f"⚠️ Model önbelleği okunamadı, yeniden üretilecek: {e}")
+
+    from ultralytics import YOLO
+
+    net = YOLO(model_path).model.fuse(verbose=False).eval()
+    temp_path = cache_path + ".tmp"
+    try:
+        torch.save({"yaml": net.yaml, "names": dict(net.names), "state_dict": net.state_dict()}, temp_path)
+        os.replace(temp_path, cache_path)
+        logger.info(f"💾 Fuse edilmiş model önbelleğe yazıldı: {os.path.basename(cache_path)}")
+    except Exception as e:
+        logger.warning(f"⚠️ Model önbelleği yazılamadı: {e}")
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    return net
+
+
+def _build_fused_model(checkpoint):
+    """Önbellekteki yaml + state_dict'ten fuse edilmiş DetectionModel kur"""
+    from ultralytics.nn.tasks import DetectionModel
+
+    net = DetectionModel(checkpoint["yaml"], verbose=False).fuse(verbose=False)
+    net.load_state_dict(checkpoint["state_dict"])
+    net.names = checkpoint["names"]
+    return net.eval()
+
+
+def is_cuda_available():
+    """torch kurulu ve CUDA kullanılabilir mi"""
+    try:
+        import torch
+        return torch.cuda.is_available()
+    except ImportError:
+        return False
+
+
+def int8_enabled():
+    """Config'e göre INT8 CPU modu kullanılmalı mı"""
+    mode = config.detector_int8
+    if mode in ("false", "0", "off"):
+        return False
+    if mode in ("true", "1", "on"):
+        return True
+    return not config.use_gpu or not is_cuda_available()
+
+
+def get_int8_model(model_path, input_size=None):
+    """
+    Önceden üretilmiş güncel INT8 ONNX modelinin yolunu döndür
+
+    Açılışta export / quantization yapılmaz; model yoksa veya .pt'den eskiyse
+    None döner ve float backend kullanılır. INT8 model build_int8_model ile
+    (benchmarks/eval_int8.py --build-only) çevrim dışı üretilir.
+
+    Returns:
+        str veya None
+    """
+    from src.core.detectors.onnx_detector import ONNXRUNTIME_AVAILABLE
+    from src.core.detectors.quantization import get_int8_path, is_int8_fresh
+
+    if not ONNXRUNTIME_AVAILABLE:
+        logger.debug("onnxruntime kurulu değil, INT8 modu atlandı")
+        return None
+
+    input_size = input_size or config.detector_input_size
+    onnx_path = get_export_path(model_path, "onnx", input_size)
+    if _is_fresh(onnx_path, model_path) and is_int8_fresh(onnx_path):
+        return get_int8_path(onnx_path)
+    logger.info(f"ℹ️ Güncel INT8 model yok ({os.path.basename(model_path)}, {input_size}px) - float model kullanılacak. "
+                f"Üretmek için: python benchmarks/eval_int8.py --build-only")
+    return None
+
+
+def build_int8_model(model_path, input_size=None, calibration_dir=None, max_frames=None):
+    """
+    Modeli ONNX'e export edip kayıtlı görüntülerle statik INT8'e quantize et (çevrim dışı adım)
+
+    Returns:
+        str: INT8 model yolu
+
+    Raises:
+        ValueError: Kalibrasyon klasöründe kayıt yoksa
+    """
+    from src.core.detectors.quantization import get_int8_path, iter_calibration_frames, quantize_onnx_model
+
+    calibration_dir = calibration_dir or config.int8_calibration_dir
+    max_frames = max_frames or config.int8_calibration_frames
+    onnx_path = export_model(model_path, "onnx", input_size)
+    frames = iter_calibration_frames(calibration_dir, max_frames)
+    return quantize_onnx_model(onnx_path, frames, get_int8_path(onnx_path))
+
+
+def create_detector(model, backend=None, input_size=None, iou_threshold=None, threads=None, int8=None):
+    """
+    Config'e göre detector oluştur
+
+    Args:
+        model: .pt dosya yolu veya yüklenmiş ultralytics.YOLO modeli (sadece torch)
+        backend: torch, torch_direct, onnxruntime veya openvino (None = config)
+        int8: INT8 ONNX modelini tercih et (None = config / donanıma göre)
+
+    Returns:
+        Detector
+    """
+    if isinstance(model, Detector):
+        return model
+
+    backend = (backend or config.detector_backend).lower()
+    input_size = input_size or config.detector_input_size
+    iou_threshold = iou_threshold if iou_threshold is not None else config.detector_iou_threshold
+    threads = threads if threads is not None else config.detector_threads
+
+    if backend not in DETECTOR_BACKENDS:
+        logger.warning(f"⚠️ Bilinmeyen detector backend'i: {backend}, torch kullanılacak")
+        backend = "torch"
+
+    int8 = int8_enabled() if int8 is None else int8
+    if int8 and backend != "openvino" and isinstance(model, str):
+        # CPU-only: INT8 artifact onnxruntime ile çalıştırılır
+        try:
+            from src.core.detectors.onnx_detector import OnnxRuntimeDetector
+            int8_path = get_int8_model(model, input_size)
+            if int8_path:
+                detector = OnnxRuntimeDetector(int8_path, iou_threshold, threads=threads)
+                detector.name = "onnxruntime_int8"
+                return detector
+        except Exception as e:
+            logger.error(f"❌ INT8 detector oluşturulamadı, {backend} kullanılacak: {e}")
+
+    if backend == "torch_direct":
+        try:
+            if isinstance(model, str) and config.model_fused_cache:
+                net = load_fused_model(model)
+                detector = DirectTorchDetector(net, input_size, iou_threshold, threads=threads)
+                detector.model_path = model
+                return detector
+            return DirectTorchDetector(model, input_size, iou_threshold, threads=threads)
+        except Exception as e:
+            logger.error(f"❌ Doğrudan forward detector oluşturulamadı, ultralytics predictor kullanılacak: {e}")
+    elif backend != "torch":
+        if not isinstance(model, str):
+            model = getattr(model, "ckpt_path", None) or model
+        try:
+            if backend == "onnxruntime":
+                from src.core.detectors.onnx_detector import OnnxRuntimeDetector
+                return OnnxRuntimeDetector(export_model(model, "onnx", input_size), iou_threshold, threads=threads)
+            from src.core.detectors.openvino_detector import OpenVinoDetector
+            return OpenVinoDetector(export_model(model, "openvino", input_size), iou_threshold, threads=threads)
+        except Exception as e:
+            logger.error(f"❌ {backend} detector oluşturulamadı, torch kullanılacak: {e}")
+
+    return TorchDetector(model, input_size, iou_threshold)
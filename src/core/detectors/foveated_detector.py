@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Foveated Detector
+-----------------
+Wraps a detector so every call sees the scene twice in one batch: the full
+frame downscaled to the model input, and a native-resolution crop around
+the fovea (the crosshair / principal point the pan-tilt loop keeps the
+target on). Small, far balloons near the center are detected at full
+resolution while the rest of the frame costs only a low-resolution pass.
+Boxes from both views are fused with cross-view NMS that prefers the
+fovea box.
+"""
+
+import numpy as np
+
+from src.core.detectors.base_detector import Detector
+from src.core.detectors.box_merge import drop_cut_boxes, to_frame_coords, merge_views
+
+
+class FoveatedDetector(Detector):
+    """Full frame (downscaled) + native-resolution center crop, fused."""
+
+    name = "foveated"
+
+    def __init__(self, detector, fovea_size=640):
+        """
+        Args:
+            detector: Asıl detector backend'i
+            fovea_size: Merkez kırpımın kenarı (frame pikseli, ölçeklenmeden modele girer)
+        """
+        super().__init__(detector.input_size, detector.iou_threshold, detector.classes)
+        self.detector = detector
+        self.fovea_size = int(fovea_size)
+        self.dynamic_input = detector.dynamic_input
+        self.model_path = detector.model_path
+        self._center = None
+
+    def set_center(self, x, y):
+        """Fovea merkezi (frame pikseli); None = frame merkezi"""
+        self._center = None if x is None or y is None else (float(x), float(y))
+
+    def fovea_rect(self, frame_shape):
+        """
+        Returns:
+            (x1, y1, x2, y2) veya None: Kırpım frame'i zaten model girişine sığıyorsa None
+        """
+        h, w = frame_shape[:2]
+        if max(w, h) <= self.input_size:
+            return None
+        crop_w, crop_h = min(self.fovea_size, w), min(self.fovea_size, h)
+        cx, cy = self._center if self._center is not None else (w / 2.0, h / 2.0)
+        if not (0 <= cx < w and 0 <= cy < h):
+            cx, cy = w / 2.0, h / 2.0
+        # Kırpım frame dışına taşmaz - kenara yaklaşınca kaydırılır
+        x1 = int(np.clip(round(cx - crop_w / 2.0), 0, w - crop_w))
+        y1 = int(np.clip(round(cy - crop_h / 2.0), 0, h - crop_h))
+        return x1, y1, x1 + crop_w, y1 + crop_h
+
+    def detect(self, frame, conf):
+        rect = self.fovea_rect(frame.shape)
+        if rect is None:
+            return self.detector.detect(frame, conf)
+
+        x1, y1, x2, y2 = rect
+        full_dets, fovea_dets = self.detector.detect_batch([frame, frame[y1:y2, x1:x2]], conf)
+        fovea_dets = to_frame_coords(drop_cut_boxes(fovea_dets, rect, frame.shape), rect)
+        # Aynı nesnede fovea kutusu (daha hassas) tercih edilir
+        return merge_views([fovea_dets, full_dets], self.iou_threshold)
+
+    def detect_batch(self, frames, conf, input_size=None):
+        # ROI kırpımları zaten yüksek çözünürlüklü - doğrudan asıl detector'e
+        return self.detector.detect_batch(frames, conf, input_size)
+
+    def set_input_size(self, size):
+        if not self.detector.set_input_size(size):
+            return False
+        self.input_size = self.detector.input_size
+        return True
+
+    def describe(self):
+        return f"{self.detector.describe()} + fovea {self.fovea_size}px"
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Keyframe Scheduler
+------------------
+Runs the detector only on keyframes. In between, the confirmed tracks are
+propagated with the ByteTrack Kalman motion model, refined with sparse
+Lucas-Kanade optical flow on points inside each box, and handed to the
+tracker as pseudo-detections.
+
+Tentative (not yet activated) tracks are not propagated - a false positive
+would confirm itself - instead the frame after a new track appears is a
+keyframe, so the detector can confirm it.
+
+The keyframe interval adapts: it is halved (and the next frame becomes a
+keyframe) when the flow disagrees with the Kalman prediction or a track is
+lost, and grows by one after every stable cycle. Boxes where the flow
+cannot be measured (low-texture balloons) keep the Kalman prediction.
+"""
+
+import cv2
+import numpy as np
+
+from src.core.detectors.base_detector import empty_detections
+
+# Track durumu en fazla bu kadar frame ileri tahmin edilir
+MAX_PREDICTION_STEPS = 5
+# Kutu başına optik akış noktası ve geçerli sayılması için gereken en az nokta
+FLOW_GRID = 5
+MIN_FLOW_POINTS = 3
+# İleri-geri akış hatası eşiği (piksel)
+MAX_FB_ERROR_PX = 1.0
+
+LK_PARAMS = dict(winSize=(15, 15), maxLevel=2,
+                 criteria=(cv2.TERM_CRITERIA_EPS | cv2.TERM_CRITERIA_COUNT, 20, 0.03))
+
+
+class KeyframeScheduler:
+    """Detect on keyframes, propagate tracks (Kalman + LK flow) in between."""
+
+    def __init__(self, detector, min_interval=2, max_interval=8, residual_threshold=0.15, use_flow=True):
+        """
+        Args:
+            detector: Detector (keyframe'lerde çalışır)
+            min_interval, max_interval: Keyframe aralığı sınırları (frame)
+            residual_threshold: Akış - Kalman farkı eşiği (kutu boyutu oranı)
+            use_flow: Kalman tahminini Lucas-Kanade akışı ile düzelt
+        """
+        self.detector = detector
+        self.min_interval = max(1, int(min_interval))
+        self.max_interval = max(self.min_interval, int(max_interval))
+        self.residual_threshold = residual_threshold
+        self.use_flow = use_flow
+
+        self.interval = self.min_interval
+        self.last_propagated = False
+        self._hint = None               # (frame_index, Nx8 Kalman state'leri, N skor) - track stage yazar
+        self._force_keyframe = True
+        self._unstable = False          # Son keyframe'den beri sorun görüldü mü
+        self._last_lost_count = 0
+        self._last_key_index = None
+        self._prev_gray = None
+        self._prev_index = None
+        self.stats = {"keyframes": 0, "propagated": 0, "flow_failures": 0, "new_tracks": 0}
+
+    def reset(self):
+        """Track'ler sıfırlandı - sonraki frame keyframe, aralık en kısa"""
+        self._hint = None
+        self._last_lost_count = 0
+        self._force_keyframe = True
+        self.interval = self.min_interval
+        self._prev_gray = None
+
+    def update_tracks(self, means, frame_index, lost_count, scores=None, tentative_means=None):
+        """
+        Track stage'den çağrılır: onaylı track'lerin Kalman state'lerini yayınla
+
+        Args:
+            means: Nx8 [cx, cy, a, h, vx, vy, va, vh] (tam çözünürlük pikseli)
+            frame_index: Bu state'in ait olduğu frame sırası
+            lost_count: Kayıp track sayısı - artarsa keyframe
+            scores: N track skoru (sahte tespitlerin skoru)
+            tentative_means: Henüz onaylanmamış track'ler - varsa sonraki frame keyframe
+                             (yayılmazlar; onay için detector'ün tekrar görmesi gerekir)
+        """
+        if lost_count > self._last_lost_count:
+            self._destabilize()
+        self._last_lost_count = lost_count
+        if tentative_means is not None and len(tentative_means):
+            self._force_keyframe = True
+            self.stats["new_tracks"] += 1
+        means = np.asarray(means, dtype=np.float64).reshape(-1, 8)
+        scores = np.ones(len(means)) if scores is None else np.asarray(scores, dtype=np.float64)
+        self._hint = (frame_index, means, scores)
+
+    def _destabilize(self):
+        self._force_keyframe = True
+        self._unstable = True
+        self.interval = max(self.min_interval, self.interval // 2)
+
+    def detect(self, frame, conf, frame_index, scale=1):
+        """
+        Returns:
+            np.ndarray: Nx5 [x1, y1, x2, y2, score] (frame koordinatları);
+            last_propagated=True ise tespitler track yayılımından gelir
+        """
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if self.use_flow else None
+        prev_gray, prev_index = self._prev_gray, self._prev_index
+        self._prev_gray, self._prev_index = gray, frame_index
+
+        hint = self._hint
+        is_keyframe = (self._force_keyframe or hint is None or len(hint[1]) == 0
+                       or self._last_key_index is None
+                       or frame_index - self._last_key_index >= self.interval)
+        if not is_keyframe:
+            detections = self._propagate(hint, frame_index, scale, frame.shape, prev_gray, prev_index, gray)
+            if detections is not None:
+                self.last_propagated = True
+                self.stats["propagated"] += 1
+                return detections
+            self._destabilize()
+
+        if not self._unstable and self._last_key_index is not None:
+            self.interval = min(self.max_interval, self.interval + 1)
+        self._unstable = False
+        self._force_keyframe = False
+        self._last_key_index = frame_index
+        self.last_propagated = False
+        self.stats["keyframes"] += 1
+        return self.detector.detect(frame, conf)
+
+    def _propagate(self, hint, frame_index, scale, frame_shape, prev_gray, prev_index, gray):
+        """
+        Track'leri mevcut frame'e taşı
+
+        Returns:
+            np.ndarray veya None: Nx5 sahte tespitler; None = yayılım güvenilmez, keyframe çalıştır
+        """
+        hint_index, means, scores = hint
+        steps = float(np.clip(frame_index - hint_index, 1, MAX_PREDICTION_STEPS))
+        boxes = _predict_boxes(means, steps) / scale
+
+        if self.use_flow and prev_gray is not None and prev_index == frame_index - 1:
+            # Önceki frame'deki kutudan akış ölç - Kalman hızı ile karşılaştır
+            prev_boxes = _predict_boxes(means, steps - 1) / scale
+            kalman_shift = boxes[:, :2] - prev_boxes[:, :2]
+            for i, box in enumerate(prev_boxes):
+                shift = _box_flow(prev_gray, gray, box)
+                if shift is None:
+                    # Az dokulu kutu - akış ölçülemiyor, Kalman tahmini kullanılır
+                    self.stats["flow_failures"] += 1
+                    continue
+                size = max(box[2] - box[0], box[3] - box[1], 1.0)
+                if np.hypot(*(shift - kalman_shift[i])) / size > self.residual_threshold:
+                    return None
+                boxes[i] = prev_boxes[i] + np.array([shift[0], shift[1], shift[0], shift[1]])
+
+        frame_h, frame_w = frame_shape[:2]
+        boxes[:, [0, 2]] = np.clip(boxes[:, [0, 2]], 0, frame_w)
+        boxes[:, [1, 3]] = np.clip(boxes[:, [1, 3]], 0, frame_h)
+        valid = (boxes[:, 2] > boxes[:, 0]) & (boxes[:, 3] > boxes[:, 1])
+        if not np.all(valid):
+            # Track frame dışına çıkıyor - detector'e bırak
+            return None
+        if len(boxes) == 0:
+            return empty_detections()
+        return np.hstack([boxes, scores[:, None]]).astype(np.float32)
+
+    def format_stats(self, reset=True):
+        stats = dict(self.stats)
+        if reset:
+            for key in self.stats:
+                self.stats[key] = 0
+        return (f"Keyframe: {stats['keyframes']}, Yayılım: {stats['propagated']} "
+                f"(akış ölçülemedi: {stats['flow_failures']}, yeni track: {stats['new_tracks']}), "
+                f"Aralık: {self.interval}")
+
+
+def _predict_boxes(means, steps):
+    """Kalman state'lerini sabit hızla steps frame ilerlet → Nx4 tlbr"""
+    cx = means[:, 0] + means[:, 4] * steps
+    cy = means[:, 1] + means[:, 5] * steps
+    h = np.maximum(means[:, 3] + means[:, 7] * steps, 1.0)
+    w = np.maximum((means[:, 2] + means[:, 6] * steps) * h, 1.0)
+    return np.stack([cx - w / 2, cy - h / 2, cx + w / 2, cy + h / 2], axis=1)
+
+
+def _box_flow(prev_gray, gray, box):
+    """
+    Kutu içindeki nokta ızgarasının medyan yer değiştirmesi (ileri-geri kontrollü LK)
+
+    Returns:
+        np.ndarray veya None: (dx, dy); yeterli güvenilir nokta yoksa None
+    """
+    h, w = prev_gray.shape[:2]
+    x1, y1, x2, y2 = box
+    # Kenarlardan biraz içeride - arka plan noktaları medyanı bozmasın
+    xs = np.linspace(x1 + 0.2 * (x2 - x1), x2 - 0.2 * (x2 - x1), FLOW_GRID)
+    ys = np.linspace(y1 + 0.2 * (y2 - y1), y2 - 0.2 * (y2 - y1), FLOW_GRID)
+    points = np.stack(np.meshgrid(xs, ys), axis=-1).reshape(-1, 1, 2).astype(np.float32)
+    inside = (points[:, 0, 0] >= 0) & (points[:, 0, 0] < w) & (points[:, 0, 1] >= 0) & (points[:, 0, 1] < h)
+    points = points[inside]
+    if len(points) < MIN_FLOW_POINTS:
+        return None
+
+    forward, status, _ = cv2.calcOpticalFlowPyrLK(prev_gray, gray, points, None, **LK_PARAMS)
+    backward, back_status, _ = cv2.calcOpticalFlowPyrLK(gray, prev_gray, forward, None, **LK_PARAMS)
+    fb_error = np.linalg.norm((points - backward).reshape(-1, 2), axis=1)
+    good = (status.ravel() == 1) & (back_status.ravel() == 1) & (fb_error < MAX_FB_ERROR_PX)
+    if np.count_nonzero(good) < MIN_FLOW_POINTS:
+        return None
+    return np.median((forward - points).reshape(-1, 2)[good], axis=0)
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Motion Gate
+-----------
+Cheap scene-change check that decides whether the detector has to run on a
+frame while the gimbal is idle and nothing is being tracked.
+
+The frame is downscaled to a small grayscale thumbnail and compared with a
+slowly updated background (running average). The absolute difference is
+averaged over a coarse grid; if no cell changes by more than `threshold`
+gray levels the detector is skipped. A detection is still forced at least
+every `max_skip` frames, and always when the caller reports servo motion
+or active tracks (the background is re-seeded after camera motion).
+"""
+
+import cv2
+import numpy as np
+
+# Küçük görüntü genişliği (piksel) ve arka plan güncelleme katsayısı
+THUMBNAIL_WIDTH = 96
+BACKGROUND_ALPHA = 0.05
+
+
+class MotionGate:
+    """Skip detection on static idle frames (downscaled differencing over a grid)."""
+
+    def __init__(self, max_skip=15, threshold=8.0, grid=8):
+        """
+        Args:
+            max_skip: Art arda atlanabilecek en fazla frame
+            threshold: Hücre ortalama farkı eşiği (gri seviye, 0-255)
+            grid: Izgara hücre sayısı (kenar başına)
+        """
+        self.max_skip = max(0, int(max_skip))
+        self.threshold = float(threshold)
+        self.grid = max(1, int(grid))
+
+        self._background = None
+        self._skipped = 0
+        self.stats = {"checked": 0, "skipped": 0, "changes": 0}
+
+    def reset(self):
+        """Arka planı unut - sonraki frame tespit edilir"""
+        self._background = None
+        self._skipped = 0
+
+    def should_detect(self, frame, force=False):
+        """
+        Args:
+            frame: BGR frame
+            force: Servo hareketli / aktif track var - her durumda tespit
+
+        Returns:
+            bool: Detector çalıştırılmalı mı
+        """
+        if force:
+            # Kamera hareket ederken arka plan geçersiz - durunca yeniden kurulur
+            self.reset()
+            return True
+
+        self.stats["checked"] += 1
+        thumb = self._thumbnail(frame)
+        if self._background is None or self._background.shape != thumb.shape:
+            self._background = thumb
+            self._skipped = 0
+            return True
+
+        changed = self._changed(thumb)
+        cv2.accumulateWeighted(thumb, self._background, BACKGROUND_ALPHA)
+        if changed:
+            self.stats["changes"] += 1
+        if changed or self._skipped >= self.max_skip:
+            self._skipped = 0
+            return True
+
+        self._skipped += 1
+        self.stats["skipped"] += 1
+        return False
+
+    def _thumbnail(self, frame):
+        h, w = frame.shape[:2]
+        thumb_h = max(self.grid, int(round(h * THUMBNAIL_WIDTH / w)))
+        small = cv2.resize(frame, (THUMBNAIL_WIDTH, thumb_h), interpolation=cv2.INTER_AREA)
+        gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY) if small.ndim == 3 else small
+        # Sensör gürültüsü hücre ortalamasını tetiklemesin
+        return cv2.GaussianBlur(gray, (3, 3), 0).astype(np.float32)
+
+    def _changed(self, thumb):
+        diff = cv2.absdiff(thumb, self._background)
+        # Hücre ortalamaları: ızgara boyutuna alan ortalaması ile küçült
+        cells = cv2.resize(diff, (self.grid, self.grid), interpolation=cv2.INTER_AREA)
+        return float(cells.max()) > self.threshold
+
+    def format_stats(self, reset=True):
+        stats = dict(self.stats)
+        if reset:
+            for key in self.stats:
+                self.stats[key] = 0
+        return (f"Boşta kontrol: {stats['checked']}, Atlanan: {stats['skipped']}, "
+                f"Değişim: {stats['changes']}")
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+ONNX Runtime Detector
+---------------------
+CPU detector backend running an exported YOLOv8 ONNX model with
+onnxruntime. Pre/post-processing is done with OpenCV and numpy.
+"""
+
+import os
+
+from src.core.detectors.base_detector import Detector
+from src.core.detectors.yolo_postprocess import Letterbox, to_blob, decode_yolov8
+from src.utils.logger import logger
+
+try:
+    import onnxruntime as ort
+    ONNXRUNTIME_AVAILABLE = True
+except ImportError:
+    ONNXRUNTIME_AVAILABLE = False
+
+
+class OnnxRuntimeDetector(Detector):
+    """onnxruntime CPUExecutionProvider backend."""
+
+    name = "onnxruntime"
+
+    def __init__(self, onnx_path, iou_threshold=0.45, classes=None, threads=0):
+        """
+        Args:
+            onnx_path: Export edilmiş .onnx dosyası
+            threads: Intra-op thread sayısı (0 = onnxruntime varsayılanı)
+        """
+        if not ONNXRUNTIME_AVAILABLE:
+            raise ImportError("onnxruntime kurulu değil: pip install onnxruntime")
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if threads:
+            options.intra_op_num_threads = threads
+        self.session = ort.InferenceSession(onnx_path, options, providers=["CPUExecutionProvider"])
+        self.input_name = self.session.get_inputs()[0].name
+        self.output_name = self.session.get_outputs()[0].name
+
+        input_shape = self.session.get_inputs()[0].shape
+        input_size = input_shape[2] if isinstance(input_shape[2], int) else 640
+        super().__init__(input_size, iou_threshold, classes)
+        self.model_path = onnx_path
+        self.letterbox = Letterbox(self.input_size)
+        logger.info(f"🧠 ONNX Runtime detector hazır: {os.path.basename(onnx_path)} ({self.input_size}px)")
+
+    def detect(self, frame, conf):
+        image, ratio, pad = self.letterbox(frame)
+        output = self.session.run([self.output_name], {self.input_name: to_blob(image)})[0]
+        return decode_yolov8(output, conf, self.iou_threshold, ratio, pad, frame.shape, self.classes)
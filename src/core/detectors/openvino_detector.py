@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+OpenVINO Detector
+-----------------
+CPU detector backend running an exported YOLOv8 OpenVINO IR model.
+Color conversion, scaling and layout change are compiled into the model
+with PrePostProcessor, so the letterboxed BGR uint8 frame is fed as is.
+"""
+
+import os
+
+import numpy as np
+
+from src.core.detectors.base_detector import Detector
+from src.core.detectors.yolo_postprocess import Letterbox, decode_yolov8
+from src.utils.logger import logger
+
+try:
+    import openvino as ov
+    from openvino.preprocess import PrePostProcessor, ColorFormat
+    OPENVINO_AVAILABLE = True
+except ImportError:
+    OPENVINO_AVAILABLE = False
+
+
+class OpenVinoDetector(Detector):
+    """OpenVINO CPU plugin backend (LATENCY performance hint)."""
+
+    name = "openvino"
+
+    def __init__(self, model_xml, iou_threshold=0.45, classes=None, threads=0):
+        """
+        Args:
+            model_xml: Export edilmiş OpenVINO IR (.xml) dosyası
+            threads: CPU inference thread sayısı (0 = OpenVINO varsayılanı)
+        """
+        if not OPENVINO_AVAILABLE:
+            raise ImportError("openvino kurulu değil: pip install openvino")
+
+        core = ov.Core()
+        model = core.read_model(model_xml)
+        input_size = model.input(0).get_partial_shape()[2]
+        input_size = input_size.get_length() if input_size.is_static else 640
+
+        # Ön işleme modele gömülür: u8 NHWC BGR → f32 NCHW RGB / 255
+        ppp = PrePostProcessor(model)
+        ppp.input().tensor().set_element_type(ov.Type.u8).set_layout(ov.Layout("NHWC")) \
+            .set_color_format(ColorFormat.BGR)
+        ppp.input().model().set_layout(ov.Layout("NCHW"))
+        ppp.input().preprocess().convert_element_type(ov.Type.f32) \
+            .convert_color(ColorFormat.RGB).scale(255.0)
+        model = ppp.build()
+
+        compile_config = {"PERFORMANCE_HINT": "LATENCY"}
+        if threads:
+            compile_config["INFERENCE_NUM_THREADS"] = str(threads)
+        self.compiled = core.compile_model(model, "CPU", compile_config)
+        self.request = self.compiled.create_infer_request()
+
+        super().__init__(input_size, iou_threshold, classes)
+        self.model_path = model_xml
+        self.letterbox = Letterbox(self.input_size)
+        logger.info(f"🧠 OpenVINO detector hazır: {os.path.basename(model_xml)} ({self.input_size}px)")
+
+    def detect(self, frame, conf):
+        image, ratio, pad = self.letterbox(frame)
+        self.request.infer({0: image[np.newaxis]})
+        output = self.request.get_output_tensor(0).data
+        return decode_yolov8(output, conf, self.iou_threshold, ratio, pad, frame.shape, self.classes)
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+INT8 Quantization
+-----------------
+Static INT8 quantization of the exported ONNX detector with onnxruntime.
+Calibration frames are sampled from recorded footage (images and/or
+videos in a folder) and preprocessed exactly like the runtime path, so the
+activation ranges match what the detector sees in the field. The detection
+head's post-processing (DFL, box decode, concat) stays in float.
+Frames are streamed into the calibrator one at a time, so full-resolution
+footage is never held in memory as a whole. Quantization is an offline
+step (benchmarks/eval_int8.py --build-only); the runtime only loads an
+existing INT8 artifact.
+"""
+
+import os
+import itertools
+
+import cv2
+import numpy as np
+
+from src.core.detectors.yolo_postprocess import Letterbox, to_blob
+from src.utils.logger import logger
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp")
+VIDEO_EXTENSIONS = (".mp4", ".avi", ".mkv", ".mov")
+
+
+def get_int8_path(onnx_path):
+    """Float ONNX modelinin INT8 karşılığının yolu (<ad>_int8.onnx)"""
+    return os.path.splitext(onnx_path)[0] + "_int8.onnx"
+
+
+def is_int8_fresh(onnx_path):
+    """INT8 model var ve float modelden yeni mi"""
+    int8_path = get_int8_path(onnx_path)
+    return os.path.exists(int8_path) and os.path.getmtime(int8_path) >= os.path.getmtime(onnx_path)
+
+
+def iter_calibration_frames(source_dir, max_frames=200):
+    """
+    Kayıtlı görüntülerden kalibrasyon frame'lerini sırayla oku
+
+    Klasördeki resimler ve videolar birlikte kullanılır; videolardan eşit
+    aralıklı frame'ler alınır. Frame'ler tek tek üretilir, tam çözünürlükte
+    hepsi aynı anda bellekte tutulmaz.
+
+    Yields:
+        BGR frame (en fazla max_frames)
+    """
+    if not source_dir or not os.path.isdir(source_dir) or max_frames <= 0:
+        return
+
+    images, videos = [], []
+    for root, _, files in os.walk(source_dir):
+        for name in sorted(files):
+            ext = os.path.splitext(name)[1].lower()
+            if ext in IMAGE_EXTENSIONS:
+                images.append(os.path.join(root, name))
+            elif ext in VIDEO_EXTENSIONS:
+                videos.append(os.path.join(root, name))
+
+    count = 0
+    if images:
+        step = max(1, len(images) // max_frames)
+        for path in images[::step]:
+            if count >= max_frames:
+                return
+            frame = cv2.imread(path)
+            if frame is not None:
+                count += 1
+                yield frame
+
+    for i, path in enumerate(videos):
+        remaining = max_frames - count
+        if remaining <= 0:
+            break
+        per_video = remaining // (len(videos) - i)
+        cap = cv2.VideoCapture(path)
+        try:
+            total = int(cap.get(cv2.CAP_PROP_FRAME_COUNT)) or per_video
+            for index in np.linspace(0, max(total - 1, 0), per_video).astype(int):
+                cap.set(cv2.CAP_PROP_POS_FRAMES, int(index))
+                ret, frame = cap.read()
+                if ret:
+                    count += 1
+                    yield frame
+        finally:
+            cap.release()
+
+
+def _head_postprocess_nodes(onnx_path):
+    """
+    Detect head'in son işlem düğümleri (quantize edilmeyecek)
+
+    ultralytics export'unda düğüm adları /model.<katman>/... şeklindedir;
+    son katmandaki Conv dışındaki düğümler (DFL, kutu çözme, concat, sigmoid)
+    INT8'de kutu koordinatlarını bozduğu için float bırakılır.
+    """
+    import onnx
+
+    graph = onnx.load(onnx_path, load_external_data=False).graph
+    layers = [int(node.name.split("/")[1].split(".")[1]) for node in graph.node
+              if node.name.startswith("/model.") and node.name.split("/")[1].split(".")[1].isdigit()]
+    if not layers:
+        return []
+    head_prefix = f"/model.{max(layers)}/"
+    return [node.name for node in graph.node if node.name.startswith(head_prefix) and node.op_type != "Conv"]
+
+
+class _CalibrationReader:
+    """onnxruntime CalibrationDataReader arayüzü - frame'leri runtime ile aynı şekilde hazırlar"""
+
+    def __init__(self, frames, input_name, input_size):
+        self.frames = iter(frames)
+        self.input_name = input_name
+        self.letterbox = Letterbox(input_size)
+        self.count = 0
+
+    def get_next(self):
+        frame = next(self.frames, None)
+        if frame is None:
+            return None
+        self.count += 1
+        image, _, _ = self.letterbox(frame)
+        return {self.input_name: to_blob(image)}
+
+
+def quantize_onnx_model(onnx_path, calibration_frames, output_path=None):
+    """
+    Float ONNX modelini statik INT8'e quantize et (QDQ, kanal bazında ağırlık)
+
+    Args:
+        onnx_path: Float .onnx model
+        calibration_frames: BGR kalibrasyon frame'leri (liste veya iter_calibration_frames)
+        output_path: Çıktı yolu (None = <ad>_int8.onnx)
+
+    Returns:
+        str: INT8 model yolu
+    """
+    import onnxruntime as ort
+    from onnxruntime.quantization import quantize_static, QuantFormat, QuantType, CalibrationMethod
+
+    frames = iter(calibration_frames)
+    first = next(frames, None)
+    if first is None:
+        raise ValueError("INT8 kalibrasyonu için frame bulunamadı")
+
+    output_path = output_path or get_int8_path(onnx_path)
+    session = ort.InferenceSession(onnx_path, providers=["CPUExecutionProvider"])
+    model_input = session.get_inputs()[0]
+    input_size = model_input.shape[2] if isinstance(model_input.shape[2], int) else 640
+    del session
+
+    logger.info(f"🧮 INT8 quantization başlatıldı: {os.path.basename(onnx_path)}")
+    reader = _CalibrationReader(itertools.chain([first], frames), model_input.name, input_size)
+    temp_path = output_path + ".tmp"
+    quantize_static(
+        onnx_path,
+        temp_path,
+        reader,
+        quant_format=QuantFormat.QDQ,
+        per_channel=True,
+        activation_type=QuantType.QUInt8,
+        weight_type=QuantType.QInt8,
+        calibrate_method=CalibrationMethod.MinMax,
+        nodes_to_exclude=_head_postprocess_nodes(onnx_path),
+    )
+    os.replace(temp_path, output_path)
+    logger.info(f"✅ INT8 model hazır: {output_path} ({reader.count} kalibrasyon frame'i)")
+    return output_path
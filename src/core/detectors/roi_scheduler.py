@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Track-Guided ROI Scheduler
+--------------------------
+Runs the detector only on small crops around where the tracker expects
+the targets to be, and on the full frame periodically to pick up new ones.
+
+The track stage publishes the Kalman states of confirmed and tentative
+(not yet activated) tracks after each update - a target found by a
+full-frame pass needs a crop on the next frame to be confirmed. The
+detect stage extrapolates them to the current frame, cuts one
+square ROI per track (overlapping ROIs are merged), runs all crops as one
+batch and maps the boxes back to frame coordinates. Boxes cut by an inner
+ROI edge are dropped (a partial box would shrink the track) and the next
+frame runs full. A full-frame pass also runs every `full_frame_interval`
+frames, whenever there are no tracks, when a track goes lost, or when the
+ROIs would not be cheaper than the full frame.
+"""
+
+import numpy as np
+
+from src.core.detectors.base_detector import empty_detections
+from src.core.detectors.box_merge import drop_cut_boxes, to_frame_coords
+from src.utils.logger import logger
+
+# Track durumu en fazla bu kadar frame ileri tahmin edilir
+MAX_PREDICTION_STEPS = 5
+# ROI'lerin toplam giriş pikseli tam frame girişinin bu oranını geçerse tam frame çalıştırılır
+MAX_ROI_PIXEL_RATIO = 0.5
+
+
+class TrackGuidedScheduler:
+    """Detect on crops around predicted tracks, full frame every N frames."""
+
+    # Tespitler her zaman detector'den gelir (yayılım yok)
+    last_propagated = False
+
+    def __init__(self, detector, full_frame_interval=10, margin=1.0, roi_size=256):
+        """
+        Args:
+            detector: Detector (ROI'ler için dynamic_input gerekli)
+            full_frame_interval: Tam frame tespit aralığı (frame)
+            margin: Tahmini kutunun her yanına eklenen pay (kutu boyutu oranı)
+            roi_size: ROI kırpımlarının model giriş boyutu (kare, piksel)
+        """
+        self.detector = detector
+        self.full_frame_interval = max(1, int(full_frame_interval))
+        self.margin = margin
+        self.roi_size = int(roi_size)
+        self.enabled = detector.dynamic_input
+        if not self.enabled:
+            logger.warning(f"⚠️ {detector.name} sabit giriş boyutlu - ROI tespiti kapalı, her frame tam tespit")
+
+        self._hint = None               # (frame_index, Nx8 Kalman state'leri) - track stage yazar
+        self._force_full = True
+        self._last_lost_count = 0
+        self._last_full_index = None
+        self.stats = {"full_frames": 0, "roi_frames": 0, "rois": 0, "cut_boxes": 0,
+                      "input_pixels": 0, "full_input_pixels": 0}
+
+    def reset(self):
+        """Track'ler sıfırlandı (resume / kaynak değişimi) - sonraki frame tam tespit"""
+        self._hint = None
+        self._last_lost_count = 0
+        self._force_full = True
+
+    def update_tracks(self, means, frame_index, lost_count, scores=None, tentative_means=None):
+        """
+        Track stage'den çağrılır: track'lerin Kalman state'lerini yayınla
+
+        Args:
+            means: Nx8 [cx, cy, a, h, vx, vy, va, vh] onaylı track'ler (tam çözünürlük pikseli)
+            frame_index: Bu state'in ait olduğu frame sırası
+            lost_count: Kayıp track sayısı - artarsa yeni hedef araması için tam tespit
+            scores: Track skorları (kullanılmaz - zamanlayıcı arayüzü için)
+            tentative_means: Mx8 henüz onaylanmamış track'ler - bunlara da ROI açılır,
+                             yoksa ilk tespitten sonraki frame'de kaybolup hiç onaylanmazlar
+        """
+        if lost_count > self._last_lost_count:
+            self._force_full = True
+        self._last_lost_count = lost_count
+        means = np.asarray(means, dtype=np.float64).reshape(-1, 8)
+        if tentative_means is not None and len(tentative_means):
+            means = np.vstack([means, np.asarray(tentative_means, dtype=np.float64).reshape(-1, 8)])
+        self._hint = (frame_index, means)
+
+    def detect(self, frame, conf, frame_index, scale=1):
+        """
+        Returns:
+            np.ndarray: Nx5 [x1, y1, x2, y2, score] (frame koordinatları)
+        """
+        rois = None
+        if self.enabled and not self._force_full and self._last_full_index is not None \
+                and frame_index - self._last_full_index < self.full_frame_interval:
+            rois = self._plan_rois(frame.shape, frame_index, scale)
+
+        if rois is None:
+            self._force_full = False
+            self._last_full_index = frame_index
+            self.stats["full_frames"] += 1
+            self._count_pixels(frame.shape, None)
+            return self.detector.detect(frame, conf)
+
+        self.stats["roi_frames"] += 1
+        self.stats["rois"] += len(rois)
+        self._count_pixels(frame.shape, len(rois))
+        crops = [frame[y1:y2, x1:x2] for x1, y1, x2, y2 in rois]
+        results = self.detector.detect_batch(crops, conf, input_size=self.roi_size)
+
+        merged = []
+        for roi, result in zip(rois, results):
+            kept = drop_cut_boxes(result, roi, frame.shape)
+            if len(kept) < len(result):
+                # ROI kenarı balonu kesiyor - kısmi kutu track'e karışmasın, sonraki frame tam tespit
+                self.stats["cut_boxes"] += len(result) - len(kept)
+                self._force_full = True
+            if len(kept):
+                merged.append(to_frame_coords(kept, roi))
+        return np.concatenate(merged) if merged else empty_detections()
+
+    def _plan_rois(self, frame_shape, frame_index, scale):
+        """
+        Tahmini track kutularından ROI listesi (frame koordinatları)
+
+        Returns:
+            list veya None: [(x1, y1, x2, y2), ...]; None = tam frame çalıştır
+        """
+        hint = self._hint
+        if hint is None or len(hint[1]) == 0:
+            return None
+        hint_index, means = hint
+
+        # Sabit hız modeli ile mevcut frame'e ilerlet
+        steps = float(np.clip(frame_index - hint_index, 1, MAX_PREDICTION_STEPS))
+        cx = means[:, 0] + means[:, 4] * steps
+        cy = means[:, 1] + means[:, 5] * steps
+        h = np.maximum(means[:, 3] + means[:, 7] * steps, 1.0)
+        w = np.maximum((means[:, 2] + means[:, 6] * steps) * h, 1.0)
+        travel = np.hypot(means[:, 4], means[:, 5]) * steps
+
+        # Kare ROI: kutu + her yana margin + beklenen yer değiştirme
+        half = (0.5 * np.maximum(w, h) * (1.0 + 2.0 * self.margin) + travel) / scale
+        half = np.maximum(half, self.roi_size / 4.0)
+        cx, cy = cx / scale, cy / scale
+
+        frame_h, frame_w = frame_shape[:2]
+        boxes = np.stack([cx - half, cy - half, cx + half, cy + half], axis=1)
+        boxes[:, [0, 2]] = np.clip(boxes[:, [0, 2]], 0, frame_w)
+        boxes[:, [1, 3]] = np.clip(boxes[:, [1, 3]], 0, frame_h)
+        rois = _merge_overlapping([tuple(int(round(v)) for v in box) for box in boxes])
+        rois = [roi for roi in rois if roi[2] - roi[0] >= 8 and roi[3] - roi[1] >= 8]
+        if not rois:
+            return None
+
+        # ROI batch'i tam frame'den ucuz değilse tam frame çalıştır
+        full_pixels = self.detector.input_size * self.detector.input_size
+        if len(rois) * self.roi_size * self.roi_size > MAX_ROI_PIXEL_RATIO * full_pixels:
+            return None
+        return rois
+
+    def _count_pixels(self, frame_shape, roi_count):
+        input_size = self.detector.input_size
+        full = input_size * input_size * min(frame_shape[0], frame_shape[1]) / max(frame_shape[0], frame_shape[1])
+        self.stats["full_input_pixels"] += full
+        self.stats["input_pixels"] += full if roi_count is None else roi_count * self.roi_size * self.roi_size
+
+    def get_stats(self, reset=True):
+        """
+        Returns:
+            dict: full_frames, roi_frames, rois, cut_boxes (ROI kenarında atılan kutular),
+                  pixel_ratio (detector pikseli / hep tam frame olsaydı)
+        """
+        stats = dict(self.stats)
+        stats["pixel_ratio"] = stats["input_pixels"] / stats["full_input_pixels"] if stats["full_input_pixels"] else 1.0
+        if reset:
+            for key in self.stats:
+                self.stats[key] = 0
+        return stats
+
+    def format_stats(self, reset=True):
+        stats = self.get_stats(reset)
+        return (f"Tam frame: {stats['full_frames']}, ROI frame: {stats['roi_frames']} ({stats['rois']} ROI), "
+                f"Kesik kutu: {stats['cut_boxes']}, Detector pikseli: %{stats['pixel_ratio'] * 100:.0f}")
+
+
+def _merge_overlapping(rois):
+    """Kesişen dikdörtgenleri birleştir (aynı balon iki kırpımda iki kez tespit edilmesin)"""
+    rois = list(rois)
+    merged = True
+    while merged and len(rois) > 1:
+        merged = False
+        for i in range(len(rois)):
+            for j in range(i + 1, len(rois)):
+                a, b = rois[i], rois[j]
+                if a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]:
+                    rois[i] = (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
+                    del rois[j]
+                    merged = True
+                    break
+            if merged:
+                break
+    return rois
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyTorch Detector
+----------------
+Detector backends for ultralytics YOLO .pt models: TorchDetector goes
+through the ultralytics predictor (the original path), DirectTorchDetector
+runs the network forward directly with its own pre/post-processing.
+"""
+
+import cv2
+import numpy as np
+
+from src.core.detectors.base_detector import Detector, empty_detections
+from src.core.detectors.yolo_postprocess import Letterbox, decode_yolov8
+
+
+class TorchDetector(Detector):
+    """ultralytics.YOLO backend - GPU varsa orada, yoksa CPU'da çalışır."""
+
+    name = "torch"
+    dynamic_input = True
+
+    def __init__(self, model, input_size=640, iou_threshold=0.45, classes=None):
+        """
+        Args:
+            model: Yüklenmiş ultralytics.YOLO modeli veya .pt dosya yolu
+        """
+        super().__init__(input_size, iou_threshold, classes)
+        if isinstance(model, str):
+            from ultralytics import YOLO
+            self.model_path = model
+            model = YOLO(model)
+        else:
+            self.model_path = getattr(model, "ckpt_path", None)
+        self.model = model
+
+    def detect(self, frame, conf):
+        results = self.model(
+            source=frame,
+            verbose=False,
+            conf=conf,
+            iou=self.iou_threshold,
+            imgsz=self.input_size,
+            classes=self.classes,
+            save=False,
+            stream=False
+        )[0]
+        return self._to_detections(results)
+
+    def detect_batch(self, frames, conf, input_size=None):
+        if not frames:
+            return []
+        results = self.model(
+            source=list(frames),
+            verbose=False,
+            conf=conf,
+            iou=self.iou_threshold,
+            imgsz=input_size or self.input_size,
+            classes=self.classes,
+            save=False,
+            stream=False
+        )
+        return [self._to_detections(r) for r in results]
+
+    @staticmethod
+    def _to_detections(results):
+        if results.boxes is None or len(results.boxes) == 0:
+            return empty_detections()
+        boxes = results.boxes.xyxy.cpu().numpy()
+        scores = results.boxes.conf.cpu().numpy()
+        return np.hstack([boxes, scores[:, None]]).astype(np.float32, copy=False)
+
+
+class DirectTorchDetector(Detector):
+    """
+    Lean torch backend: calls the network's forward directly.
+
+    Bypasses the ultralytics predictor (source checks, a new letterbox per
+    call, Results objects, separate .cpu() copies per field). Keeps
+    preallocated input tensors, letterboxes rectangularly (640x480 stays
+    640x480), filters candidates by score on the device and returns one Nx5
+    numpy array after NMS. Batches of same-size crops run in one forward.
+    """
+
+    name = "torch_direct"
+    dynamic_input = True
+
+    def __init__(self, model, input_size=640, iou_threshold=0.45, classes=None, threads=0):
+        """
+        Args:
+            model: Yüklenmiş ultralytics.YOLO modeli, PyTorch ağı veya .pt dosya yolu
+            threads: CPU'da torch thread sayısı (0 = torch varsayılanı)
+        """
+        import torch
+
+        super().__init__(input_size, iou_threshold, classes)
+        if isinstance(model, str):
+            from ultralytics import YOLO
+            self.model_path = model
+            model = YOLO(model)
+        else:
+            self.model_path = getattr(model, "ckpt_path", None)
+
+        net = getattr(model, "model", model)
+        if not isinstance(net, torch.nn.Module):
+            raise TypeError("Doğrudan forward için PyTorch modeli gerekli (.pt)")
+
+        if threads:
+            torch.set_num_threads(threads)
+        self.torch = torch
+        self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+        self.dtype = torch.float16 if self.device.type == "cuda" else torch.float32
+        if hasattr(net, "fuse"):
+            net = net.fuse(verbose=False)
+        self.net = net.to(self.device, self.dtype).eval()
+        for param in self.net.parameters():
+            param.requires_grad_(False)
+
+        self.stride = int(max(getattr(self.net, "stride", [32])))
+        self.letterbox = Letterbox(self.input_size, rect=True, stride=self.stride)
+        # (boyut, rect) → Letterbox ve (B, H, W) → (rgb, staging, input) tampon önbellekleri
+        self._letterboxes = {(self.input_size, True): self.letterbox}
+        self._buffers = {}
+
+    def _get_letterbox(self, size, rect):
+        letterbox = self._letterboxes.get((size, rect))
+        if letterbox is None:
+            letterbox = Letterbox(size, rect=rect, stride=self.stride)
+            self._letterboxes[(size, rect)] = letterbox
+        return letterbox
+
+    def _get_buffers(self, batch, height, width):
+        """Verilen batch / giriş boyutu için önceden ayrılmış tamponlar"""
+        key = (batch, height, width)
+        buffers = self._buffers.get(key)
+        if buffers is None:
+            rgb = np.empty((batch, height, width, 3), dtype=np.uint8)
+            staging = self.torch.from_numpy(rgb).permute(0, 3, 1, 2)
+            tensor = self.torch.empty((batch, 3, height, width), dtype=self.dtype, device=self.device)
+            buffers = (rgb, staging, tensor)
+            self._buffers[key] = buffers
+        return buffers
+
+    def set_input_size(self, size):
+        super().set_input_size(size)
+        self.letterbox = self._get_letterbox(self.input_size, True)
+        return True
+
+    def detect(self, frame, conf):
+        return self._run([frame], conf, self.letterbox)[0]
+
+    def detect_batch(self, frames, conf, input_size=None):
+        if not frames:
+            return []
+        size = int(input_size or self.input_size)
+        if len(frames) == 1:
+            return self._run(frames, conf, self._get_letterbox(size, True))
+        # Farklı boyutlu kırpımlar kare letterbox ile aynı giriş boyutuna getirilip tek forward'da çalışır
+        return self._run(frames, conf, self._get_letterbox(size, False))
+
+    def _run(self, frames, conf, letterbox):
+        height, width = letterbox.input_shape(frames[0].shape)
+        rgb, staging, tensor = self._get_buffers(len(frames), height, width)
+
+        transforms = []
+        for i, frame in enumerate(frames):
+            image, ratio, pad = letterbox(frame)
+            cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=rgb[i])
+            transforms.append((ratio, pad, frame.shape))
+        tensor.copy_(staging, non_blocking=True)
+        tensor.mul_(1.0 / 255.0)
+
+        results = []
+        with self.torch.inference_mode():
+            output = self.net(tensor)
+            if isinstance(output, (list, tuple)):
+                output = output[0]
+            # Sadece eşiği geçen adaylar host'a kopyalanır
+            keep = output[:, 4:].amax(dim=1) >= conf
+            for i, (ratio, pad, frame_shape) in enumerate(transforms):
+                if not bool(keep[i].any()):
+                    results.append(empty_detections())
+                    continue
+                candidates = output[i][:, keep[i]].float().cpu().numpy()
+                results.append(decode_yolov8(candidates, conf, self.iou_threshold, ratio, pad,
+                                             frame_shape, self.classes))
+        return results
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+YOLO Pre/Post-processing
+------------------------
+Letterbox preprocessing and YOLOv8 output decoding for the exported
+(ONNX / OpenVINO) detector backends. Uses OpenCV primitives only, so no
+torch is needed at inference time.
+"""
+
+import cv2
+import numpy as np
+
+from src.core.detectors.base_detector import empty_detections
+
+LETTERBOX_COLOR = (114, 114, 114)
+
+
+class Letterbox:
+    """
+    Resize + pad a frame into the model input, reusing one buffer.
+
+    In square mode the input is always size x size. In rect mode the long
+    side is scaled to size and the short side is only padded up to the next
+    stride multiple (640x480 → 640x480 instead of 640x640); only for
+    networks that accept dynamic input shapes.
+
+    The buffer and padding are only rebuilt when the frame size changes; the
+    returned (ratio, pad) map boxes back to frame coordinates.
+    """
+
+    def __init__(self, size, rect=False, stride=32):
+        self.size = int(size)
+        self.rect = rect
+        self.stride = int(stride)
+        self._buffer = np.full((self.size, self.size, 3), LETTERBOX_COLOR, dtype=np.uint8)
+        self._last_layout = None
+        self._geometry = None
+
+    def _layout(self, w, h):
+        ratio = min(self.size / h, self.size / w)
+        new_w, new_h = int(round(w * ratio)), int(round(h * ratio))
+        if self.rect:
+            out_w = -(-new_w // self.stride) * self.stride
+            out_h = -(-new_h // self.stride) * self.stride
+        else:
+            out_w = out_h = self.size
+        pad_x = (out_w - new_w) // 2
+        pad_y = (out_h - new_h) // 2
+        return ratio, new_w, new_h, out_w, out_h, pad_x, pad_y
+
+    def input_shape(self, frame_shape):
+        """Verilen frame boyutu için model giriş boyutu (h, w)"""
+        _, _, _, out_w, out_h, _, _ = self._layout(frame_shape[1], frame_shape[0])
+        return out_h, out_w
+
+    def __call__(self, frame):
+        """
+        Returns:
+            (image, ratio, (pad_x, pad_y)): BGR uint8 model girişi ve dönüşüm
+        """
+        h, w = frame.shape[:2]
+        layout = (w, h)
+        if layout != self._last_layout:
+            # Boyut değişti - tamponu / dolgu bölgesini yeniden hazırla
+            self._geometry = self._layout(w, h)
+            out_w, out_h = self._geometry[3], self._geometry[4]
+            if self._buffer.shape[:2] != (out_h, out_w):
+                self._buffer = np.empty((out_h, out_w, 3), dtype=np.uint8)
+            self._buffer[:] = LETTERBOX_COLOR
+            self._last_layout = layout
+        ratio, new_w, new_h, _, _, pad_x, pad_y = self._geometry
+
+        target = self._buffer[pad_y:pad_y + new_h, pad_x:pad_x + new_w]
+        if (new_w, new_h) == (w, h):
+            target[:] = frame
+        else:
+            cv2.resize(frame, (new_w, new_h), dst=target, interpolation=cv2.INTER_LINEAR)
+        return self._buffer, ratio, (pad_x, pad_y)
+
+
+def to_blob(image):
+    """BGR uint8 HWC → RGB float32 NCHW [0, 1] (tek geçiş)"""
+    return cv2.dnn.blobFromImage(image, scalefactor=1.0 / 255.0, swapRB=True)
+
+
+def decode_yolov8(output, conf, iou_threshold, ratio, pad, frame_shape, classes=None, max_det=300):
+    """
+    Decode a raw YOLOv8 head output into Nx5 frame-coordinate detections.
+
+    Args:
+        output: (1, 4 + nc, A) veya (4 + nc, A) ham çıktı (cx, cy, w, h, sınıf skorları)
+        conf: Minimum skor
+        iou_threshold: NMS IoU eşiği (sınıf bazında)
+        ratio, pad: Letterbox dönüşümü
+        frame_shape: Orijinal frame shape (kırpma için)
+        classes: Sadece bu sınıflar (None = hepsi)
+
+    Returns:
+        np.ndarray: Nx5 [x1, y1, x2, y2, score] float32
+    """
+    pred = output[0] if output.ndim == 3 else output
+    class_scores = pred[4:]
+    if classes is not None:
+        class_scores = class_scores[list(classes)]
+    class_ids = class_scores.argmax(axis=0)
+    scores = class_scores[class_ids, np.arange(class_scores.shape[1])]
+
+    keep = scores >= conf
+    if not np.any(keep):
+        return empty_detections()
+    boxes = pred[:4, keep].T
+    scores = scores[keep]
+    class_ids = class_ids[keep]
+
+    # cx, cy, w, h → x, y, w, h (NMS) - letterbox koordinatlarında
+    xywh = boxes.copy()
+    xywh[:, :2] -= xywh[:, 2:] / 2
+    if hasattr(cv2.dnn, "NMSBoxesBatched"):
+        indices = cv2.dnn.NMSBoxesBatched(xywh.tolist(), scores.tolist(), class_ids.tolist(), conf, iou_threshold)
+    else:
+        # Sınıflar ayrık kalsın diye kutular sınıf id'si ile kaydırılır
+        shifted = xywh.copy()
+        shifted[:, :2] += class_ids[:, None] * 4096.0
+        indices = cv2.dnn.NMSBoxes(shifted.tolist(), scores.tolist(), conf, iou_threshold)
+    indices = np.asarray(indices, dtype=np.int64).reshape(-1)[:max_det]
+    if indices.size == 0:
+        return empty_detections()
+
+    selected = xywh[indices]
+    detections = np.empty((len(indices), 5), dtype=np.float32)
+    pad_x, pad_y = pad
+    detections[:, 0] = (selected[:, 0] - pad_x) / ratio
+    detections[:, 1] = (selected[:, 1] - pad_y) / ratio
+    detections[:, 2] = (selected[:, 0] + selected[:, 2] - pad_x) / ratio
+    detections[:, 3] = (selected[:, 1] + selected[:, 3] - pad_y) / ratio
+    detections[:, 4] = scores[indices]
+
+    h, w = frame_shape[:2]
+    detections[:, [0, 2]] = np.clip(detections[:, [0, 2]], 0, w)
+    detections[:, [1, 3]] = np.clip(detections[:, [1, 3]], 0, h)
+    return detections
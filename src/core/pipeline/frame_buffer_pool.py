@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Frame Buffer Pool
+-----------------
+Reusable full-frame buffers for the tracking pipeline.
+Capture (cap.read(image=...)), undistortion (remap dst=) and display resize
+(resize dst=) write into pooled buffers, so in steady state no large arrays
+are allocated per frame. Allocation counters make this verifiable.
+"""
+
+import threading
+import weakref
+
+import numpy as np
+
+
+class FrameBufferPool:
+    """
+    Thread-safe pool of numpy buffers keyed by (shape, dtype).
+
+    The pool grows on demand: when no free buffer of the requested shape is
+    available a new one is allocated and counted. Once the pipeline reaches its
+    maximum number of frames in flight, all requests are served from released
+    buffers and the allocation counter stops increasing.
+    """
+
+    def __init__(self, max_free_per_shape=32, name="FramePool"):
+        """
+        Args:
+            max_free_per_shape: Shape başına saklanacak maksimum boş buffer sayısı
+            name: İstatistiklerde görünen ad
+        """
+        self.name = name
+        self.max_free_per_shape = max_free_per_shape
+
+        self._lock = threading.Lock()
+        self._free = {}    # (shape, dtype) -> [ndarray, ...]
+        # id(buffer) -> buffer (zayıf referans): sızan buffer GC'ye gidince kaydı da silinir,
+        # böylece yeniden kullanılan id() başka bir diziyi havuza ait göstermez
+        self._owned = weakref.WeakValueDictionary()
+
+        # İstatistikler
+        self.allocations = 0
+        self.allocated_bytes = 0
+        self.reuses = 0
+        self.releases = 0
+        self.foreign_releases = 0
+
+    def acquire(self, shape, dtype=np.uint8):
+        """
+        Get a buffer of the given shape (contents are undefined).
+
+        Returns:
+            np.ndarray: Havuza ait buffer (iş bitince release() ile geri verilmeli)
+        """
+        key = (tuple(shape), np.dtype(dtype).str)
+        with self._lock:
+            free = self._free.get(key)
+            if free:
+                self.reuses += 1
+                return free.pop()
+
+            buffer = np.empty(key[0], dtype=dtype)
+            self._owned[id(buffer)] = buffer
+            self.allocations += 1
+            self.allocated_bytes += buffer.nbytes
+            return buffer
+
+    def release(self, buffer):
+        """
+        Return a buffer to the pool.
+
+        Buffers that were not created by this pool are ignored, so callers can
+        release frames without checking where they came from.
+        """
+        if buffer is None:
+            return
+        with self._lock:
+            if self._owned.get(id(buffer)) is not buffer:
+                self.foreign_releases += 1
+                return
+
+            key = (buffer.shape, buffer.dtype.str)
+            free = self._free.setdefault(key, [])
+            if any(b is buffer for b in free):
+                return  # Çift release - yok say
+
+            self.releases += 1
+            if len(free) < self.max_free_per_shape:
+                free.append(buffer)
+            else:
+                # Fazla buffer - havuzdan çıkar ve GC'ye bırak
+                del self._owned[id(buffer)]
+
+    def owns(self, buffer):
+        with self._lock:
+            return buffer is not None and self._owned.get(id(buffer)) is buffer
+
+    def get_stats(self):
+        """Allocation counters for verifying the steady state."""
+        with self._lock:
+            free_count = sum(len(v) for v in self._free.values())
+            return {
+                "allocations": self.allocations,
+                "allocated_mb": self.allocated_bytes / (1024 * 1024),
+                "reuses": self.reuses,
+                "releases": self.releases,
+                "foreign_releases": self.foreign_releases,
+                "owned": len(self._owned),
+                "free": free_count,
+                "in_use": len(self._owned) - free_count,
+            }
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Frame Context
+-------------
+Per-frame state carried between the stages of the tracking pipeline.
+"""
+
+import numpy as np
+
+
+class FrameContext:
+    """
+    Everything the pipeline stages know about one captured frame.
+
+    Stages fill the fields in order: preprocess sets `frame`, detect sets
+    `detections`, track sets `tracks`/`detection_list`, render sets
+    `display_frame`.
+
+    With raw MJPEG capture `source` holds the undecoded frame and `frame` is
+    a reduced decode (1/`scale` of full resolution). Detections, tracks and
+    motor coordinates are always in full-resolution pixels.
+    """
+
+    def __init__(self, frame, seq, timestamp, buffer_pool=None, source=None):
+        self.frame = frame              # İşlenen görüntü (BGR)
+        self.seq = seq                  # Kamera frame sıra numarası
+        self.timestamp = timestamp      # Yakalama zamanı (time.monotonic)
+        self.source = source            # Ham MJPEG frame (MjpegFrame) veya None
+        self.scale = 1                  # Tam çözünürlük / frame çözünürlüğü
+        self.frame_index = 0            # Pipeline'da işlenen frame sırası (detect stage atar)
+        self.propagated = False         # Tespitler detector yerine track yayılımından mı geldi
+
+        self.detections = None          # Nx5 [x1, y1, x2, y2, score]
+        self.tracks = []                # Çizim için track bilgileri
+        self.detection_list = []        # Motor kontrol için detection listesi
+        self.tracked_count = 0
+        self.lost_count = 0
+        self.display_frame = None       # Ekrana gönderilecek görüntü
+
+        # Havuzdan alınan buffer'lar - frame pipeline'dan çıkınca geri verilir
+        self.buffer_pool = buffer_pool
+        self._buffers = [frame] if buffer_pool is not None and frame is not None else []
+
+    @property
+    def frame_size(self):
+        """Full-resolution (width, height) of the captured frame."""
+        if self.source is not None and self.source.size is not None:
+            return self.source.size
+        height, width = self.frame.shape[:2]
+        return width * self.scale, height * self.scale
+
+    def acquire_buffer(self, shape, dtype=np.uint8):
+        """Bu frame'in ömrü boyunca kullanılacak bir havuz buffer'ı al (havuz yoksa None)."""
+        if self.buffer_pool is None:
+            return None
+        buffer = self.buffer_pool.acquire(shape, dtype)
+        self._buffers.append(buffer)
+        return buffer
+
+    def replace_frame(self, new_frame):
+        """
+        Swap the working frame (e.g. after undistortion) and return the old
+        frame's buffer to the pool right away.
+        """
+        old_frame = self.frame
+        self.frame = new_frame
+        if self.buffer_pool is not None and new_frame is not old_frame:
+            for i, buffer in enumerate(self._buffers):
+                if buffer is old_frame:
+                    del self._buffers[i]
+                    self.buffer_pool.release(buffer)
+                    break
+
+    def release(self):
+        """Return all pooled buffers (idempotent)."""
+        if self.buffer_pool is None:
+            return
+        buffers, self._buffers = self._buffers, []
+        for buffer in buffers:
+            self.buffer_pool.release(buffer)
+        self.frame = None
+        self.source = None
+        self.display_frame = None
@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Pipeline Engine
+---------------
+Generic multi-stage processing engine.
+Each stage runs on its own worker thread and stages are connected by bounded
+queues with a configurable drop policy, so slow stages never stall the ones
+in front of them and per-stage throughput can be measured.
+"""
+
+import time
+import threading
+from collections import deque
+
+from src.utils.logger import logger
+
+
+DROP_POLICIES = ("block", "drop_oldest", "drop_newest")
+
+# Kaynak stage'in akış sonunu bildirmek için döndürdüğü işaret
+END_OF_STREAM = object()
+
+
+class StageQueue:
+    """
+    Bounded queue between two pipeline stages.
+
+    Drop policies:
+    - block: producer waits until there is room
+    - drop_oldest: the oldest queued item is discarded to make room
+    - drop_newest: the incoming item is discarded when the queue is full
+    """
+
+    def __init__(self, name, maxsize=2, drop_policy="drop_oldest", on_drop=None):
+        if drop_policy not in DROP_POLICIES:
+            raise ValueError(f"Geçersiz drop policy: {drop_policy} (seçenekler: {DROP_POLICIES})")
+
+        self.name = name
+        self.maxsize = max(1, int(maxsize))
+        self.drop_policy = drop_policy
+        self.on_drop = on_drop
+
+        self._items = deque()
+        self._condition = threading.Condition()
+        self._closed = False
+
+        # İstatistikler
+        self.put_count = 0
+        self.dropped = 0
+        self.max_depth = 0
+
+    def put(self, item):
+        """
+        Put an item into the queue according to the drop policy.
+
+        END_OF_STREAM is never dropped.
+
+        Returns:
+            bool: Item kuyruğa alındı mı
+        """
+        dropped_item = None
+        with self._condition:
+            if self._closed:
+                dropped_item = item
+            elif len(self._items) >= self.maxsize and item is not END_OF_STREAM:
+                if self.drop_policy == "drop_newest":
+                    dropped_item = item
+                elif self.drop_policy == "drop_oldest":
+                    dropped_item = self._items.popleft()
+                else:
+                    while len(self._items) >= self.maxsize and not self._closed:
+                        self._condition.wait(0.1)
+                    if self._closed:
+                        dropped_item = item
+
+            if dropped_item is not item:
+                self._items.append(item)
+                self.put_count += 1
+                self.max_depth = max(self.max_depth, len(self._items))
+                self._condition.notify_all()
+
+            if dropped_item is not None:
+                self.dropped += 1
+
+        if dropped_item is not None and dropped_item is not END_OF_STREAM:
+            self._release(dropped_item)
+        return dropped_item is not item
+
+    def get(self, timeout=0.1):
+        """Take the oldest item, or None if nothing arrived within timeout."""
+        with self._condition:
+            if not self._items and not self._closed:
+                self._condition.wait(timeout)
+            if not self._items:
+                return None
+            item = self._items.popleft()
+            self._condition.notify_all()
+            return item
+
+    def depth(self):
+        with self._condition:
+            return len(self._items)
+
+    def close(self):
+        """Wake up all waiters and discard remaining items."""
+        with self._condition:
+            self._closed = True
+            remaining = list(self._items)
+            self._items.clear()
+            self._condition.notify_all()
+        for item in remaining:
+            if item is not END_OF_STREAM:
+                self._release(item)
+
+    def _release(self, item):
+        if self.on_drop:
+            try:
+                self.on_drop(item)
+            except Exception as e:
+                logger.debug(f"Kuyruk {self.name} drop callback hatası: {e}")
+
+
+class PipelineStage:
+    """
+    One worker thread of the pipeline.
+
+    The stage function receives one item and returns the item to forward to
+    the next stage, or None when the item was consumed/filtered (the item is
+    then passed to the release callback). A source stage (no input queue) is
+    called without arguments and may return END_OF_STREAM to finish the
+    pipeline.
+    """
+
+    def __init__(self, name, func, input_queue=None, output_queue=None, on_drop=None):
+        self.name = name
+        self.func = func
+        self.input_queue = input_queue
+        self.output_queue = output_queue
+        self.on_drop = on_drop
+
+        self._thread = None
+        self._running = False
+        self.finished = threading.Event()
+
+        # Zamanlama istatistikleri
+        self._stats_lock = threading.Lock()
+        self.processed = 0
+        self.errors = 0
+        self.busy_time = 0.0
+        self.avg_ms = 0.0
+        self.max_ms = 0.0
+        self._window_start = time.monotonic()
+        self._window_processed = 0
+        self._window_busy = 0.0
+
+    def start(self):
+        self._running = True
+        self.finished.clear()
+        self._thread = threading.Thread(target=self._run, name=f"Stage-{self.name}")
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self, timeout=1.0):
+        self._running = False
+        if self._thread and self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join(timeout=timeout)
+        self._thread = None
+
+    def _run(self):
+        while self._running:
+            if self.input_queue is not None:
+                item = self.input_queue.get(timeout=0.1)
+                if item is None:
+                    continue
+                if item is END_OF_STREAM:
+                    self._forward(END_OF_STREAM)
+                    break
+                args = (item,)
+            else:
+                item = None
+                args = ()
+
+            start = time.perf_counter()
+            try:
+                result = self.func(*args)
+            except Exception as e:
+                self.errors += 1
+                logger.error(f"❌ Pipeline stage '{self.name}' hatası: {e}")
+                result = None
+            elapsed = time.perf_counter() - start
+
+            if result is END_OF_STREAM:
+                self._forward(END_OF_STREAM)
+                break
+
+            self._record(elapsed, counted=result is not None or item is not None)
+
+            if result is not None:
+                self._forward(result)
+            elif item is not None:
+                # Stage item'ı tüketti/filtreledi - kaynaklarını serbest bırak
+                self._release(item)
+
+        self._running = False
+        self.finished.set()
+
+    def _forward(self, item):
+        if self.output_queue is not None:
+            self.output_queue.put(item)
+        elif item is not END_OF_STREAM:
+            self._release(item)
+
+    def _release(self, item):
+        if self.on_drop:
+            try:
+                self.on_drop(item)
+            except Exception as e:
+                logger.debug(f"Stage {self.name} release hatası: {e}")
+
+    def _record(self, elapsed, counted=True):
+        if not counted:
+            return
+        ms = elapsed * 1000.0
+        with self._stats_lock:
+            self.processed += 1
+            self.busy_time += elapsed
+            self.avg_ms = ms if self.processed == 1 else self.avg_ms * 0.9 + ms * 0.1
+            self.max_ms = max(self.max_ms, ms)
+            self._window_processed += 1
+            self._window_busy += elapsed
+
+    def get_stats(self, reset_window=True):
+        """
+        Throughput and timing since the previous call.
+
+        Returns:
+            dict: name, fps, avg_ms, max_ms, utilization, queue_depth, dropped
+        """
+        now = time.monotonic()
+        with self._stats_lock:
+            window = max(now - self._window_start, 1e-6)
+            stats = {
+                "name": self.name,
+                "processed": self.processed,
+                "fps": self._window_processed / window,
+                "avg_ms": self.avg_ms,
+                "max_ms": self.max_ms,
+                "utilization": min(1.0, self._window_busy / window),
+                "errors": self.errors,
+                "queue_depth": self.input_queue.depth() if self.input_queue else 0,
+                "queue_size": self.input_queue.maxsize if self.input_queue else 0,
+                "dropped": self.input_queue.dropped if self.input_queue else 0,
+            }
+            if reset_window:
+                self._window_start = now
+                self._window_processed = 0
+                self._window_busy = 0.0
+                self.max_ms = 0.0
+        return stats
+
+
+class PipelineEngine:
+    """
+    Linear chain of PipelineStage workers connected by StageQueue's.
+
+    The first stage added is the source stage; every following stage gets an
+    input queue fed by the previous stage.
+    """
+
+    def __init__(self, name="Pipeline", queue_size=2, drop_policy="drop_oldest", on_drop=None):
+        self.name = name
+        self.queue_size = queue_size
+        self.drop_policy = drop_policy
+        self.on_drop = on_drop
+        self.stages = []
+        self.queues = []
+        self._started = False
+
+    def add_stage(self, name, func, queue_size=None, drop_policy=None):
+        """
+        Append a stage to the chain.
+
+        Args:
+            name: Stage adı (istatistiklerde görünür)
+            func: Stage fonksiyonu
+            queue_size: Bu stage'in giriş kuyruğu boyutu (None = engine varsayılanı)
+            drop_policy: Bu stage'in giriş kuyruğu politikası (None = engine varsayılanı)
+        """
+        if self._started:
+            raise RuntimeError("Pipeline çalışırken stage eklenemez")
+
+        input_queue = None
+        if self.stages:
+            input_queue = StageQueue(
+                f"{self.stages[-1].name}->{name}",
+                maxsize=queue_size or self.queue_size,
+                drop_policy=drop_policy or self.drop_policy,
+                on_drop=self.on_drop
+            )
+            self.stages[-1].output_queue = input_queue
+            self.queues.append(input_queue)
+
+        stage = PipelineStage(name, func, input_queue=input_queue, on_drop=self.on_drop)
+        self.stages.append(stage)
+        return stage
+
+    def start(self):
+        if self._started:
+            return
+        # Son stage'den başla ki kaynak üretmeye başladığında tüketiciler hazır olsun
+        for stage in reversed(self.stages):
+            stage.start()
+        self._started = True
+        logger.info(f"🧵 {self.name} başlatıldı - Stage'ler: {' → '.join(s.name for s in self.stages)}")
+
+    def stop(self, timeout=1.0):
+        if not self._started:
+            return
+        for stage in self.stages:
+            stage._running = False
+        for queue in self.queues:
+            queue.close()
+        for stage in self.stages:
+            stage.stop(timeout=timeout)
+        self._started = False
+
+    def is_finished(self):
+        """True when the last stage has seen END_OF_STREAM or all workers exited."""
+        if not self.stages:
+            return True
+        return self.stages[-1].finished.is_set()
+
+    def get_stats(self, reset_window=True):
+        return [stage.get_stats(reset_window) for stage in self.stages]
+
+    def format_stats(self, stats=None):
+        """One-line summary with the bottleneck stage marked."""
+        stats = stats if stats is not None else self.get_stats()
+        if not stats:
+            return ""
+        # Kaynak stage'in süresi frame beklemeyi de içerir, darboğaz hesabına katma
+        candidates = [s for s in stats if s["queue_size"]] or stats
+        bottleneck = max(candidates, key=lambda s: s["avg_ms"])
+        parts = []
+        for s in stats:
+            marker = "*" if s is bottleneck else ""
+            part = f"{s['name']}{marker}: {s['fps']:.1f}fps {s['avg_ms']:.1f}ms"
+            if s["queue_size"]:
+                part += f" q{s['queue_depth']}/{s['queue_size']} d{s['dropped']}"
+            parts.append(part)
+        return " | ".join(parts)
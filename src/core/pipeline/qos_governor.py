@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+QoS Governor
+------------
+Keeps the pipeline inside a latency / frame-rate budget by stepping through
+an ordered list of quality levels (level 0 = full quality, each next level
+gives up a bit more quality for speed).
+
+The governor keeps a rolling estimate of end-to-end latency and output
+FPS. It degrades one level after the budget has been exceeded for
+`degrade_hold` seconds and recovers one level only after the estimate has
+stayed comfortably inside the budget (`recover_ratio`) for `recover_hold`
+seconds. A minimum dwell time after every change lets the new level show
+its effect before the next decision, so it does not oscillate.
+"""
+
+import time
+
+from src.utils.logger import logger
+
+
+class QosGovernor:
+    """Latency-budget driven quality level controller with hysteresis."""
+
+    def __init__(self, levels, target_latency_ms=0, target_fps=0, on_change=None,
+                 degrade_hold=2.0, recover_hold=6.0, recover_ratio=0.7, dwell=3.0, alpha=0.1):
+        """
+        Args:
+            levels: Seviye adları, 0 = tam kalite (ör. ["nominal", "imgsz 512", ...])
+            target_latency_ms: Uçtan uca gecikme bütçesi (0 = kullanılmaz)
+            target_fps: Minimum çıkış FPS'i (0 = kullanılmaz)
+            on_change: on_change(new_level, old_level) - seviyeyi uygular
+            degrade_hold: Bütçe bu kadar saniye aşılırsa bir seviye düşür
+            recover_hold: Bütçenin recover_ratio'su altında bu kadar saniye kalınırsa bir seviye yükselt
+            dwell: Her değişiklikten sonra karar verilmeden beklenen süre (saniye)
+            alpha: Gecikme / FPS tahmini için EMA katsayısı
+        """
+        self.levels = list(levels)
+        self.target_latency = target_latency_ms / 1000.0 if target_latency_ms else 0.0
+        self.target_fps = float(target_fps or 0)
+        self.on_change = on_change
+        self.degrade_hold = degrade_hold
+        self.recover_hold = recover_hold
+        self.recover_ratio = recover_ratio
+        self.dwell = dwell
+        self.alpha = alpha
+
+        self.level = 0
+        self.latency = None
+        self.fps = None
+        self._over_since = None
+        self._under_since = None
+        self._last_change = None
+
+    @property
+    def enabled(self):
+        return len(self.levels) > 1 and (self.target_latency > 0 or self.target_fps > 0)
+
+    def reset(self, now=None):
+        """Tahminleri sıfırla (duraklatma / kaynak değişimi) - seviye korunur"""
+        self.latency = None
+        self.fps = None
+        self._over_since = None
+        self._under_since = None
+        self._last_change = now if now is not None else time.monotonic()
+
+    def observe(self, latency_s, fps=None, now=None):
+        """
+        Bir frame'in ölçümünü ekle ve gerekirse seviye değiştir
+
+        Args:
+            latency_s: Uçtan uca gecikme (saniye)
+            fps: Çıkış FPS tahmini (None = kullanılmaz)
+
+        Returns:
+            int veya None: Yeni seviye (değişiklik olduysa)
+        """
+        if not self.enabled:
+            return None
+        now = now if now is not None else time.monotonic()
+        self.latency = latency_s if self.latency is None else self.latency + self.alpha * (latency_s - self.latency)
+        if fps:
+            self.fps = fps if self.fps is None else self.fps + self.alpha * (fps - self.fps)
+
+        if self._last_change is not None and now - self._last_change < self.dwell:
+            return None
+
+        over = (self.target_latency > 0 and self.latency > self.target_latency) or \
+               (self.target_fps > 0 and self.fps is not None and self.fps < self.target_fps)
+        under = (self.target_latency <= 0 or self.latency < self.target_latency * self.recover_ratio) and \
+                (self.target_fps <= 0 or (self.fps is not None and self.fps * self.recover_ratio > self.target_fps))
+
+        self._over_since = (self._over_since or now) if over else None
+        self._under_since = (self._under_since or now) if under else None
+
+        if over and self.level < len(self.levels) - 1 and now - self._over_since >= self.degrade_hold:
+            return self._set_level(self.level + 1, now, "bütçe aşıldı")
+        if under and self.level > 0 and now - self._under_since >= self.recover_hold:
+            return self._set_level(self.level - 1, now, "bütçe içinde")
+        return None
+
+    def _set_level(self, level, now, reason):
+        old_level, self.level = self.level, level
+        self._last_change = now
+        self._over_since = None
+        self._under_since = None
+        fps_text = f", {self.fps:.1f} FPS" if self.fps is not None else ""
+        arrow = "⬇️" if level > old_level else "⬆️"
+        logger.warning(f"{arrow} QoS seviyesi {old_level} → {level} ({self.levels[level]}) - {reason}: "
+                       f"gecikme {self.latency * 1000:.0f} ms{fps_text}")
+        if self.on_change:
+            self.on_change(level, old_level)
+        return level
+
+    def describe(self):
+        return f"{self.level} ({self.levels[self.level]})"
@@ -3,7 +3,6 @@ import time
 import torch
 import threading
 import numpy as np
-from PyQt5.QtCore import QThread
 import os
 import sys
 
@@ -24,18 +23,39 @@ try:
     # ByteTrack gerçek implementasyonu için path ekleme
     sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'OC_SORT'))
     from OC_SORT.trackers.byte_tracker.byte_tracker import BYTETracker, STrack
+    from OC_SORT.trackers.byte_tracker.soa_tracker import SoABYTETracker
+    from OC_SORT.trackers.byte_tracker.box_iou import set_iou_backend
     from OC_SORT.trackers.byte_tracker.basetrack import TrackState
 except ImportError as e:
     try:
         # Alternatif olarak OC_SORT direkten import et
         from OC_SORT.trackers.byte_tracker.byte_tracker_public import BYTETracker, STrack
+        from OC_SORT.trackers.byte_tracker.soa_tracker import SoABYTETracker
+        from OC_SORT.trackers.byte_tracker.box_iou import set_iou_backend
         from OC_SORT.trackers.byte_tracker.basetrack import TrackState
     except ImportError as e2:
         raise ImportError("ByteTracker import edilemedi. Lütfen OC_SORT kurulumunu kontrol edin.")
 
-from ultralytics import YOLO
+from src.core.detectors.detector_factory import create_detector
+from src.core.detectors.roi_scheduler import TrackGuidedScheduler
+from src.core.detectors.keyframe_scheduler import KeyframeScheduler
+from src.core.detectors.foveated_detector import FoveatedDetector
+from src.core.detectors.motion_gate import MotionGate
+from src.core.detectors.base_detector import empty_detections
+from src.core.pipeline.qos_governor import QosGovernor
+from src.core.detectors.tiled_detector import TiledDetector
+from src.core.capture.camera_source import CameraSource
+from src.core.capture.camera_inventory import camera_inventory
+from src.core.capture.frame_grabber import LatestFrameGrabber
+from src.core.capture.mjpeg_decoder import MjpegFrame, choose_reduction, enable_raw_mjpeg
+from src.core.pipeline.pipeline_engine import PipelineEngine, END_OF_STREAM
+from src.core.pipeline.frame_context import FrameContext
+from src.core.pipeline.frame_buffer_pool import FrameBufferPool
 from src.utils.visuals import draw_annotations, assign_class_to_track, draw_overlay_info
 
+# İlk frame'e karşı kararlı durum detect süresi bu kadar frame sonra loglanır
+DETECT_LATENCY_SAMPLES = 30
+
 # ByteTracker parametreleri için arguments class
 class Args:
     def __init__(self):
@@ -44,6 +64,7 @@ class Args:
         self.track_buffer = config.track_buffer  # Buffer size
         self.match_thresh = config.match_thresh  # Association threshold
         self.mot20 = False       # MOT20 dataset flag
+        self.motion_gating = config.track_motion_gating  # Kalman Mahalanobis kapısı (toplu hesap)
         
         # Performans için optimize edilmiş parametreler
         self.min_box_area = 100  # Minimum detection area
@@ -64,7 +85,7 @@ def run_bytetrack_tracking(source, model_path, video_display, confidence_thresho
     reset_bytetrack_tracking()
     
     logger.info(f"🔄 ByteTracker başlatılıyor - Model: {model_path}")
-    model = YOLO(model_path)
+    model = create_detector(model_path)
     _run_bytetrack_with_loaded_model(source, model, video_display, confidence_threshold)
 
 
@@ -78,243 +99,861 @@ def run_bytetrack_with_model(source, loaded_model, video_display, confidence_thr
 
 def _run_bytetrack_with_loaded_model(source, model, video_display, confidence_threshold=0.3, motor_controller=None):
     """Ortak tracking fonksiyonu - loaded model ile çalışır"""
-    labels = model.names
-    logger.info(f"📹 Kamera bağlantısı açılıyor: {source}")
-    
-    # Kamera kalibrasyonu setup
-    calibration_service = None
-    if CALIBRATION_AVAILABLE:
+    pipeline = ByteTrackPipeline(source, model, video_display, confidence_threshold, motor_controller)
+    if not pipeline.open():
+        return
+    pipeline.run(stop_event)
+
+
+class ByteTrackPipeline:
+    """
+    Stage'lere bölünmüş ByteTrack+ tracking pipeline'ı.
+
+    capture → preprocess (undistort) → detect → track → render → publish
+
+    Her stage kendi thread'inde çalışır ve stage'ler sınırlı kuyruklarla
+    bağlıdır. Böylece bir frame render/display edilirken sonraki frame'in
+    inference'ı devam eder.
+
+    Pipeline uzun ömürlü kullanılabilir: pause()/resume() kamerayı, modeli ve
+    kalibrasyon tablolarını açık/sıcak tutar; reconfigure() confidence'ı bir
+    sonraki frame'de, kaynağı ise sadece kamerayı değiştirerek uygular.
+    """
+
+    def __init__(self, source, model, video_display, confidence_threshold=0.3, motor_controller=None):
+        self.source = source
+        self.model = model
+        # ultralytics.YOLO modeli veya hazır Detector - hepsi Nx5 [x1, y1, x2, y2, score] döndürür
+        self.detector = create_detector(model)
+        # Tiled: örtüşen native çözünürlüklü tile'lar (+ kaba tam frame) tek batch'te
+        # Fovea: hedefin tutulduğu merkez native çözünürlükte, tüm frame düşük çözünürlükte (tek batch)
+        self.tiled = None
+        self.fovea = None
+        if config.detector_tiling:
+            if config.detector_fovea:
+                logger.warning("⚠️ Tiled tespit açık - fovea modu kullanılmayacak")
+            self.tiled = TiledDetector(self.detector, config.detector_tile_size,
+                                       config.detector_tile_overlap, config.detector_tile_coarse)
+            self.detector = self.tiled
+        elif config.detector_fovea:
+            self.fovea = FoveatedDetector(self.detector, config.detector_fovea_size)
+            self.detector = self.fovea
+        # Track'lerin etrafındaki ROI'lerde tespit, periyodik tam frame (DETECT_SCHEDULE=roi)
+        # Keyframe: detector sadece keyframe'lerde, aradaki frame'lerde track'ler Kalman + optik akış ile taşınır
+        self.scheduler = None
+        if config.detect_schedule == "roi":
+            self.scheduler = TrackGuidedScheduler(
+                self.detector,
+                full_frame_interval=config.roi_full_frame_interval,
+                margin=config.roi_margin,
+                roi_size=config.roi_input_size
+            )
+        elif config.detect_schedule == "keyframe":
+            self.scheduler = KeyframeScheduler(
+                self.detector,
+                min_interval=config.keyframe_min_interval,
+                max_interval=config.keyframe_max_interval,
+                residual_threshold=config.keyframe_residual_threshold,
+                use_flow=config.keyframe_optical_flow
+            )
+        self._frame_index = 0
+
+        # Hareket kapısı: gimbal dururken ve track yokken statik sahnede tespit atlanır
+        self.motion_gate = None
+        if config.motion_gate:
+            self.motion_gate = MotionGate(config.motion_gate_max_skip, config.motion_gate_threshold,
+                                          config.motion_gate_grid)
+        self._tracks_active = False
+
+        # QoS: gecikme bütçesi aşılınca kalite seviye seviye düşürülür (0 = tam kalite).
+        # Governor render stage'de karar verir; seviye detect stage'in başında uygulanır
+        # (detector / grabber / zamanlayıcı detect thread'inde kullanılıyor)
+        self._base_scheduler = self.scheduler
+        self._base_input_size = self.detector.input_size
+        self._roi_only_scheduler = None
+        self.overlay_detail = True
+        self._applied_quality_level = 0
+        self._qos_levels = self._build_qos_levels()
+        self.qos = None
+        if config.qos_enabled:
+            self.qos = QosGovernor(
+                [name for name, _ in self._qos_levels],
+                target_latency_ms=config.qos_target_latency_ms,
+                target_fps=config.qos_target_fps,
+                degrade_hold=config.qos_degrade_hold,
+                recover_hold=config.qos_recover_hold
+            )
+            if self.qos.enabled:
+                logger.info(f"🎛️ QoS seviyeleri: {' → '.join(self.qos.levels)}")
+        self.video_display = video_display
+        self.confidence_threshold = confidence_threshold
+        self.motor_controller = motor_controller
+
+        self.camera = None
+        self.cap = None
+        self.grabber = None
+        self.engine = None
+        self.calibration_service = None
+        self.byte_tracker = None
+        self.video_fps = config.camera_fps
+        self.stop_event = None
+        self._detect_latencies = []
+        self._detect_latency_logged = False
+
+        # Distorsiyon düzeltme modu:
+        # frame  - her frame remap edilir, detector düzeltilmiş görüntüde çalışır
+        # points - detector ham frame'de çalışır, sadece kutu geometrisi düzeltilir
+        # off    - düzeltme yok
+        self.undistort_mode = config.undistort_mode
+        self.undistort_display_interval = config.undistort_display_interval
+
+        # Tam frame buffer havuzu - kararlı durumda frame başına büyük allocation yapılmaz
+        self.buffer_pool = FrameBufferPool() if config.frame_buffer_pool else None
+        self.display_size = (1280, 720)
+
+        # Ham MJPEG: detector azaltılmış çözünürlükte decode edilen frame'de çalışır,
+        # ekran için sadece gerektiği kadar büyük decode yapılır
+        self.raw_mjpeg = False
+        self._reductions = {}
+
+        # Tracking history for smoothing
+        self.track_history = {}
+        self.max_history = 10
+
+        # Çıkış FPS ölçümü (render stage)
+        self._last_render_time = None
+        self._output_fps = 0.0
+
+        # Sıcak pipeline durumu - set: tracking aktif, clear: duraklatıldı
+        self._active = threading.Event()
+        self._active.set()
+        self._tracker_reset = False
+
+    def open(self):
+        """Kalibrasyonu yükle, kamerayı aç ve stage'leri hazırla"""
+        logger.info(f"📹 Kamera bağlantısı açılıyor: {self.source}")
+        self.calibration_service = self._load_calibration()
+
+        camera = self._open_capture(self.source)
+        if camera is None:
+            return False
+        self._attach_camera(camera)
+
+        # ByteTracker initialize - IoU çekirdeği (numba JIT) ilk frame'den önce hazırlanır
+        logger.info(f"📐 IoU çekirdeği: {set_iou_backend(config.iou_backend)}")
+        self.byte_tracker = self._create_tracker()
+
+        # Kuyruklarda düşürülen frame'lerin buffer'ları havuza geri verilir
+        self.engine = PipelineEngine(
+            "ByteTrack+ Pipeline",
+            queue_size=config.pipeline_queue_size,
+            drop_policy=config.pipeline_drop_policy,
+            on_drop=FrameContext.release
+        )
+        self.engine.add_stage("capture", self._capture_stage)
+        self.engine.add_stage("preprocess", self._preprocess_stage)
+        self.engine.add_stage("detect", self._detect_stage)
+        self.engine.add_stage("track", self._track_stage)
+        self.engine.add_stage("render", self._render_stage)
+        self.engine.add_stage("publish", self._publish_stage)
+        return True
+
+    def run(self, stop_event):
+        """Pipeline'ı çalıştır - stop_event set edilene veya kaynak bitene kadar bloklar"""
+        self.stop_event = stop_event
+        self.grabber.start()
+        self.engine.start()
+
+        stats_interval = config.pipeline_stats_interval_seconds
+        last_stats_time = time.monotonic()
+        self.engine.get_stats()  # İstatistik penceresini sıfırla
+
+        try:
+            while not stop_event.is_set() and not self.engine.is_finished():
+                stop_event.wait(0.1)
+
+                if stats_interval > 0 and time.monotonic() - last_stats_time >= stats_interval:
+                    last_stats_time = time.monotonic()
+                    logger.info(f"📊 Pipeline: {self.engine.format_stats()}")
+                    if self.scheduler:
+                        logger.info(f"🎯 Tespit planı - {self.scheduler.format_stats()}")
+                    if self.motion_gate:
+                        logger.info(f"💤 Hareket kapısı - {self.motion_gate.format_stats()}")
+                    if self.qos and self.qos.enabled:
+                        logger.info(f"🎛️ QoS seviyesi: {self.qos.describe()}")
+                    if self.tiled:
+                        tile_stats = self.tiled.get_stats()
+                        logger.info(f"🧩 Tiled tespit - {tile_stats['frames']} frame, "
+                                    f"frame başına {tile_stats['views_per_frame']:.1f} görünüm")
+                    if self.buffer_pool:
+                        pool_stats = self.buffer_pool.get_stats()
+                        logger.debug(f"🧮 Frame buffer havuzu - Allocation: {pool_stats['allocations']} "
+                                     f"({pool_stats['allocated_mb']:.1f} MB), Yeniden kullanım: {pool_stats['reuses']}, "
+                                     f"Kullanımda: {pool_stats['in_use']}")
+        finally:
+            self.close()
+
+    def close(self):
+        """Stage'leri durdur ve kamerayı serbest bırak"""
+        if self.engine:
+            self.engine.stop()
+        if self.grabber:
+            self.grabber.stop()
+            grab_stats = self.grabber.get_stats()
+            logger.info(f"📸 Capture istatistikleri - Alınan: {grab_stats['grabbed']}, "
+                        f"Decode edilen: {grab_stats['captured']}, Atlanan: {grab_stats['skipped']}, "
+                        f"İşlenen: {grab_stats['consumed']}, Düşürülen: {grab_stats['dropped']} "
+                        f"(%{grab_stats['drop_ratio'] * 100:.1f})")
+        if self.camera:
+            self.camera.release()
+            self.camera = None
+            self.cap = None
+        if self.buffer_pool:
+            pool_stats = self.buffer_pool.get_stats()
+            logger.info(f"🧮 Frame buffer havuzu - Toplam allocation: {pool_stats['allocations']} "
+                        f"({pool_stats['allocated_mb']:.1f} MB), Yeniden kullanım: {pool_stats['reuses']}")
+        logger.info("🔚 ByteTracker tracking sonlandırıldı")
+        if not self.video_display:
+            cv2.destroyAllWindows()
+
+    def _load_calibration(self):
+        """Kamera kalibrasyonu setup"""
+        if not CALIBRATION_AVAILABLE:
+            return None
+
         calibration_service = CameraCalibrationService()
+        calibration_service.configure_undistortion(
+            map_type=config.undistort_map_type,
+            alpha=config.undistort_alpha,
+            crop=config.undistort_crop
+        )
         # En son kalibrasyon dosyasını otomatik bul ve yükle - önce data klasöründe ara
         calibration_file = find_latest_calibration_file("data") or find_latest_calibration_file(".")
-        if calibration_file:
-            if calibration_service.load_calibration(calibration_file):
-                cal_info = calibration_service.get_calibration_info()
-                if cal_info:
-                    logger.info(f"📷 Kamera kalibrasyonu yüklendi - Error: {cal_info['calibration_error']:.3f}px")
-                    logger.info(f"📷 Kalibrasyon dosyası: {calibration_file}")
-                else:
-                    logger.warning("⚠️ Kalibrasyon bilgisi alınamadı")
-                    calibration_service = None
+        if not calibration_file:
+            logger.info("ℹ️ Kalibrasyon dosyası bulunamadı - ham kamera görüntüsü kullanılacak")
+            return None
+
+        if not calibration_service.load_calibration(calibration_file):
+            logger.warning("⚠️ Kalibrasyon dosyası yüklenemedi")
+            return None
+
+        cal_info = calibration_service.get_calibration_info()
+        if not cal_info:
+            logger.warning("⚠️ Kalibrasyon bilgisi alınamadı")
+            return None
+
+        logger.info(f"📷 Kamera kalibrasyonu yüklendi - Error: {cal_info['calibration_error']:.3f}px")
+        logger.info(f"📷 Kalibrasyon dosyası: {calibration_file}")
+        return calibration_service
+
+    def _open_capture(self, source):
+        """Kamera açma - backend işletim sistemine göre, ayarlar config'den"""
+        if isinstance(source, int):
+            # Arka plan taraması kamerayı zaten açtıysa direkt devral
+            camera = camera_inventory.take_open(source)
+            if camera is not None:
+                return camera
+        camera = CameraSource(source)
+        if not camera.open():
+            return None
+        return camera
+
+    def _attach_camera(self, camera):
+        """Açılmış kamerayı pipeline'a bağla ve capture thread'ini hazırla"""
+        self.camera = camera
+        self.cap = camera.cap
+        self.video_fps = camera.negotiated["fps"] or config.camera_fps
+        logger.info(f"✅ Kamera başarıyla açıldı - FPS: {self.video_fps}")
+
+        self.raw_mjpeg = False
+        self._reductions.clear()
+        if config.mjpeg_raw_decode and camera.is_device and camera.negotiated["fourcc"].upper() == "MJPG":
+            self.raw_mjpeg = enable_raw_mjpeg(self.cap)
+
+        # Ayrı capture thread - her zaman en yeni frame'i tutar (latest-frame-wins).
+        # Inference sürerken gelen eski frame'ler kuyrukta beklemez, düşürülür.
+        # Video dosyaları gerçek zamanlı hızda okunur.
+        self.grabber = LatestFrameGrabber(
+            self.cap,
+            pace_fps=self.video_fps if isinstance(camera.source, str) else None,
+            buffer_pool=self.buffer_pool,
+            target_fps=config.target_processing_fps,
+            raw_mjpeg=self.raw_mjpeg
+        )
+
+    # ------------------------------------------------------------------
+    # QoS kalite seviyeleri
+    # ------------------------------------------------------------------
+
+    # Sadece ROI seviyesinde tam frame aralığı bu kadar uzatılır
+    QOS_ROI_INTERVAL_FACTOR = 3
+
+    def _build_qos_levels(self):
+        """
+        Kalite seviyeleri (ucuzlama sırasıyla): detector giriş boyutu, frame decimation,
+        sadece ROI tespiti, sade overlay. Her seviye öncekilerin ayarlarını korur.
+
+        Returns:
+            list: [(ad, ayarlar), ...] - 0. seviye tam kalite
+        """
+        levels = [("nominal", {})]
+        if self.detector.dynamic_input:
+            for size in sorted(set(config.qos_input_sizes), reverse=True):
+                if size < self._base_input_size:
+                    levels.append((f"imgsz {size}", {"input_size": size}))
+        if 0 < config.qos_decimation_ratio < 1:
+            levels.append((f"decimation x{config.qos_decimation_ratio:g}", {"decimate": True}))
+        # Keyframe planı zaten detector'ü seyrek çalıştırır - ROI'ye geçmek ucuzlatmaz
+        if self.detector.dynamic_input and not isinstance(self._base_scheduler, KeyframeScheduler):
+            levels.append(("sadece ROI", {"roi_only": True}))
+        levels.append(("sade overlay", {"overlay_detail": False}))
+        return levels
+
+    def _sync_quality_level(self):
+        """Detect thread: governor seviyesi değiştiyse ayarlarını uygula"""
+        level = self.qos.level
+        if level != self._applied_quality_level:
+            self._apply_quality_level(level)
+            self._applied_quality_level = level
+
+    def _apply_quality_level(self, level):
+        """Seviyenin ayarlarını uygula - her seferinde baştan hesaplanır (sıra bağımsız)"""
+        settings = {}
+        for _, step in self._qos_levels[:level + 1]:
+            settings.update(step)
+
+        input_size = settings.get("input_size", self._base_input_size)
+        if input_size != self.detector.input_size:
+            self.detector.set_input_size(input_size)
+
+        if self.grabber:
+            self.grabber.set_target_fps(self._decimated_fps() if settings.get("decimate")
+                                        else config.target_processing_fps)
+
+        scheduler = self._get_roi_only_scheduler() if settings.get("roi_only") else self._base_scheduler
+        if scheduler is not self.scheduler:
+            # Diğer zamanlayıcının track bilgisi eski - ilk frame tam tespit
+            if scheduler:
+                scheduler.reset()
+            self.scheduler = scheduler
+
+        self.overlay_detail = settings.get("overlay_detail", True)
+
+    def _decimated_fps(self):
+        """Decimation seviyesinde hedef işleme hızı"""
+        try:
+            base_fps = float(config.target_processing_fps)
+        except ValueError:
+            base_fps = 0.0  # auto - tüketici hızı
+        if base_fps <= 0:
+            base_fps = self.video_fps or config.camera_fps
+        return max(1.0, base_fps * config.qos_decimation_ratio)
+
+    def _get_roi_only_scheduler(self):
+        if self._roi_only_scheduler is None:
+            base_interval = (self._base_scheduler.full_frame_interval
+                             if isinstance(self._base_scheduler, TrackGuidedScheduler)
+                             else config.roi_full_frame_interval)
+            self._roi_only_scheduler = TrackGuidedScheduler(
+                self.detector,
+                full_frame_interval=base_interval * self.QOS_ROI_INTERVAL_FACTOR,
+                margin=config.roi_margin,
+                roi_size=config.roi_input_size
+            )
+        return self._roi_only_scheduler
+
+    def _create_tracker(self):
+        args = Args()
+        args.track_thresh = self.confidence_threshold
+        # soa: tüm track durumu tek dizilerde (yoğun balon alanlarında vektörize güncelleme)
+        tracker_class = SoABYTETracker if config.tracker_core == "soa" else BYTETracker
+        return tracker_class(args, frame_rate=int(self.video_fps))
+
+    # ------------------------------------------------------------------
+    # Sıcak pipeline kontrolü
+    # ------------------------------------------------------------------
+
+    def pause(self):
+        """Tracking'i duraklat - kamera açık kalır, frame'ler decode/yayın edilmez"""
+        self._active.clear()
+        if self.grabber:
+            self.grabber.pause()
+        logger.info("⏸️ Tracking duraklatıldı (kamera ve model sıcak)")
+
+    def resume(self, reset_tracker=True):
+        """
+        Duraklatılmış tracking'i devam ettir
+
+        Args:
+            reset_tracker: Eski track'ler bir sonraki frame'de temizlensin mi
+        """
+        if reset_tracker:
+            self._tracker_reset = True
+            if self.scheduler:
+                self.scheduler.reset()
+        if self.motion_gate:
+            self.motion_gate.reset()
+        if self.qos:
+            # Duraklatma süresi gecikme tahminine girmesin
+            self.qos.reset()
+        if self.grabber:
+            self.grabber.resume()
+        self._active.set()
+        logger.info("▶️ Tracking devam ediyor")
+
+    def is_paused(self):
+        return not self._active.is_set()
+
+    def set_motor_controller(self, motor_controller):
+        self.motor_controller = motor_controller
+
+    def reconfigure(self, confidence_threshold=None, source=None):
+        """
+        Pipeline çalışırken ayar değiştir
+
+        Confidence bir sonraki frame'de uygulanır. Kaynak değişirse sadece kamera
+        yeniden açılır; model, stage thread'leri ve kalibrasyon tabloları korunur.
+
+        Returns:
+            bool: Değişiklik uygulandı mı (yeni kaynak açılamazsa False)
+        """
+        if confidence_threshold is not None and confidence_threshold != self.confidence_threshold:
+            self.confidence_threshold = confidence_threshold
+            logger.info(f"🎚️ Confidence güncellendi: {confidence_threshold}")
+
+        if source is None or source == self.source:
+            return True
+        if self.camera is None:
+            # Henüz açılmadı - open() yeni kaynağı kullanır
+            self.source = source
+            return True
+        return self._switch_source(source)
+
+    def _switch_source(self, source):
+        """Kamerayı değiştir - yeni kaynak açılmadan eskisi kapatılmaz"""
+        logger.info(f"🔀 Kaynak değiştiriliyor: {self.source} → {source}")
+        camera = self._open_capture(source)
+        if camera is None:
+            return False
+
+        was_paused = self.is_paused()
+        self._active.clear()
+        old_camera, old_grabber = self.camera, self.grabber
+        old_grabber.stop()
+        self.source = source
+        self._attach_camera(camera)
+        old_camera.release()
+
+        self._tracker_reset = True
+        if self.scheduler:
+            self.scheduler.reset()
+        if self.motion_gate:
+            self.motion_gate.reset()
+        if self.qos:
+            # Yeni grabber config hızıyla açıldı - mevcut seviye sonraki frame'de yeniden uygulanır
+            self._applied_quality_level = None
+            self.qos.reset()
+        self.grabber.start()
+        if was_paused:
+            self.grabber.pause()
+        else:
+            self._active.set()
+        return True
+
+    # ------------------------------------------------------------------
+    # Pipeline stage'leri
+    # ------------------------------------------------------------------
+
+    def _capture_stage(self):
+        """Grabber'dan en yeni frame'i al"""
+        if not self._active.wait(0.1):
+            return None
+        grabber = self.grabber
+        packet = grabber.read(timeout=0.5)
+        if packet is None:
+            # Kaynak değişimi veya duraklatma sırasında durdurulan grabber akışı bitirmez
+            if grabber is self.grabber and self._active.is_set() and not grabber.is_running():
+                return END_OF_STREAM
+            return None
+        if isinstance(packet.frame, MjpegFrame):
+            return FrameContext(None, packet.seq, packet.timestamp, self.buffer_pool, source=packet.frame)
+        return FrameContext(packet.frame, packet.seq, packet.timestamp, self.buffer_pool)
+
+    def _is_calibrated(self):
+        return self.calibration_service is not None and self.calibration_service.is_calibrated()
+
+    def _preprocess_stage(self, ctx):
+        """Ham MJPEG decode ve kamera kalibrasyonu uygulanması (lens distorsiyonu düzeltme)"""
+        if ctx.source is not None:
+            scale = self._reduction_for(ctx.source.size, "detect")
+            ctx.frame = ctx.source.decode(scale)
+            ctx.scale = scale
+            if ctx.frame is None:
+                logger.debug(f"Bozuk MJPEG frame atlandı: {ctx.seq}")
+                return None
+
+        if self.undistort_mode == "frame" and self._is_calibrated():
+            self._undistort_context_frame(ctx)
+        return ctx
+
+    def _reduction_for(self, full_size, purpose):
+        """
+        Ham MJPEG frame'in detector ('detect') veya ekran ('display') için decode ölçeği
+
+        Ölçek çözünürlük başına bir kez hesaplanır.
+        """
+        key = (full_size, purpose)
+        scale = self._reductions.get(key)
+        if scale is None:
+            if full_size is None:
+                scale = 1
+            elif purpose == "display":
+                scale = choose_reduction(full_size, self.display_size)
+            elif config.mjpeg_detect_scale:
+                scale = config.mjpeg_detect_scale
+            elif self.fovea is not None or self.tiled is not None:
+                # Fovea / tile kırpımları native piksel ister - tam decode
+                scale = 1
             else:
-                logger.warning("⚠️ Kalibrasyon dosyası yüklenemedi")
-                calibration_service = None
+                scale = choose_reduction(full_size, config.mjpeg_detect_min_size)
+            self._reductions[key] = scale
+            logger.info(f"📦 MJPEG {purpose} decode ölçeği: 1/{scale} (kaynak: {full_size})")
+        return scale
+
+    def _undistort_context_frame(self, ctx):
+        """Frame'i havuzdan alınan buffer'a remap et, ham buffer'ı hemen geri ver"""
+        dst = ctx.acquire_buffer(ctx.frame.shape)
+        ctx.replace_frame(self.calibration_service.undistort_frame(ctx.frame, dst=dst, scale=ctx.scale))
+
+    def _detect_stage(self, ctx):
+        """Detection (tracking olmadan, sadece detection) - backend config'e göre"""
+        self._frame_index += 1
+        ctx.frame_index = self._frame_index
+
+        if self.qos:
+            self._sync_quality_level()
+
+        if self.fovea is not None:
+            self.fovea.set_center(*self._fovea_center(ctx))
+
+        if self.motion_gate and not self.motion_gate.should_detect(
+                ctx.frame, force=self._tracks_active or self._gimbal_moving()):
+            # Boşta statik sahne - yeni hedef yok, detector çalıştırılmaz
+            ctx.detections = empty_detections()
+            return ctx
+
+        detect_start = time.perf_counter()
+        scheduler = self.scheduler
+        if scheduler:
+            detections = scheduler.detect(ctx.frame, self.confidence_threshold, ctx.frame_index, ctx.scale)
+            ctx.propagated = scheduler.last_propagated
         else:
-            logger.info("ℹ️ Kalibrasyon dosyası bulunamadı - ham kamera görüntüsü kullanılacak")
-            calibration_service = None
-    
-    # Kamera açma - backend config'e göre
-    if config.use_directshow_backend and isinstance(source, int):
-        cap = cv2.VideoCapture(source, cv2.CAP_DSHOW)
-    else:
-        cap = cv2.VideoCapture(source)
-
-    if not cap.isOpened():
-        logger.warning(f"⚠️ DSHOW backend başarısız, alternatif denenecek: {source}")
-        # DSHOW başarısızsa alternatif dene
-        cap = cv2.VideoCapture(source)
-        if not cap.isOpened():
-            logger.error(f"❌ Kamera açılamadı: {source}")
+            detections = self.detector.detect(ctx.frame, self.confidence_threshold)
+        if not ctx.propagated:
+            self._record_detect_latency((time.perf_counter() - detect_start) * 1000.0)
+        if ctx.scale != 1 and len(detections) > 0:
+            # Azaltılmış decode - kutuları tam çözünürlük koordinatlarına taşı
+            detections[:, :4] *= ctx.scale
+
+        ctx.detections = self._filter_detections(detections)
+
+        # Point-space mod: görüntü yerine sadece kutu köşeleri düzeltilir (tek vektörize çağrı).
+        # Tracker ve motor kontrolü düzeltilmiş piksel koordinatlarında çalışır.
+        # Yayılan track kutuları zaten düzeltilmiş koordinatlardadır.
+        if self.undistort_mode == "points" and not ctx.propagated and len(ctx.detections) > 0 \
+                and self._is_calibrated():
+            frame_w, frame_h = ctx.frame_size
+            ctx.detections[:, :4] = self.calibration_service.undistort_boxes(
+                ctx.detections[:, :4], frame_w, frame_h)
+        return ctx
+
+    def _gimbal_moving(self):
+        """Pan-tilt servoları hareket komutu altında mı"""
+        controller = self.motor_controller
+        if controller is None:
+            return False
+        servo = getattr(controller, "servo_service", None) or controller
+        return bool(getattr(servo, "pan_speed", 0) or getattr(servo, "tilt_speed", 0))
+
+    def _fovea_center(self, ctx):
+        """Motor döngüsünün hedefi tuttuğu nokta (principal point), frame pikselinde"""
+        controller = self.motor_controller
+        if controller is None or not hasattr(controller, "cx_px"):
+            return None, None
+        return controller.cx_px / ctx.scale, controller.cy_px / ctx.scale
+
+    def _record_detect_latency(self, elapsed_ms):
+        """İlk frame ve kararlı durum detect sürelerini bir kez logla (ısınmanın etkisini görmek için)"""
+        if self._detect_latency_logged:
             return
+        self._detect_latencies.append(elapsed_ms)
+        if len(self._detect_latencies) > DETECT_LATENCY_SAMPLES:
+            first = self._detect_latencies[0]
+            steady = float(np.mean(self._detect_latencies[1:]))
+            logger.info(f"⏱️ Detect süresi - ilk frame: {first:.1f} ms, kararlı durum: {steady:.1f} ms")
+            self._detect_latency_logged = True
+            self._detect_latencies = []
 
-    video_fps = cap.get(cv2.CAP_PROP_FPS) or config.camera_fps
-    logger.info(f"✅ Kamera başarıyla açıldı - FPS: {video_fps}")
-    frame_count = 0
-    
-    # ByteTracker initialize
-    args = Args()
-    args.track_thresh = confidence_threshold
-    byte_tracker = BYTETracker(args, frame_rate=int(video_fps))
-    
-    # Frame skipping ve buffering için
-    frame_skip = max(1, int(video_fps / 30))  # 30 FPS'e normalize et
-    
-    # Tracking history for smoothing
-    track_history = {}
-    max_history = 10
-    while not stop_event.is_set():
-        ret, frame = cap.read()
-        if not ret:
-            break
-
-        frame_count += 1
-        
-        # Frame skipping - hızlı hareketlerde daha sık işle
-        if frame_count % frame_skip != 0:
-            continue
+    def _filter_detections(self, detections):
+        """Filtreleme: minimum area ve aspect ratio (çok uzun/ince olmayan nesneler)"""
+        if len(detections) == 0:
+            return np.empty((0, 5))
+        detections = np.asarray(detections, dtype=np.float64)
+        w = detections[:, 2] - detections[:, 0]
+        h = detections[:, 3] - detections[:, 1]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            aspect_ratio = np.where(np.minimum(w, h) > 0, np.maximum(w / h, h / w), np.inf)
+        keep = (w * h >= self.byte_tracker.args.min_box_area) & \
+               (aspect_ratio <= self.byte_tracker.args.aspect_ratio_thresh)
+        return detections[keep]
+
+    def _track_stage(self, ctx):
+        """ByteTracker update ve motor kontrolü için detection listesi hazırla"""
+        frame_w, frame_h = ctx.frame_size
+
+        if self._tracker_reset:
+            # Resume / kaynak değişimi - eski track'ler taşınmaz
+            self._tracker_reset = False
+            self.byte_tracker = self._create_tracker()
+            self.track_history.clear()
+            scheduler = self.scheduler
+            if scheduler:
+                scheduler.reset()
+        elif self.byte_tracker.args.track_thresh != self.confidence_threshold:
+            self.byte_tracker.args.track_thresh = self.confidence_threshold
+            self.byte_tracker.det_thresh = self.confidence_threshold + 0.1
+
+        # ByteTracker için doğru format: img_info = (height, width), img_size = (target_width, target_height)
+        # Scaling'i devre dışı bırakmak için img_size = frame boyutu yapalım (scale 1.0)
+        online_targets = self.byte_tracker.update(ctx.detections, (frame_h, frame_w), (frame_w, frame_h))
 
-        start = time.time()
-        
-        # Kamera kalibrasyonu uygulanması (lens distorsiyonu düzeltme)
-        original_frame = frame.copy()  # Orijinal frame'i sakla
-        if calibration_service and calibration_service.is_calibrated():
-            frame = calibration_service.undistort_frame(frame)
-        
-        # YOLO detection (tracking olmadan, sadece detection)
-        results = model(
-            source=frame,
-            verbose=False,
-            conf=confidence_threshold,
-            save=False,
-            stream=False
-        )[0]
-
-        # YOLO sonuçlarını ByteTracker formatına çevir
-        detections = []
-        if results.boxes is not None:
-            boxes = results.boxes.xyxy.cpu().numpy()  # x1, y1, x2, y2
-            scores = results.boxes.conf.cpu().numpy()
-            
-            # Filtreleme: minimum area ve aspect ratio
-            for i, (box, score) in enumerate(zip(boxes, scores)):
-                x1, y1, x2, y2 = box
-                w, h = x2 - x1, y2 - y1
-                
-                # Minimum alan kontrolü
-                if w * h < byte_tracker.args.min_box_area:
-                    continue
-                    
-                # Aspect ratio kontrolü (çok uzun/ince olmayan nesneler)
-                aspect_ratio = max(w/h, h/w) if min(w, h) > 0 else float('inf')
-                if aspect_ratio > byte_tracker.args.aspect_ratio_thresh:
-                    continue
-                
-                detections.append([x1, y1, x2, y2, score])
-
-        # ByteTracker update - koordinat problemi çözümü
-        if len(detections) > 0:
-            detections = np.array(detections)
-            # ByteTracker için doğru format: img_info = (height, width), img_size = (target_width, target_height)
-            # Scaling'i devre dışı bırakmak için img_size = frame boyutu yapalım
-            img_info = (frame.shape[0], frame.shape[1])  # height, width (orijinal)
-            img_size = (frame.shape[1], frame.shape[0])  # width, height (aynı boyut = scale 1.0)
-            
-            online_targets = byte_tracker.update(detections, img_info, img_size)
-        else:
-            # Boş detection durumunda da tracker'ı güncelle
-            online_targets = byte_tracker.update(np.empty((0, 5)), 
-                                               (frame.shape[0], frame.shape[1]),
-                                               (frame.shape[1], frame.shape[0]))
-
-        # Tracking sonuçlarını çiz ve motor kontrolü için detection listesi hazırla
-        object_count = 0
-        detection_list = []
-        
         for track in online_targets:
             track_id = track.track_id
-            
+
             # ByteTracker koordinatlarını debug et
             tlbr_coords = track.tlbr.astype(int)
             x1, y1, x2, y2 = tlbr_coords
-            
+
             # Koordinatları kontrol et ve düzelt
-            x1 = max(0, min(x1, frame.shape[1]))
-            y1 = max(0, min(y1, frame.shape[0]))
-            x2 = max(0, min(x2, frame.shape[1]))
-            y2 = max(0, min(y2, frame.shape[0]))
-            
+            x1 = max(0, min(x1, frame_w))
+            y1 = max(0, min(y1, frame_h))
+            x2 = max(0, min(x2, frame_w))
+            y2 = max(0, min(y2, frame_h))
+
             # Geçersiz koordinatları atla
             if x2 <= x1 or y2 <= y1:
                 continue
-            
+
             # Balonun mevcut merkezi
             center_x = (x1 + x2) // 2
             center_y = (y1 + y2) // 2
-            
+
             # Tracking history güncelle
-            if track_id not in track_history:
-                track_history[track_id] = []
-            track_history[track_id].append((center_x, center_y))
-            
+            history = self.track_history.setdefault(track_id, [])
+            history.append((center_x, center_y))
+
             # History boyutunu sınırla
-            if len(track_history[track_id]) > max_history:
-                track_history[track_id] = track_history[track_id][-max_history:]
+            if len(history) > self.max_history:
+                del history[:-self.max_history]
 
-            
             # Kalman filter FUTURE prediction - velocity kullanarak gelecek tahmini
             pred_x, pred_y = center_x, center_y  # Varsayılan olarak mevcut merkez
-            
+
             if hasattr(track, 'mean') and track.mean is not None and len(track.mean) >= 6:
                 # Kalman state: [center_x, center_y, aspect_ratio, height, vx, vy, va, vh]
                 current_x = track.mean[0]  # Mevcut x
                 current_y = track.mean[1]  # Mevcut y
                 velocity_x = track.mean[4] if len(track.mean) > 4 else 0  # x hızı
                 velocity_y = track.mean[5] if len(track.mean) > 5 else 0  # y hızı
-                
+
                 # FUTURE prediction = mevcut konum + velocity * 2 (2 frame ahead için daha yakın tahmin)
                 prediction_frames = 2  # 2 frame ileri tahmin
                 future_x = int(current_x + velocity_x * prediction_frames)
                 future_y = int(current_y + velocity_y * prediction_frames)
-                
+
                 # Future prediction'ı makul sınırlar içindeyse kullan
-                if (0 <= future_x < frame.shape[1] and 
-                    0 <= future_y < frame.shape[0]):
+                if 0 <= future_x < frame_w and 0 <= future_y < frame_h:
                     pred_x, pred_y = future_x, future_y
                 else:
                     # Sınır dışındaysa daha kısa prediction yaparak hesapla
                     pred_x = int(current_x + velocity_x * 1.0)  # 1.0 frame ahead
                     pred_y = int(current_y + velocity_y * 1.0)  # 1.0 frame ahead
-                    pred_x = max(0, min(pred_x, frame.shape[1] - 1))
-                    pred_y = max(0, min(pred_y, frame.shape[0] - 1))
-            
+                    pred_x = max(0, min(pred_x, frame_w - 1))
+                    pred_y = max(0, min(pred_y, frame_h - 1))
+
             # Kalite skoru göster
+            score = track.score if hasattr(track, 'score') else 0.8
             score_text = f"S:{track.score:.2f}" if hasattr(track, 'score') else ""
             label_text = f"ID:{track_id} {score_text}"
-            
-            draw_annotations(frame, x1, y1, x2, y2, track_id, pred_x, pred_y, label_text)
-            object_count += 1
-            
+
+            # Trajectory (son 5 point) render stage'de çizilir
+            ctx.tracks.append((x1, y1, x2, y2, track_id, pred_x, pred_y, label_text, history[-5:]))
+
             # Motor kontrol sistemi için detection ekle
-            detection_list.append([x1, y1, x2 - x1, y2 - y1, track.score if hasattr(track, 'score') else 0.8, 
-                                 pred_x, pred_y, track_id])
-            
-            # Trajectory çiz (son 5 point) - daha ince çizgi
-            if len(track_history[track_id]) > 1:
-                points = track_history[track_id][-5:]
-                for i in range(1, len(points)):
-                    cv2.line(frame, points[i-1], points[i], (0, 200, 0), 1)  # Daha ince (1 pixel) ve daha koyu yeşil
-
-        end = time.time()
-        frame_time = end - start
-        fps = 1 / frame_time if frame_time > 0 else 0
+            ctx.detection_list.append([x1, y1, x2 - x1, y2 - y1, score, pred_x, pred_y, track_id])
 
         # Tracking bilgileri
-        tracked_count = len([t for t in byte_tracker.tracked_stracks if t.is_activated])
-        lost_count = len(byte_tracker.lost_stracks)
-        
+        ctx.tracked_count = len([t for t in self.byte_tracker.tracked_stracks if t.is_activated])
+        ctx.lost_count = len(self.byte_tracker.lost_stracks)
+        self._tracks_active = ctx.tracked_count + ctx.lost_count > 0
+
+        scheduler = self.scheduler
+        if scheduler:
+            # Sonraki frame'lerin ROI'leri / yayılımı için track'lerin Kalman state'leri.
+            # Onaysız (yeni) track'ler de verilir - ROI / keyframe olmadan hiç onaylanamazlar
+            tracked = [t for t in self.byte_tracker.tracked_stracks if t.mean is not None]
+            confirmed = [t for t in tracked if t.is_activated]
+            scheduler.update_tracks([t.mean for t in confirmed], ctx.frame_index, ctx.lost_count,
+                                    scores=[t.score for t in confirmed],
+                                    tentative_means=[t.mean for t in tracked if not t.is_activated])
+
+        # Motor kontrol sistemi güncelleme - render beklemeden
+        if self.motor_controller and ctx.detection_list:
+            try:
+                self.motor_controller.set_detections(ctx.detection_list)
+            except Exception as e:
+                logger.debug(f"Motor controller güncelleme hatası: {e}")
+
+        return ctx
+
+    def _render_stage(self, ctx):
+        """Tracking sonuçlarını ve overlay bilgisini çiz"""
+        tracks = ctx.tracks
+        undistort_display = False
+
+        if self.undistort_mode == "points" and self._is_calibrated():
+            if self.undistort_display_interval > 0:
+                # Düzeltilmiş görüntü düşük hızda gösterilir, aradaki frame'ler yayınlanmaz
+                if ctx.seq % self.undistort_display_interval != 0:
+                    return None
+                undistort_display = True
+            else:
+                # Ham görüntü gösterilir - çizimleri ham koordinatlara taşı
+                tracks = self._tracks_to_raw_coords(ctx)
+
+        frame, scale = self._render_source_frame(ctx, undistort_display)
+        if scale != 1:
+            tracks = _scale_tracks(tracks, 1.0 / scale)
+
+        for x1, y1, x2, y2, track_id, pred_x, pred_y, label_text, points in tracks:
+            if not self.overlay_detail:
+                # QoS sade overlay - sadece kutu
+                cv2.rectangle(frame, (x1, y1), (x2, y2), (0, 255, 0), 2)
+                continue
+            draw_annotations(frame, x1, y1, x2, y2, track_id, pred_x, pred_y, label_text)
+
+            # Trajectory çiz - daha ince çizgi
+            for i in range(1, len(points)):
+                cv2.line(frame, points[i-1], points[i], (0, 200, 0), 1)  # Daha ince (1 pixel) ve daha koyu yeşil
+
+        # Çıkış FPS'i ve uçtan uca gecikme (capture → render)
+        now = time.monotonic()
+        if self._last_render_time is not None:
+            interval = now - self._last_render_time
+            if interval > 0:
+                instant_fps = 1.0 / interval
+                self._output_fps = instant_fps if self._output_fps == 0 else self._output_fps * 0.9 + instant_fps * 0.1
+        self._last_render_time = now
+        latency_ms = (now - ctx.timestamp) * 1000.0
+        if self.qos:
+            self.qos.observe(latency_ms / 1000.0, self._output_fps or None, now)
+
         # Kalibrasyon durumu için algo_name'e ekle
-        algo_name = f"ByteTrack+ (T:{tracked_count} L:{lost_count})"
-        if calibration_service and calibration_service.is_calibrated():
-            cal_error = calibration_service.calibration_error
-            algo_name += f" [CAL:{cal_error:.2f}px]"
+        algo_name = f"ByteTrack+ (T:{ctx.tracked_count} L:{ctx.lost_count})"
+        if self._is_calibrated() and self.undistort_mode != "off":
+            cal_error = self.calibration_service.calibration_error
+            mode_tag = "CAL-P" if self.undistort_mode == "points" else "CAL"
+            algo_name += f" [{mode_tag}:{cal_error:.2f}px]"
         else:
             algo_name += " [RAW]"
-        
+        if self.qos and self.qos.level > 0:
+            algo_name += f" [Q{self.qos.level}]"
+
         draw_overlay_info(
-            frame, fps, frame_time * 1000, object_count,
+            frame, self._output_fps, latency_ms, len(ctx.tracks),
             algo_name=algo_name,
-            frame_number=frame_count
+            frame_number=ctx.seq
         )
-        
-        # Motor kontrol sistemi güncelleme
-        if motor_controller and detection_list:
-            try:
-                motor_controller.set_detections(detection_list)
-            except Exception as e:
-                logger.debug(f"Motor controller güncelleme hatası: {e}")
 
-        resized_frame = cv2.resize(frame, (1280, 720))
+        display_w, display_h = self.display_size
+        dst = ctx.acquire_buffer((display_h, display_w) + frame.shape[2:])
+        ctx.display_frame = cv2.resize(frame, self.display_size, dst=dst)
+        return ctx
+
+    def _render_source_frame(self, ctx, undistort_display):
+        """
+        Çizim yapılacak görüntüyü ve tam çözünürlüğe göre ölçeğini döndür
 
-        if video_display:
-            video_display.update_frame(resized_frame)
-            if isinstance(source, str):
-                QThread.msleep(int(1000 / video_fps / frame_skip))
+        Ham MJPEG'de ekran için detector frame'i yetmiyorsa sadece ekranın
+        ihtiyacı kadar büyük bir decode yapılır.
+        """
+        frame_undistorted = self.undistort_mode == "frame" and self._is_calibrated()
+        scale = ctx.scale
+        if ctx.source is not None:
+            scale = self._reduction_for(ctx.source.size, "display")
+
+        if scale == ctx.scale:
+            if undistort_display:
+                self._undistort_context_frame(ctx)
+            return ctx.frame, scale
+
+        frame = ctx.source.decode(scale)
+        if frame is None:
+            return ctx.frame, ctx.scale
+        if undistort_display or frame_undistorted:
+            dst = ctx.acquire_buffer(frame.shape)
+            frame = self.calibration_service.undistort_frame(frame, dst=dst, scale=scale)
+        return frame, scale
+
+    def _tracks_to_raw_coords(self, ctx):
+        """Düzeltilmiş koordinatlardaki track çizimlerini ham görüntü koordinatlarına dönüştür"""
+        if not ctx.tracks:
+            return ctx.tracks
+
+        frame_w, frame_h = ctx.frame_size
+        service = self.calibration_service
+
+        boxes = np.array([t[:4] for t in ctx.tracks], dtype=np.float64)
+        raw_boxes = np.round(service.distort_boxes(boxes, frame_w, frame_h)).astype(int)
+
+        # Tahmin noktaları ve trajectory noktaları tek çağrıda dönüştürülür
+        points = [(t[5], t[6]) for t in ctx.tracks]
+        for t in ctx.tracks:
+            points.extend(t[8])
+        raw_points = [tuple(p) for p in np.round(service.distort_points(points, frame_w, frame_h)).astype(int)]
+
+        raw_tracks = []
+        offset = len(ctx.tracks)
+        for i, (x1, y1, x2, y2, track_id, pred_x, pred_y, label_text, trail) in enumerate(ctx.tracks):
+            rx1, ry1, rx2, ry2 = raw_boxes[i]
+            pred_x, pred_y = raw_points[i]
+            raw_trail = raw_points[offset:offset + len(trail)]
+            offset += len(trail)
+            raw_tracks.append((rx1, ry1, rx2, ry2, track_id, pred_x, pred_y, label_text, raw_trail))
+        return raw_tracks
+
+    def _publish_stage(self, ctx):
+        """Görüntüyü GUI'ye veya OpenCV penceresine gönder"""
+        if not self._active.is_set():
+            return None  # Duraklatıldıktan sonra yoldaki frame'ler gösterilmez
+        if self.video_display:
+            self.video_display.update_frame(ctx.display_frame)
         else:
-            cv2.imshow("Balon Takibi - ByteTrack+", resized_frame)
+            cv2.imshow("Balon Takibi - ByteTrack+", ctx.display_frame)
             if cv2.waitKey(1) & 0xFF == ord('q'):
-                break
+                if self.stop_event:
+                    self.stop_event.set()
+        return None
+
 
-    cap.release()
-    logger.info("🔚 ByteTracker tracking sonlandırıldı")
-    if not video_display:
-        cv2.destroyAllWindows() 
\ No newline at end of file
+def _scale_tracks(tracks, factor):
+    """Track çizim tuple'larını (kutu, tahmin ve trajectory) verilen oranla ölçekle"""
+    scaled = []
+    for x1, y1, x2, y2, track_id, pred_x, pred_y, label_text, points in tracks:
+        scaled.append((
+            int(x1 * factor), int(y1 * factor), int(x2 * factor), int(y2 * factor), track_id,
+            int(pred_x * factor), int(pred_y * factor), label_text,
+            [(int(px * factor), int(py * factor)) for px, py in points]
+        ))
+    return scaled
@@ -8,18 +8,19 @@ import sys
 import os
 import cv2
 import time
-from ultralytics import YOLO
+from src.core.detectors.detector_factory import create_detector
 
 from src.interfaces.video_widget import VideoWidget
 from src.interfaces.teknofest_sidebar import LogSidebar, MenuSidebar, IconThemeManager
 from src.interfaces.teknofest_camera_view import TeknoFestCameraView
 from src.core.controller.main_controller import MainController
+from src.core.capture.camera_inventory import camera_inventory
 from src.utils.config import config
 from src.utils.logger import logger
 
 
 class ModelLoader(QThread):
-    """YOLO model'ini arka planda yükleyen thread"""
+    """Detector'ü (config'teki backend ile) arka planda yükleyen thread"""
     model_loaded = pyqtSignal(object)
     progress_update = pyqtSignal(str)
     
@@ -31,9 +32,19 @@ class ModelLoader(QThread):
         try:
             logger.info(f"🤖 Model yükleme başlatıldı: {self.model_path}")
             self.progress_update.emit("Model yükleniyor...")
-            model = YOLO(self.model_path)
+            load_start = time.perf_counter()
+            model = create_detector(self.model_path)
+            logger.info(f"✅ Model yüklendi: {model.describe()} ({(time.perf_counter() - load_start) * 1000:.0f} ms)")
+
+            if config.model_warmup_iterations > 0:
+                # Fuse, bellek ayırma ve kernel seçimi ilk gerçek frame yerine burada ödenir
+                self.progress_update.emit("Model ısınıyor...")
+                timings = model.warmup(config.model_warmup_iterations,
+                                       shape=(config.camera_height, config.camera_width, 3))
+                steady = sum(timings[1:]) / len(timings[1:]) if len(timings) > 1 else timings[0]
+                logger.info(f"🔥 Model ısındı ({config.camera_width}x{config.camera_height}) - "
+                            f"ilk inference: {timings[0]:.1f} ms, kararlı durum: {steady:.1f} ms")
             self.progress_update.emit("Model hazır!")
-            logger.info("✅ Model başarıyla yüklendi")
             self.model_loaded.emit(model)
         except Exception as e:
             error_msg = f"Model yükleme hatası: {e}"
@@ -42,6 +53,24 @@ class ModelLoader(QThread):
             self.model_loaded.emit(None)
 
 
+class CameraScanner(QThread):
+    """Kameraları arka planda paralel tarayan thread"""
+    cameras_found = pyqtSignal(list)
+    
+    def __init__(self, max_devices=3, in_use=()):
+        super().__init__()
+        self.max_devices = max_devices
+        self.in_use = tuple(in_use)
+        
+    def run(self):
+        try:
+            cameras = camera_inventory.scan(self.max_devices, in_use=self.in_use)
+        except Exception as e:
+            logger.error(f"❌ Kamera tarama hatası: {e}")
+            cameras = []
+        self.cameras_found.emit(cameras)
+
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -297,7 +326,7 @@ class MainWindow(QMainWindow):
         
         # 2. Video tracking'i durdur  
         if self.controller:
-            self.controller.stop_video()
+            self.controller.stop_video(keep_warm=False)
         
         # 3. UI'ı güncelle
         self.camera_view.show_emergency_stop()
@@ -333,22 +362,29 @@ class MainWindow(QMainWindow):
     def refresh_camera_list(self, max_devices=3):
         logger.info("📷 Kamera listesi yenileniyor")
         
-        # Create temporary camera list for selection
-        self.available_cameras = []
-        camera_count = 0
-        
-        for i in range(max_devices):
-            try:
-                cap = cv2.VideoCapture(i, cv2.CAP_DSHOW)
-                if cap.isOpened():
-                    ret, _ = cap.read()
-                    if ret:
-                        self.available_cameras.append(i)
-                        camera_count += 1
-                        logger.info(f"✅ Kamera {i} bulundu")
-                    cap.release()
-            except Exception as e:
-                logger.debug(f"Kamera {i} kontrol hatası: {e}")
+        # Son bilinen envanter anında gösterilir, doğrulama arka planda yapılır
+        if not getattr(self, 'available_cameras', None):
+            self.available_cameras = camera_inventory.get_indices()
+            if self.available_cameras:
+                logger.info(f"📷 Kayıtlı kameralar: {self.available_cameras} (arka planda doğrulanıyor)")
+                self.camera_view.show_message(f"Hazır - {len(self.available_cameras)} kamera (doğrulanıyor)",
+                                              QColor(76, 175, 80), 2000)
+        
+        if getattr(self, 'camera_scanner', None) and self.camera_scanner.isRunning():
+            return
+        
+        # Tracking'in kullandığı kamera yeniden açılmaz
+        in_use = []
+        if self.controller and self.controller.pipeline is not None:
+            in_use.append(self.controller.pipeline.source)
+        self.camera_scanner = CameraScanner(max_devices, in_use)
+        self.camera_scanner.cameras_found.connect(self.on_cameras_found)
+        self.camera_scanner.start()
+    
+    def on_cameras_found(self, cameras):
+        """Arka plan kamera taraması bitti"""
+        self.available_cameras = cameras
+        camera_count = len(cameras)
         
         if camera_count == 0:
             logger.warning("❌ Hiç kamera bulunamadı")
@@ -493,7 +529,8 @@ class MainWindow(QMainWindow):
     def closeEvent(self, event):
         logger.info("🚪 Uygulama kapatılıyor")
         if hasattr(self, 'controller'):
-            self.controller.stop_video()
+            self.controller.stop_video(keep_warm=False)
+        camera_inventory.release_all()
         event.accept()
 
     def keyPressEvent(self, event):
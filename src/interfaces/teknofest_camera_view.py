@@ -9,10 +9,14 @@ Adapted from Teknofest project for Balon Takip system.
 """
 
 import cv2
+import numpy as np
 from PyQt5.QtWidgets import QWidget
 from PyQt5.QtCore import Qt, QSize, QRect, QTimer
 from PyQt5.QtGui import QPixmap, QImage, QPainter, QColor, QFont, QPen, QBrush
 
+# QImage.Format_BGR888 Qt 5.14 ile geldi
+HAS_BGR888 = hasattr(QImage, 'Format_BGR888')
+
 class TeknoFestCameraView(QWidget):
     """
     Advanced camera view component for Balon Takip system.
@@ -40,6 +44,9 @@ class TeknoFestCameraView(QWidget):
         # Tracking info
         self.tracking_info = None
         
+        # BGR→RGB dönüşümü için yeniden kullanılan buffer (Format_BGR888 yoksa)
+        self._rgb_buffer = None
+        
     def update_frame(self, frame_data):
         """Update the displayed frame with a new QImage or OpenCV frame."""
         # Skip frame updates if in emergency mode
@@ -60,10 +67,16 @@ class TeknoFestCameraView(QWidget):
             try:
                 height, width = frame_data.shape[:2]
                 if len(frame_data.shape) == 3:
-                    # Color image - convert BGR to RGB
-                    rgb_frame = cv2.cvtColor(frame_data, cv2.COLOR_BGR2RGB)
                     bytes_per_line = 3 * width
-                    q_image = QImage(rgb_frame.data, width, height, bytes_per_line, QImage.Format_RGB888)
+                    if HAS_BGR888:
+                        # Qt 5.14+: BGR verisi doğrudan kullanılır, renk dönüşümü ve kopya yok
+                        q_image = QImage(frame_data.data, width, height, bytes_per_line, QImage.Format_BGR888)
+                    else:
+                        # Color image - convert BGR to RGB (yeniden kullanılan buffer'a)
+                        if self._rgb_buffer is None or self._rgb_buffer.shape != frame_data.shape:
+                            self._rgb_buffer = np.empty_like(frame_data)
+                        rgb_frame = cv2.cvtColor(frame_data, cv2.COLOR_BGR2RGB, dst=self._rgb_buffer)
+                        q_image = QImage(rgb_frame.data, width, height, bytes_per_line, QImage.Format_RGB888)
                 else:
                     # Grayscale image
                     bytes_per_line = width
@@ -38,6 +38,16 @@ class CameraCalibrationService:
         self.dist_coeffs = None
         self.calibration_error = None
         
+        # Undistortion remap ayarları
+        # map_type: "fixed" (CV_16SC2, daha hızlı) veya "float32" (CV_32FC1, daha hassas)
+        # alpha: None = orijinal kamera matrisi, 0..1 = getOptimalNewCameraMatrix free scaling
+        # crop: alpha kullanılırken geçerli piksel bölgesine (ROI) kırp
+        self.undistort_map_type = "fixed"
+        self.undistort_alpha = None
+        self.undistort_crop = False
+        self._remap_cache = {}  # (width, height) -> (map1, map2, new_camera_matrix, roi)
+        self._new_camera_cache = {}  # (width, height, scale) -> (new_camera_matrix, roi) - haritasız
+        
         # Logger
         self.logger = logging.getLogger(__name__)
         
@@ -68,6 +78,10 @@ class CameraCalibrationService:
             else:
                 self.logger.error(f"Desteklenmeyen dosya formatı: {calibration_file}")
                 return False
+            
+            # Yeni kalibrasyon - eski remap tabloları geçersiz
+            self._remap_cache.clear()
+            self._new_camera_cache.clear()
                 
             self.logger.info(f"Kalibrasyon dosyası yüklendi: {calibration_file}")
             self.logger.info(f"Reprojection Error: {self.calibration_error:.3f} piksel")
@@ -77,12 +91,129 @@ class CameraCalibrationService:
             self.logger.error(f"Kalibrasyon dosyası yüklenemedi: {e}")
             return False
     
-    def undistort_frame(self, frame):
+    def configure_undistortion(self, map_type="fixed", alpha=None, crop=False):
+        """
+        Undistortion remap ayarlarını değiştir
+        
+        Args:
+            map_type: "fixed" (CV_16SC2 sabit noktalı harita) veya "float32"
+            alpha: getOptimalNewCameraMatrix free scaling (0 = sadece geçerli pikseller,
+                   1 = tüm kaynak pikseller). None ise orijinal kamera matrisi kullanılır
+            crop: alpha ile hesaplanan geçerli bölgeye (ROI) kırp
+        """
+        if map_type not in ("fixed", "float32"):
+            self.logger.warning(f"Bilinmeyen remap tipi: {map_type}, 'fixed' kullanılacak")
+            map_type = "fixed"
+        
+        self.undistort_map_type = map_type
+        self.undistort_alpha = alpha
+        self.undistort_crop = crop
+        self._remap_cache.clear()
+        self._new_camera_cache.clear()
+    
+    def get_remap_tables(self, width, height, scale=1):
+        """
+        Verilen çözünürlük için undistortion remap tablolarını döndür
+        
+        Tablolar (çözünürlük, ölçek, kalibrasyon) başına bir kez hesaplanır ve saklanır.
+        
+        Args:
+            width: Görüntü genişliği
+            height: Görüntü yüksekliği
+            scale: Görüntü kalibrasyon çözünürlüğünün 1/scale'i ise (ör. azaltılmış MJPEG decode)
+            
+        Returns:
+            (map1, map2, new_camera_matrix, roi) veya None (kalibrasyon yoksa)
+        """
+        if not self.is_calibrated():
+            return None
+        
+        key = (width, height, scale)
+        tables = self._remap_cache.get(key)
+        if tables is not None:
+            return tables
+        
+        camera_matrix = self.get_scaled_camera_matrix(scale)
+        new_camera_matrix, roi = self.get_new_camera_matrix(width, height, scale)
+        
+        m1type = cv2.CV_16SC2 if self.undistort_map_type == "fixed" else cv2.CV_32FC1
+        map1, map2 = cv2.initUndistortRectifyMap(
+            camera_matrix, self.dist_coeffs, None, new_camera_matrix, (width, height), m1type)
+        
+        tables = (map1, map2, new_camera_matrix, roi)
+        self._remap_cache[key] = tables
+        self.logger.info(f"Undistortion remap tabloları hazırlandı: {width}x{height} ({self.undistort_map_type})")
+        return tables
+    
+    def get_scaled_camera_matrix(self, scale=1):
+        """
+        1/scale çözünürlükteki görüntü için kamera matrisini döndür
+        
+        Odak uzaklıkları ve optik merkez ölçekle birlikte küçülür; distorsiyon
+        katsayıları normalize koordinatlarda tanımlı olduğu için değişmez.
+        """
+        if scale == 1:
+            return self.camera_matrix
+        camera_matrix = np.array(self.camera_matrix, dtype=np.float64)
+        camera_matrix[:2, :] /= scale
+        return camera_matrix
+    
+    def get_new_camera_matrix(self, width, height, scale=1):
+        """
+        Düzeltilmiş görüntünün kamera matrisi ve geçerli bölgesi (remap tabloları kurulmadan)
+        
+        Çözünürlük / ölçek başına bir kez hesaplanır; points modu tam frame
+        haritalarına ihtiyaç duymadan bunu kullanır.
+        
+        Returns:
+            (3x3 kamera matrisi, (x, y, w, h) ROI) veya None (kalibrasyon yoksa)
+        """
+        if not self.is_calibrated():
+            return None
+        
+        key = (width, height, scale)
+        cached = self._new_camera_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        camera_matrix = self.get_scaled_camera_matrix(scale)
+        if self.undistort_alpha is not None:
+            new_camera_matrix, roi = cv2.getOptimalNewCameraMatrix(
+                camera_matrix, self.dist_coeffs, (width, height), self.undistort_alpha, (width, height))
+        else:
+            new_camera_matrix, roi = camera_matrix, (0, 0, width, height)
+        
+        cached = (np.asarray(new_camera_matrix, dtype=np.float64), tuple(int(v) for v in roi))
+        self._new_camera_cache[key] = cached
+        return cached
+    
+    def get_undistorted_camera_matrix(self, width, height):
+        """
+        Düzeltilmiş görüntünün kamera matrisini döndür (alpha kullanılıyorsa değişir)
+        
+        Returns:
+            3x3 kamera matrisi veya None
+        """
+        result = self.get_new_camera_matrix(width, height)
+        return result[0] if result is not None else None
+    
+    def _crop_offset(self, roi):
+        """undistort_frame kırpım yapıyorsa ROI'nin sol üst köşesi, yoksa (0, 0)"""
+        if self.undistort_crop and self.undistort_alpha is not None and roi[2] > 0 and roi[3] > 0:
+            return roi[0], roi[1]
+        return 0, 0
+    
+    def undistort_frame(self, frame, dst=None, scale=1):
         """
         Kalibrasyon parametrelerini kullanarak görüntü distorsiyonunu düzelt
         
+        Önceden hesaplanmış remap tabloları kullanılır; cv2.undistort her çağrıda
+        tüm distorsiyon haritasını yeniden hesapladığı için kullanılmaz.
+        
         Args:
             frame: OpenCV görüntü (BGR)
+            dst: Opsiyonel çıkış buffer'ı (frame ile aynı boyut ve tipte)
+            scale: Frame kalibrasyon çözünürlüğünün 1/scale'i ise ölçek
             
         Returns:
             Düzeltilmiş görüntü veya orijinal görüntü (kalibrasyon yoksa)
@@ -91,13 +222,120 @@ class CameraCalibrationService:
             return frame
             
         try:
-            # type: ignore yapıyoruz OpenCV type annotation sorunları için
-            undistorted = cv2.undistort(frame, self.camera_matrix, self.dist_coeffs)  # type: ignore
+            height, width = frame.shape[:2]
+            map1, map2, _, roi = self.get_remap_tables(width, height, scale)
+            undistorted = cv2.remap(frame, map1, map2, cv2.INTER_LINEAR, dst=dst)
+            
+            if self.undistort_crop and self.undistort_alpha is not None:
+                x, y, w, h = roi
+                if w > 0 and h > 0:
+                    undistorted = undistorted[y:y + h, x:x + w]
             return undistorted
         except Exception as e:
             self.logger.error(f"Distorsiyon düzeltme hatası: {e}")
             return frame
     
+    def undistort_points(self, points, width, height):
+        """
+        Ham görüntüdeki piksel noktalarını düzeltilmiş piksel koordinatlarına dönüştür
+        
+        Tüm noktalar tek bir cv2.undistortPoints çağrısıyla işlenir. Sonuç,
+        undistort_frame çıktısıyla aynı koordinat sistemindedir (UNDISTORT_CROP
+        açıksa kırpım ROI'sine göre).
+        
+        Args:
+            points: Nx2 piksel koordinatları (ham görüntü)
+            width: Görüntü genişliği
+            height: Görüntü yüksekliği
+            
+        Returns:
+            Nx2 düzeltilmiş piksel koordinatları (kalibrasyon yoksa girişin kopyası)
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        if not self.is_calibrated() or len(points) == 0:
+            return points.copy()
+        
+        new_camera_matrix, roi = self.get_new_camera_matrix(width, height)
+        undistorted = cv2.undistortPoints(
+            points.reshape(-1, 1, 2), self.camera_matrix, self.dist_coeffs, P=new_camera_matrix).reshape(-1, 2)
+        offset_x, offset_y = self._crop_offset(roi)
+        if offset_x or offset_y:
+            undistorted -= (offset_x, offset_y)
+        return undistorted
+    
+    def distort_points(self, points, width, height):
+        """
+        Düzeltilmiş piksel koordinatlarını ham görüntü koordinatlarına geri dönüştür
+        
+        Ham görüntü üzerine çizim yapmak için undistort_points'in tersi (UNDISTORT_CROP
+        açıksa girişler kırpım ROI'sine göredir).
+        
+        Args:
+            points: Nx2 düzeltilmiş piksel koordinatları
+            width: Görüntü genişliği
+            height: Görüntü yüksekliği
+            
+        Returns:
+            Nx2 ham görüntü piksel koordinatları
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        if not self.is_calibrated() or len(points) == 0:
+            return points.copy()
+        
+        new_camera_matrix, roi = self.get_new_camera_matrix(width, height)
+        offset_x, offset_y = self._crop_offset(roi)
+        fx, fy = new_camera_matrix[0, 0], new_camera_matrix[1, 1]
+        cx, cy = new_camera_matrix[0, 2], new_camera_matrix[1, 2]
+        
+        # Normalize edilmiş kamera koordinatları (z = 1)
+        object_points = np.empty((len(points), 1, 3), dtype=np.float64)
+        object_points[:, 0, 0] = (points[:, 0] + offset_x - cx) / fx
+        object_points[:, 0, 1] = (points[:, 1] + offset_y - cy) / fy
+        object_points[:, 0, 2] = 1.0
+        
+        zero = np.zeros(3, dtype=np.float64)
+        distorted, _ = cv2.projectPoints(object_points, zero, zero, self.camera_matrix, self.dist_coeffs)
+        return distorted.reshape(-1, 2)
+    
+    def undistort_boxes(self, boxes, width, height):
+        """
+        Bounding box'ları (x1, y1, x2, y2) düzeltilmiş koordinatlara dönüştür
+        
+        Her kutunun 4 köşesi düzeltilir ve köşeleri çevreleyen kutu döndürülür.
+        Tüm kutular tek çağrıda (vektörize) işlenir.
+        
+        Args:
+            boxes: Nx4 [x1, y1, x2, y2] ham görüntü koordinatları
+            width: Görüntü genişliği
+            height: Görüntü yüksekliği
+            
+        Returns:
+            Nx4 düzeltilmiş [x1, y1, x2, y2]
+        """
+        boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+        if not self.is_calibrated() or len(boxes) == 0:
+            return boxes.copy()
+        
+        corners = self.undistort_points(_box_corners(boxes), width, height).reshape(-1, 4, 2)
+        return np.concatenate([corners.min(axis=1), corners.max(axis=1)], axis=1)
+    
+    def distort_boxes(self, boxes, width, height):
+        """
+        Düzeltilmiş koordinatlardaki kutuları ham görüntü koordinatlarına dönüştür
+        
+        Args:
+            boxes: Nx4 [x1, y1, x2, y2] düzeltilmiş koordinatlar
+            
+        Returns:
+            Nx4 ham görüntü [x1, y1, x2, y2]
+        """
+        boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+        if not self.is_calibrated() or len(boxes) == 0:
+            return boxes.copy()
+        
+        corners = self.distort_points(_box_corners(boxes), width, height).reshape(-1, 4, 2)
+        return np.concatenate([corners.min(axis=1), corners.max(axis=1)], axis=1)
+    
     def pixel_to_world_coordinates(self, pixel_coords, z_distance=1.0):
         """
         Piksel koordinatlarını dünya koordinatlarına dönüştür
@@ -219,6 +457,17 @@ class CameraCalibrationService:
             'square_size_mm': self.square_size_mm
         }
 
+def _box_corners(boxes):
+    """Nx4 [x1, y1, x2, y2] kutularının köşelerini (N*4)x2 olarak döndür"""
+    x1, y1, x2, y2 = boxes[:, 0], boxes[:, 1], boxes[:, 2], boxes[:, 3]
+    corners = np.stack([
+        np.stack([x1, y1], axis=1),
+        np.stack([x2, y1], axis=1),
+        np.stack([x2, y2], axis=1),
+        np.stack([x1, y2], axis=1),
+    ], axis=1)
+    return corners.reshape(-1, 2)
+
 def find_latest_calibration_file(search_dir="."):
     """
     En son oluşturulan kalibrasyon dosyasını bul
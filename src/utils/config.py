@@ -59,6 +59,15 @@ class Config:
         
         # Kamera hızlı başlatma ayarları
         self.use_directshow_backend = os.getenv('USE_DIRECTSHOW_BACKEND', 'True').lower() in ('true', '1', 't')
+        # Kamera backend'i: auto (Linux: V4L2, Windows: DSHOW/MSMF, macOS: AVFoundation), v4l2, dshow, msmf, any
+        self.camera_backend = os.getenv('CAMERA_BACKEND', 'auto').strip().lower()
+        # İstenen format/çözünürlük/fps uygulanamazsa desteklenen modları logla
+        self.camera_probe_on_mismatch = os.getenv('CAMERA_PROBE_ON_MISMATCH', 'True').lower() in ('true', '1', 't')
+        # Kamera envanteri: son bulunan kameralar diske yazılır, açılışta anında gösterilir
+        self.camera_inventory_file = os.getenv('CAMERA_INVENTORY_FILE', os.path.join(DEFAULT_DATA_DIR, 'camera_inventory.json'))
+        self.camera_inventory_probe_modes = os.getenv('CAMERA_INVENTORY_PROBE_MODES', 'True').lower() in ('true', '1', 't')
+        # Taramada bulunan ilk kamerayı açık tut - tracking başlatılınca direkt devralınır
+        self.camera_keep_probed_open = os.getenv('CAMERA_KEEP_PROBED_OPEN', 'False').lower() in ('true', '1', 't')
         self.camera_buffer_size = int(os.getenv('CAMERA_BUFFER_SIZE', 1))
         self.disable_auto_settings_on_startup = os.getenv('DISABLE_AUTO_SETTINGS_ON_STARTUP', 'True').lower() in ('true', '1', 't')
         
@@ -67,10 +76,32 @@ class Config:
         self.camera_fourcc = os.getenv('CAMERA_FOURCC', 'MJPG')
         self.reduce_processing_delay = os.getenv('REDUCE_PROCESSING_DELAY', 'True').lower() in ('true', '1', 't')
         
+        # Frame decimation: sadece bu hızda decode et, diğer frame'ler grab() ile atlanır
+        # 0 = kapalı (her frame decode edilir), auto = tracking döngüsünün gerçek hızı
+        self.target_processing_fps = os.getenv('TARGET_PROCESSING_FPS', '30').strip().lower()
+        
+        # Ham MJPEG yakalama: kamera JPEG'i decode etmeden verir, detector için
+        # azaltılmış çözünürlükte (1/2, 1/4, 1/8) decode edilir
+        self.mjpeg_raw_decode = os.getenv('MJPEG_RAW_DECODE', 'False').lower() in ('true', '1', 't')
+        # Detector decode ölçeği: auto = uzun kenar MJPEG_DETECT_MIN_SIZE'ın altına düşmeyecek en küçük decode
+        mjpeg_detect_scale = os.getenv('MJPEG_DETECT_SCALE', 'auto').strip().lower()
+        self.mjpeg_detect_scale = None if mjpeg_detect_scale in ('', 'auto') else int(mjpeg_detect_scale)
+        self.mjpeg_detect_min_size = int(os.getenv('MJPEG_DETECT_MIN_SIZE', 640))
+        
         # Kamera başlatma timeout ayarları
         self.camera_init_timeout_seconds = float(os.getenv('CAMERA_INIT_TIMEOUT_SECONDS', 30.0))
         self.camera_open_check_timeout_seconds = float(os.getenv('CAMERA_OPEN_CHECK_TIMEOUT_SECONDS', 10.0))
         
+        # Lens distorsiyonu düzeltme
+        # frame: her frame remap edilir, points: YOLO ham frame'de çalışır ve sadece kutular düzeltilir, off: kapalı
+        self.undistort_mode = os.getenv('UNDISTORT_MODE', 'frame').lower()
+        # points modunda düzeltilmiş görüntüyü her N frame'de bir göster (0 = ham görüntü göster)
+        self.undistort_display_interval = int(os.getenv('UNDISTORT_DISPLAY_INTERVAL', 0))
+        self.undistort_map_type = os.getenv('UNDISTORT_MAP_TYPE', 'fixed').lower()  # fixed (CV_16SC2) veya float32
+        undistort_alpha = os.getenv('UNDISTORT_ALPHA', '').strip()
+        self.undistort_alpha = float(undistort_alpha) if undistort_alpha else None  # None = orijinal kamera matrisi
+        self.undistort_crop = os.getenv('UNDISTORT_CROP', 'False').lower() in ('true', '1', 't')
+        
         # Camera intrinsic parameters (for tracking calculations)
         self.camera_fx = float(os.getenv('CAMERA_FX', 500.0))  # Focal length X (pixels)
         self.camera_fy = float(os.getenv('CAMERA_FY', 500.0))  # Focal length Y (pixels) 
@@ -103,11 +134,79 @@ class Config:
         self.balloon_model = os.getenv('BALLOON_MODEL', 'yolov8n.pt')
         self.balloon_model_custom = os.getenv('BALLOON_MODEL_CUSTOM', 'bests_balloon_30_dark.pt')
         
+        # Detector backend'i: torch (ultralytics predictor), torch_direct (doğrudan forward,
+        # dikdörtgen letterbox - isteğe bağlı, stok predictor çıktısıyla karşılaştırılarak açılmalı),
+        # onnxruntime (CPU), openvino (CPU)
+        # ONNX / OpenVINO modelleri bir kez export edilir ve <model_dir>/exports altında saklanır
+        self.detector_backend = os.getenv('DETECTOR_BACKEND', 'torch').lower()
+        self.detector_input_size = int(os.getenv('DETECTOR_INPUT_SIZE', 640))
+        self.detector_iou_threshold = float(os.getenv('DETECTOR_IOU_THRESHOLD', 0.7))  # NMS IoU (ultralytics varsayılanı)
+        self.detector_threads = int(os.getenv('DETECTOR_THREADS', 0))  # CPU backend thread sayısı (0 = otomatik)
+        # Açılışta kamera çözünürlüğünde ısınma inference sayısı (0 = kapalı)
+        self.model_warmup_iterations = int(os.getenv('MODEL_WARMUP_ITERATIONS', 3))
+        # torch_direct: fuse edilmiş ağı <model_dir>/exports altında sakla (model hash + torch sürümü ile)
+        self.model_fused_cache = os.getenv('MODEL_FUSED_CACHE', 'True').lower() in ('true', '1', 't')
+        # INT8 CPU inference (onnxruntime statik quantization): auto = USE_GPU kapalıysa veya CUDA yoksa.
+        # Sadece önceden üretilmiş model kullanılır (benchmarks/eval_int8.py --build-only)
+        self.detector_int8 = os.getenv('DETECTOR_INT8', 'auto').lower()
+        # Kalibrasyon için kayıtlı görüntüler (resim / video klasörü) ve örneklenecek frame sayısı
+        self.int8_calibration_dir = os.getenv('INT8_CALIBRATION_DIR', os.path.join(DEFAULT_DATA_DIR, 'recordings'))
+        self.int8_calibration_frames = int(os.getenv('INT8_CALIBRATION_FRAMES', 200))
+
+        # Tespit planı: full (her frame tam tespit), roi (onaylı track'lerin tahmini konumları
+        # etrafındaki kırpımlarda tespit, her N frame'de ve track kaybolunca tam frame) veya
+        # keyframe (detector sadece keyframe'lerde, arada track'ler Kalman + optik akış ile taşınır)
+        self.detect_schedule = os.getenv('DETECT_SCHEDULE', 'full').lower()
+        self.roi_full_frame_interval = int(os.getenv('ROI_FULL_FRAME_INTERVAL', 10))
+        self.roi_margin = float(os.getenv('ROI_MARGIN', 1.0))  # Kutunun her yanına eklenen pay (kutu boyutu oranı)
+        self.roi_input_size = int(os.getenv('ROI_INPUT_SIZE', 256))  # ROI kırpımlarının model giriş boyutu
+        # Keyframe aralığı uyarlanır: akış/Kalman farkı büyürse veya track kaybolursa yarıya iner,
+        # kararlı döngülerde birer artar
+        self.keyframe_min_interval = int(os.getenv('KEYFRAME_MIN_INTERVAL', 2))
+        self.keyframe_max_interval = int(os.getenv('KEYFRAME_MAX_INTERVAL', 8))
+        self.keyframe_residual_threshold = float(os.getenv('KEYFRAME_RESIDUAL_THRESHOLD', 0.15))  # Kutu boyutu oranı
+        self.keyframe_optical_flow = os.getenv('KEYFRAME_OPTICAL_FLOW', 'True').lower() in ('true', '1', 't')
+
+        # Fovea modu: tam frame küçültülerek + merkezde (motorun hedef noktası) native çözünürlükte
+        # kırpım, tek batch'te çalıştırılır. Ham MJPEG'de detector için tam decode gerektirir.
+        self.detector_fovea = os.getenv('DETECTOR_FOVEA', 'False').lower() in ('true', '1', 't')
+        self.detector_fovea_size = int(os.getenv('DETECTOR_FOVEA_SIZE', 640))  # Merkez kırpım kenarı (piksel)
+
+        # Tiled tespit: yüksek çözünürlükte uzak (küçük) balonlar için örtüşen native tile'lar tek
+        # batch'te + isteğe bağlı kaba tam frame görünümü. Maliyet açılışta tek geçişe oranla loglanır.
+        self.detector_tiling = os.getenv('DETECTOR_TILING', 'False').lower() in ('true', '1', 't')
+        self.detector_tile_size = int(os.getenv('DETECTOR_TILE_SIZE', 640))
+        self.detector_tile_overlap = float(os.getenv('DETECTOR_TILE_OVERLAP', 0.2))  # Komşu tile örtüşme oranı
+        self.detector_tile_coarse = os.getenv('DETECTOR_TILE_COARSE', 'True').lower() in ('true', '1', 't')
+
+        # Hareket kapısı: gimbal dururken ve aktif track yokken küçültülmüş frame farkı ile sahne
+        # değişimi aranır; değişim yoksa tespit atlanır (en fazla MAX_SKIP frame art arda)
+        self.motion_gate = os.getenv('MOTION_GATE', 'False').lower() in ('true', '1', 't')
+        self.motion_gate_max_skip = int(os.getenv('MOTION_GATE_MAX_SKIP', 15))
+        self.motion_gate_threshold = float(os.getenv('MOTION_GATE_THRESHOLD', 8.0))  # Hücre ortalama farkı (gri seviye)
+        self.motion_gate_grid = int(os.getenv('MOTION_GATE_GRID', 8))  # Kenar başına hücre sayısı
+
+        # QoS: gecikme / FPS bütçesi aşılınca sırayla kalite düşürülür - detector giriş boyutu,
+        # frame decimation, sadece ROI tespiti, sade overlay. Bütçe rahatça karşılanınca geri alınır.
+        self.qos_enabled = os.getenv('QOS_ENABLED', 'False').lower() in ('true', '1', 't')
+        self.qos_target_latency_ms = float(os.getenv('QOS_TARGET_LATENCY_MS', 120))  # 0 = kullanılmaz
+        self.qos_target_fps = float(os.getenv('QOS_TARGET_FPS', 0))  # Minimum çıkış FPS'i, 0 = kullanılmaz
+        self.qos_input_sizes = [int(v) for v in os.getenv('QOS_INPUT_SIZES', '512,416').split(',') if v.strip()]
+        self.qos_decimation_ratio = float(os.getenv('QOS_DECIMATION_RATIO', 0.66))  # İşleme hızı çarpanı
+        self.qos_degrade_hold = float(os.getenv('QOS_DEGRADE_HOLD_SECONDS', 2.0))
+        self.qos_recover_hold = float(os.getenv('QOS_RECOVER_HOLD_SECONDS', 6.0))
+        
         # ByteTracker ayarları
         self.track_thresh = float(os.getenv('TRACK_THRESH', 0.5))
         self.track_buffer = int(os.getenv('TRACK_BUFFER', 30))
         self.match_thresh = float(os.getenv('MATCH_THRESH', 0.8))
+        # Eşleştirmede Kalman tahmininden %95 ki-kare Mahalanobis mesafesinin dışındaki çiftler elenir
+        self.track_motion_gating = os.getenv('TRACK_MOTION_GATING', 'False').lower() in ('true', '1', 't')
         self.frame_rate = int(os.getenv('FRAME_RATE', 30))
+        # Tracker çekirdeği: object (STrack nesneleri, varsayılan) veya soa (track durumu tek dizilerde, döngüsüz güncelleme)
+        self.tracker_core = os.getenv('TRACKER_CORE', 'object').lower()
+        # Eşleştirme IoU çekirdeği: auto (numba kuruluysa JIT, değilse NumPy), numba veya numpy
+        self.iou_backend = os.getenv('IOU_BACKEND', 'auto').lower()
         
         # Performance optimization settings
         self.enable_periodic_cleanup = os.getenv('ENABLE_PERIODIC_CLEANUP', 'True').lower() in ('true', '1', 't')
@@ -123,6 +222,16 @@ class Config:
         self.min_tracking_sleep_ms = float(os.getenv('MIN_TRACKING_SLEEP_MS', 5.0))
         self.max_tracking_sleep_ms = float(os.getenv('MAX_TRACKING_SLEEP_MS', 50.0))
         
+        # Tracking pipeline settings (stage'ler arası sınırlı kuyruklar)
+        self.pipeline_queue_size = int(os.getenv('PIPELINE_QUEUE_SIZE', 2))
+        self.pipeline_drop_policy = os.getenv('PIPELINE_DROP_POLICY', 'drop_oldest').lower()  # block, drop_oldest, drop_newest
+        self.pipeline_stats_interval_seconds = float(os.getenv('PIPELINE_STATS_INTERVAL_SECONDS', 10.0))
+        # Tracking durdurulunca pipeline'ı kapatma, duraklat (kamera/model/kalibrasyon sıcak kalır)
+        self.keep_pipeline_warm = os.getenv('KEEP_PIPELINE_WARM', 'False').lower() in ('true', '1', 't')
+        
+        # Tam frame buffer'larını havuzdan yeniden kullan (cap.read(image=...), dst= çıktıları)
+        self.frame_buffer_pool = os.getenv('FRAME_BUFFER_POOL', 'True').lower() in ('true', '1', 't')
+        
         # Memory management settings
         self.enable_aggressive_cleanup = os.getenv('ENABLE_AGGRESSIVE_CLEANUP', 'True').lower() in ('true', '1', 't')
         self.max_error_history = int(os.getenv('MAX_ERROR_HISTORY', 100))
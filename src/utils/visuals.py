@@ -72,9 +72,9 @@ def draw_overlay_info(frame, fps, ms, object_count, algo_name="", id_switches=No
     y_pos = 10
     
     # Yarı şeffaf arkaplan - daha estetik
-    overlay = frame.copy()
-    cv2.rectangle(overlay, (x_pos, y_pos), (x_pos + bg_width, y_pos + bg_height), (0, 0, 0), -1)
-    cv2.addWeighted(overlay, 0.7, frame, 0.3, 0, frame)
+    # Siyah kutu %70 opak: sadece kutu bölgesi yerinde karartılır (tam frame kopyası yok)
+    roi = frame[y_pos:y_pos + bg_height + 1, x_pos:x_pos + bg_width + 1]
+    cv2.addWeighted(roi, 0.3, roi, 0, 0, dst=roi)
     
     # İnce beyaz çerçeve
     cv2.rectangle(frame, (x_pos, y_pos), (x_pos + bg_width, y_pos + bg_height), (255, 255, 255), 1)